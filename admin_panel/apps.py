@@ -3,3 +3,9 @@ from django.apps import AppConfig
 
 class AdminPanelConfig(AppConfig):
     name = 'admin_panel'
+
+    def ready(self):
+        from . import checks, signals  # noqa: F401
+        from .storage import register_image_fields
+
+        register_image_fields()
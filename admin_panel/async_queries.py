@@ -0,0 +1,45 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.shortcuts import render
+
+
+# Threads (and so database connections) per process for concurrent reads.
+# With DB_CONN_MODE=pool keep this at or below DB_POOL_MAX_SIZE.
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'ASYNC_QUERY_WORKERS', 8),
+    thread_name_prefix='async-query',
+)
+
+
+def _run(query):
+    # The same connection housekeeping Django does around a request, so
+    # these long-lived threads honour CONN_MAX_AGE and return pooled
+    # connections.
+    close_old_connections()
+    try:
+        return query() if callable(query) else list(query)
+    finally:
+        close_old_connections()
+
+
+async def gather_queries(*queries):
+    """
+    Run independent ORM reads at the same time and return their results in
+    order. Pass querysets (evaluated to lists) or zero-argument callables
+    such as ``qs.count``.
+
+    Django's async ORM methods (aget, acount, ``async for``) all run on one
+    shared thread, so gathering them still executes the SQL one query after
+    another. Here each query gets a thread of its own, and with it its own
+    connection, so the wait is close to the slowest query.
+    """
+    run = sync_to_async(_run, thread_sensitive=False, executor=_executor)
+    return await asyncio.gather(*(run(query) for query in queries))
+
+
+# Rendering reads the lazy navbar context, so it runs on the sync thread.
+render_async = sync_to_async(render)
@@ -0,0 +1,204 @@
+import time
+from datetime import date, timedelta
+
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+
+from . import urls
+from .cache import bump_content_version, invalidate_page_cache
+from .metrics import CaptureAllQueries
+from .models import (
+    AlumniEvent, AlumniProfile, Category, ContactMessage, Course, DashboardStats, DonationDetails, GalleryImage,
+    ManagementTeam, News, StudentRegistration, Testimonial,
+)
+
+
+# Rows seeded per model unless overridden with --volume name=count.
+DEFAULT_VOLUMES = {
+    'news': 10000,
+    'gallery': 100000,
+    'donations': 50000,
+    'categories': 20,
+    'courses': 50,
+    'team': 20,
+    'testimonials': 50,
+    'messages': 1000,
+    'students': 1000,
+    'alumni': 200,
+    'events': 100,
+}
+
+SEED_BATCH_SIZE = 2000
+
+# Routes that change state on GET.
+SKIP_ROUTES = {'logout'}
+
+# URL kwarg lookups: route name -> model whose first row fills the kwargs.
+ROUTE_OBJECTS = {
+    'course_detail': Course,
+    'news_detail': News,
+    'service_detail': Course,
+    'team_edit': ManagementTeam,
+    'course_edit': Course,
+    'news_edit': News,
+    'update_category': Category,
+    'donation_edit': DonationDetails,
+    'message_view': ContactMessage,
+    'testimonial_edit': Testimonial,
+    'alumni_edit': AlumniProfile,
+    'alumni_event_edit': AlumniEvent,
+}
+
+
+def _news(i, now):
+    return News(
+        title=f'Bench news {i}', slug=f'bench-news-{i}', content=f'Seeded article {i} about campus events. ' * 20,
+        image='news/bench.jpg', published_date=now - timedelta(minutes=i),
+    )
+
+
+def _gallery(i, now, categories):
+    return GalleryImage(category=categories[i % len(categories)], title=f'Bench image {i}', image=f'gallery/bench-{i}.jpg')
+
+
+# name -> (model, row factory). Factories get (index, now) or (index, now, categories).
+SEEDERS = {
+    'categories': (Category, lambda i, now: Category(name=f'Bench category {i}')),
+    'courses': (Course, lambda i, now: Course(
+        title=f'Bench course {i}', slug=f'bench-course-{i}', description='Seeded course. ' * 30, duration='1 year',
+        thumbnail='courses/bench.jpg',
+    )),
+    'news': (News, _news),
+    'gallery': (GalleryImage, _gallery),
+    # The edit forms read photo.url unconditionally, so photo-less rows
+    # would benchmark those routes as 500s.
+    'team': (ManagementTeam, lambda i, now: ManagementTeam(
+        name=f'Bench member {i}', position='Staff', photo='team/bench.jpg',
+    )),
+    'testimonials': (Testimonial, lambda i, now: Testimonial(
+        name=f'Bench parent {i}', designation='Parent', content='Seeded testimonial. ' * 5,
+        photo='testimonials/bench.jpg',
+    )),
+    'donations': (DonationDetails, lambda i, now: DonationDetails(
+        donor_name=f'Bench donor {i}', payment_method='UPI', transaction_id=f'TXN{i:08d}',
+    )),
+    'messages': (ContactMessage, lambda i, now: ContactMessage(
+        name=f'Bench visitor {i}', email=f'visitor{i}@example.com', subject='Admission', message='Seeded message.',
+    )),
+    'students': (StudentRegistration, lambda i, now: StudentRegistration(
+        first_name='Bench', last_name=f'Student {i}', dob=date(2008, 1, 1), email=f'student{i}@example.com',
+        mobile='9999999999', program_name='BA English',
+    )),
+    'alumni': (AlumniProfile, lambda i, now: AlumniProfile(
+        name=f'Bench alumnus {i}', photo='alumni/photos/bench.jpg', description='Seeded alumnus.',
+    )),
+    'events': (AlumniEvent, lambda i, now: AlumniEvent(
+        event_name=f'Bench event {i}', image='alumni/events/bench.jpg', date=date(2024, 1, 1), description='Seeded.',
+    )),
+}
+
+
+def seed_volumes(volumes, batch_size=SEED_BATCH_SIZE, log=None):
+    """
+    Top each model up to the requested row count with bulk_create. Existing
+    rows count towards the target, so re-running against a kept database
+    only inserts the difference.
+    """
+    now = timezone.now()
+    categories = None
+    for name, (model, factory) in SEEDERS.items():
+        target = volumes.get(name, 0)
+        start = model.objects.count()
+        if name == 'gallery':
+            categories = list(Category.objects.all()) or [Category.objects.create(name='Bench category 0')]
+        for offset in range(start, target, batch_size):
+            indexes = range(offset, min(offset + batch_size, target))
+            if name == 'gallery':
+                rows = [factory(i, now, categories) for i in indexes]
+            else:
+                rows = [factory(i, now) for i in indexes]
+            model.objects.bulk_create(rows)
+        if log and target > start:
+            log(f'Seeded {target - start} {name}')
+        bump_content_version(model)
+
+    # bulk_create skips the signals that keep these in step.
+    DashboardStats.objects.all().delete()
+    DashboardStats.load()
+    invalidate_page_cache()
+
+
+def route_targets():
+    """Return [(name, path)] for every GET-safe route in admin_panel/urls.py."""
+    targets = []
+    seen = set()
+    for pattern in urls.urlpatterns:
+        if not isinstance(pattern, URLPattern) or not pattern.name:
+            continue
+        name = pattern.name
+        if name in SKIP_ROUTES or 'delete' in name:
+            continue
+        kwargs = {}
+        converters = getattr(pattern.pattern, 'converters', {})
+        if converters:
+            obj = ROUTE_OBJECTS[name].objects.order_by('pk').first()
+            if obj is None:
+                continue
+            kwargs = {key: obj.slug if key == 'slug' else obj.pk for key in converters}
+        path = reverse(f'{urls.app_name}:{name}', kwargs=kwargs)
+        if path in seen:
+            continue
+        seen.add(path)
+        targets.append((name, path))
+    return targets
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def _get(client, path):
+    response = client.get(path)
+    if response.streaming:
+        body = b''.join(response.streaming_content)
+    else:
+        body = response.content
+    return response, len(body)
+
+
+def measure(anonymous, staff, path, iterations, warmup=1, before_request=None):
+    """
+    Request ``path`` ``warmup + iterations`` times and summarise the timed
+    runs. Routes that redirect anonymous users to the login page are
+    measured with the signed-in ``staff`` client.
+    """
+    client = anonymous
+    response = anonymous.get(path)
+    if response.status_code == 302 and response['Location'].startswith(reverse(f'{urls.app_name}:login')):
+        client = staff
+
+    timings, queries = [], []
+    for run in range(warmup + iterations):
+        if before_request:
+            before_request()
+        with CaptureAllQueries() as captured:
+            started = time.perf_counter()
+            response, size = _get(client, path)
+            elapsed = time.perf_counter() - started
+        if run >= warmup:
+            timings.append(elapsed * 1000)
+            queries.append(len(captured))
+
+    return {
+        'path': path,
+        'status': response.status_code,
+        'authenticated': client is staff,
+        'p50_ms': round(percentile(timings, 50), 2),
+        'p95_ms': round(percentile(timings, 95), 2),
+        'mean_ms': round(sum(timings) / len(timings), 2),
+        'queries': max(queries),
+        'bytes': size,
+    }
@@ -0,0 +1,188 @@
+import hashlib
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.core.cache import cache
+from django.core.cache.backends.base import BaseCache
+from django.http import HttpResponse
+from django.utils import timezone
+
+from .metrics import record_cache
+
+
+PAGE_CACHE_TIMEOUT = 60 * 60 * 24
+PAGE_CACHE_GENERATION_KEY = 'page_cache:generation'
+PAGE_CACHE_HITS_KEY = 'page_cache:hits'
+PAGE_CACHE_MISSES_KEY = 'page_cache:misses'
+CONTENT_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _counter_seed():
+    # A counter that was evicted or expired starts again from the clock, not
+    # from 1, so it never repeats a value that old cache entries are keyed on.
+    return time.time_ns() // 1_000_000
+
+
+def _incr(key):
+    cache.add(key, _counter_seed(), None)
+    try:
+        value = cache.incr(key)
+    except ValueError:
+        # Key was evicted between add() and incr().
+        value = _counter_seed()
+        cache.set(key, value, None)
+        return value
+    if cache.incr.__func__ is BaseCache.incr:
+        # The generic incr() (database, file cache) is a get + set that
+        # re-stores the key with the default 300 s timeout.
+        cache.touch(key, None)
+    return value
+
+
+# ==================== CONTENT VERSIONS ====================
+
+def _content_version_key(model):
+    return f'content_version:{model._meta.label_lower}'
+
+
+def _content_changed_key(model):
+    return f'content_changed:{model._meta.label_lower}'
+
+
+def content_version(*models):
+    """
+    Return the current version of each model's content as a key fragment,
+    e.g. "3.7" for (Course, News).
+    """
+    keys = [_content_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _counter_seed(), None)
+            versions[key] = cache.get(key) or _counter_seed()
+    return '.'.join(str(versions[key]) for key in keys)
+
+
+def content_changed_at(*models):
+    """
+    Latest time any of the models' content changed. When the cache has no
+    record (cold start, eviction) "now" is recorded, which errs on the side
+    of treating the content as new.
+    """
+    keys = [_content_changed_key(model) for model in models]
+    changed = cache.get_many(keys)
+    for key in keys:
+        if key not in changed:
+            cache.add(key, timezone.now(), None)
+            changed[key] = cache.get(key) or timezone.now()
+    return max(changed.values())
+
+
+def bump_content_version(model):
+    _incr(_content_version_key(model))
+    cache.set(_content_changed_key(model), timezone.now(), None)
+
+
+# ==================== PUBLIC PAGE CACHE ====================
+
+def page_cache_generation():
+    generation = cache.get(PAGE_CACHE_GENERATION_KEY)
+    if generation is None:
+        cache.add(PAGE_CACHE_GENERATION_KEY, _counter_seed(), None)
+        generation = cache.get(PAGE_CACHE_GENERATION_KEY) or _counter_seed()
+    return generation
+
+
+def invalidate_page_cache():
+    """
+    Drop every cached public page by moving to a new generation.
+    Old entries are never read again and expire on their own.
+    """
+    _incr(PAGE_CACHE_GENERATION_KEY)
+
+
+def page_cache_key(request):
+    path = hashlib.md5(request.get_full_path().encode('utf-8')).hexdigest()
+    return f'page_cache:{page_cache_generation()}:{path}'
+
+
+def is_cacheable_request(request, user=None):
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    if (user or request.user).is_authenticated:
+        return False
+    # A pending flash message would be baked into the page for everyone.
+    if 'messages' in request.COOKIES:
+        return False
+    return True
+
+
+def page_cache_stats():
+    hits = cache.get(PAGE_CACHE_HITS_KEY, 0)
+    misses = cache.get(PAGE_CACHE_MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': hits / total if total else 0.0,
+        'generation': page_cache_generation(),
+    }
+
+
+def reset_page_cache_stats():
+    cache.delete_many([PAGE_CACHE_HITS_KEY, PAGE_CACHE_MISSES_KEY])
+
+
+def _cached_page(request):
+    """Return (cache key, cached HttpResponse or None)."""
+    key = page_cache_key(request)
+    cached = cache.get(key)
+    if cached is None:
+        _incr(PAGE_CACHE_MISSES_KEY)
+        record_cache(False)
+        return key, None
+    _incr(PAGE_CACHE_HITS_KEY)
+    record_cache(True)
+    content, content_type = cached
+    response = HttpResponse(content, content_type=content_type)
+    response['X-Page-Cache'] = 'HIT'
+    return key, response
+
+
+def _store_page(key, response):
+    if response.status_code == 200 and not response.streaming:
+        cache.set(key, (response.content, response['Content-Type']), PAGE_CACHE_TIMEOUT)
+    response['X-Page-Cache'] = 'MISS'
+    return response
+
+
+def cache_public_page(view_func):
+    """
+    Cache the rendered page for anonymous visitors, keyed per URL.
+    Content changes invalidate it through the signals in signals.py.
+    Works on sync and async views.
+    """
+    if iscoroutinefunction(view_func):
+        @wraps(view_func)
+        async def _async_wrapped(request, *args, **kwargs):
+            if not is_cacheable_request(request, await request.auser()):
+                return await view_func(request, *args, **kwargs)
+            key, response = await sync_to_async(_cached_page)(request)
+            if response is not None:
+                return response
+            response = await view_func(request, *args, **kwargs)
+            return await sync_to_async(_store_page)(key, response)
+
+        return _async_wrapped
+
+    @wraps(view_func)
+    def _wrapped(request, *args, **kwargs):
+        if not is_cacheable_request(request):
+            return view_func(request, *args, **kwargs)
+        key, response = _cached_page(request)
+        if response is not None:
+            return response
+        return _store_page(key, view_func(request, *args, **kwargs))
+
+    return _wrapped
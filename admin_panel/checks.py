@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestFilesMixin
+from django.core.checks import Error, Tags, register
+from django.core.files.storage import storages
+
+
+# Backends whose data lives inside one process.
+PROCESS_LOCAL_CACHES = {'django.core.cache.backends.locmem.LocMemCache'}
+
+
+def cache_is_shared(alias='default'):
+    """
+    False for a per-process backend outside DEBUG. Django cannot tell how
+    many workers the server will fork (gunicorn --workers, uWSGI processes),
+    so any deployed LocMemCache counts as unshared.
+    """
+    return settings.DEBUG or settings.CACHES[alias]['BACKEND'] not in PROCESS_LOCAL_CACHES
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    The page cache generation, content versions and request metrics all live
+    in the default cache. With a per-process backend each worker sees its
+    own copy, so a save in one worker leaves the others serving stale pages.
+    """
+    return [
+        Error(
+            f'CACHES[{alias!r}] uses {config["BACKEND"]}, which is not shared between '
+            f'worker processes.',
+            hint='Set DJANGO_CACHE_BACKEND to a shared backend such as Redis (see deploy/gunicorn_asgi.py).',
+            id='admin_panel.E001',
+        )
+        for alias, config in settings.CACHES.items()
+        if not cache_is_shared(alias)
+    ]
+
+
+@register()
+def check_static_manifest(app_configs, **kwargs):
+    """
+    The manifest storage resolves every {% static %} name through
+    staticfiles.json. Without it (collectstatic never ran) each name is
+    hashed from the unhashed copy in STATIC_ROOT, and the hashed URL 404s,
+    so refuse to start instead. Not tagged staticfiles: collectstatic runs
+    those checks, and it is what writes the manifest.
+    """
+    if settings.DEBUG:
+        return []
+    storage = storages['staticfiles']
+    if not isinstance(storage, ManifestFilesMixin) or storage.exists(storage.manifest_name):
+        return []
+    return [
+        Error(
+            f'{storage.path(storage.manifest_name)} is missing, so static file URLs cannot be resolved.',
+            hint='Run "python manage.py collectstatic" as part of the deploy.',
+            id='admin_panel.E002',
+        )
+    ]
@@ -0,0 +1,93 @@
+import hashlib
+from datetime import datetime, timezone as dt_timezone
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.db.models import Max
+from django.views.decorators.http import condition
+
+from .cache import content_changed_at, content_version
+from .models import AlumniEvent, AlumniProfile, Category, Course, GalleryImage, ManagementTeam, News
+
+
+# Every public page renders the navbar (courses and news).
+NAVBAR_MODELS = (Course, News)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def conditional_page(models, timestamp):
+    """
+    Answer If-None-Match / If-Modified-Since with a 304 before the view runs.
+
+    ``timestamp(request, *args, **kwargs)`` returns the newest timestamp of the
+    rows shown on the page, or None when the object does not exist (the view
+    then runs and returns its 404). The validators combine that timestamp
+    with the content versions of ``models``, so edits, deletes and sidebar
+    changes all produce a new ETag.
+    """
+    models = tuple(NAVBAR_MODELS) + tuple(m for m in models if m not in NAVBAR_MODELS)
+
+    def _state(request, *args, **kwargs):
+        if not hasattr(request, '_conditional_state'):
+            stamp = timestamp(request, *args, **kwargs)
+            request._conditional_state = (
+                stamp,
+                content_version(*models) if stamp else None,
+                content_changed_at(*models) if stamp else None,
+            )
+        return request._conditional_state
+
+    def etag(request, *args, **kwargs):
+        stamp, version, _ = _state(request, *args, **kwargs)
+        if stamp is None:
+            return None
+        raw = f'{request.get_full_path()}|{stamp.isoformat()}|{version}'
+        return hashlib.md5(raw.encode()).hexdigest()
+
+    def last_modified(request, *args, **kwargs):
+        stamp, _, changed = _state(request, *args, **kwargs)
+        if stamp is None:
+            return None
+        return max(stamp, changed)
+
+    decorator = condition(etag_func=etag, last_modified_func=last_modified)
+
+    def wrap(view_func):
+        conditional_view = decorator(view_func)
+        if not iscoroutinefunction(view_func):
+            return conditional_view
+
+        @wraps(view_func)
+        async def _wrapped(request, *args, **kwargs):
+            # condition() calls the validators synchronously; run the queries
+            # off the event loop first so they only read the memoized state.
+            await sync_to_async(_state)(request, *args, **kwargs)
+            return await conditional_view(request, *args, **kwargs)
+
+        return _wrapped
+
+    return wrap
+
+
+def _object_timestamp(model, field):
+    def timestamp(request, slug):
+        return model.objects.filter(slug=slug).values_list(field, flat=True).first()
+    return timestamp
+
+
+def _latest_timestamp(model, field, **filters):
+    def timestamp(request, *args, **kwargs):
+        # Empty tables still get a validator; the content version covers them.
+        return model.objects.filter(**filters).aggregate(latest=Max(field))['latest'] or _EPOCH
+    return timestamp
+
+
+news_detail_condition = conditional_page((News, Category), _object_timestamp(News, 'updated_at'))
+course_detail_condition = conditional_page((Course,), _object_timestamp(Course, 'created_at'))
+
+blog_condition = conditional_page((News,), _latest_timestamp(News, 'updated_at', is_published=True))
+courses_condition = conditional_page((Course,), _latest_timestamp(Course, 'created_at', is_active=True))
+gallery_condition = conditional_page((GalleryImage, Category), _latest_timestamp(GalleryImage, 'uploaded_at'))
+team_condition = conditional_page((ManagementTeam,), _latest_timestamp(ManagementTeam, 'created_at'))
+alumni_condition = conditional_page((AlumniProfile, AlumniEvent), _latest_timestamp(AlumniProfile, 'created_at'))
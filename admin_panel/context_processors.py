@@ -1,10 +1,28 @@
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
+
+from .cache import CONTENT_CACHE_TIMEOUT, content_version
+from .metrics import record_cache
 from .models import Course, News
 
+
+def _navbar_data():
+    key = f'navbar:{content_version(Course, News)}'
+    data = cache.get(key)
+    record_cache(data is not None)
+    if data is None:
+        data = {
+            'courses': list(Course.objects.filter(is_active=True).order_by('-created_at')[:6]),
+            'news': list(News.objects.filter(is_published=True).order_by('-published_date')[:6]),
+        }
+        cache.set(key, data, CONTENT_CACHE_TIMEOUT)
+    return data
+
+
 def global_navbar_data(request):
-    navbar_courses = Course.objects.filter(is_active=True).order_by('-created_at')[:6]
-    navbar_news = News.objects.all().order_by('-published_date')[:6]
-    
+    # Nothing is fetched until a template actually reads one of these.
+    navbar = SimpleLazyObject(_navbar_data)
     return {
-        'navbar_courses': navbar_courses,
-        'navbar_news': navbar_news,
-    }
\ No newline at end of file
+        'navbar_courses': SimpleLazyObject(lambda: navbar['courses']),
+        'navbar_news': SimpleLazyObject(lambda: navbar['news']),
+    }
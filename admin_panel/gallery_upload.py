@@ -0,0 +1,95 @@
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from PIL import Image
+
+from .cache import invalidate_page_cache
+from .image_jobs import claim_jobs, image_pool, run_jobs
+from .models import DashboardStats, GalleryImage, ImageOptimizationJob
+from .storage import ImageRejected
+
+
+GALLERY_BULK_BATCH_SIZE = 100
+
+
+def _verify_image(file):
+    # Header check only; the full decode happens later in the image worker.
+    with Image.open(file) as img:
+        img.verify()
+    file.seek(0)
+
+
+def _insert_batch(batch):
+    """Insert one batch of unsaved GalleryImage rows and queue their optimization jobs."""
+    images = [image for _, image in batch]
+    try:
+        with transaction.atomic():
+            GalleryImage.objects.bulk_create(images)
+            DashboardStats.increment("total_albums", len(images))
+            content_type = ContentType.objects.get_for_model(GalleryImage)
+            jobs = ImageOptimizationJob.objects.bulk_create([
+                ImageOptimizationJob(content_type=content_type, object_id=image.pk, field_name="image")
+                for image in images
+            ])
+    except Exception as exc:
+        for result, image in batch:
+            image.image.delete(save=False)
+            result.update(status="error", error=str(exc))
+        return []
+
+    for result, image in batch:
+        result["id"] = image.pk
+    return [job.pk for job in jobs]
+
+
+def ingest_gallery_images(category, files, batch_size=GALLERY_BULK_BATCH_SIZE, workers=None):
+    """
+    Store many uploaded files in one category with batched INSERTs.
+
+    Each file is streamed to storage and the rows are written with
+    bulk_create. Optimization is queued for the process_image_jobs worker.
+    When IMAGE_OPTIMIZATION_QUEUE is off, the images are optimized here on a
+    process pool instead. Returns one {"name", "status", "id", "error"} dict
+    per file, in upload order.
+    """
+    results = []
+    job_ids = []
+    batch = []
+
+    for file in files:
+        result = {"name": file.name, "status": "ok", "id": None, "error": ""}
+        results.append(result)
+        try:
+            _verify_image(file)
+        except Exception:
+            result.update(status="error", error="Not a valid image file")
+            continue
+
+        image = GalleryImage(
+            category=category,
+            title=file.name,
+            image_status=GalleryImage.STATUS_PROCESSING,
+        )
+        try:
+            image.image.save(file.name, file, save=False)
+        except ImageRejected as exc:
+            result.update(status="error", error=str(exc))
+            continue
+        batch.append((result, image))
+
+        if len(batch) >= batch_size:
+            job_ids += _insert_batch(batch)
+            batch = []
+
+    if batch:
+        job_ids += _insert_batch(batch)
+
+    if job_ids:
+        # bulk_create skips post_save, so do the page cache's part by hand
+        # (the dashboard counter was bumped inside each batch).
+        invalidate_page_cache()
+        if not getattr(settings, "IMAGE_OPTIMIZATION_QUEUE", True):
+            with image_pool(workers) as pool:
+                run_jobs(pool, claim_jobs(len(job_ids), ids=job_ids))
+
+    return results
@@ -0,0 +1,147 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import timedelta
+from multiprocessing import get_context
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.utils import timezone
+
+from utils.image_optimizer import ImageTooLarge, init_worker, process_image
+
+from .cache import bump_content_version, invalidate_page_cache
+from .models import ImageOptimizationJob, OptimizedImageModel
+from .storage import field_policy
+
+
+def image_pool(workers=None, nice=0):
+    # spawn: children only run PIL code and must not inherit DB connections.
+    return ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count() or 1,
+        mp_context=get_context('spawn'),
+        initializer=init_worker,
+        initargs=(nice,),
+    )
+
+
+def requeue_stale_jobs(seconds):
+    cutoff = timezone.now() - timedelta(seconds=seconds)
+    return ImageOptimizationJob.objects.filter(
+        status=ImageOptimizationJob.STATUS_PROCESSING, updated_at__lt=cutoff
+    ).update(status=ImageOptimizationJob.STATUS_PENDING, updated_at=timezone.now())
+
+
+def claim_jobs(batch_size, ids=None):
+    jobs = ImageOptimizationJob.objects.filter(status=ImageOptimizationJob.STATUS_PENDING)
+    if ids is not None:
+        jobs = jobs.filter(pk__in=ids)
+    with transaction.atomic():
+        jobs = list(jobs.select_for_update(skip_locked=True).order_by('id')[:batch_size])
+        ImageOptimizationJob.objects.filter(pk__in=[job.pk for job in jobs]).update(
+            status=ImageOptimizationJob.STATUS_PROCESSING, updated_at=timezone.now()
+        )
+    return jobs
+
+
+def image_work(obj, field_name):
+    """
+    process_image options for one field: the field's upload policy, and
+    renditions only where the model keeps them (OptimizedImageModel).
+    """
+    return {
+        'policy': field_policy(obj._meta.get_field(field_name)),
+        'renditions': isinstance(obj, OptimizedImageModel) and field_name in obj.image_fields,
+    }
+
+
+def process_now(obj, field_name):
+    """Run one field through the pipeline in this process (IMAGE_OPTIMIZATION_QUEUE off)."""
+    image_field = getattr(obj, field_name)
+    apply_image_result(obj, field_name, process_image(image_field.path, **image_work(obj, field_name)))
+
+
+def apply_image_result(obj, field_name, result, job=None):
+    """
+    Record what process_image produced for one field of `obj`: move the
+    optimized original into storage and point the row at it, then store the
+    renditions. The row is only repointed while it still holds the file
+    that was processed; an upload that replaced it meanwhile has a job of
+    its own, so this result is dropped.
+    """
+    image_field = getattr(obj, field_name)
+    storage = image_field.storage
+    old_name = image_field.name
+    optimized = result.get('optimized')
+    if optimized and not hasattr(storage, 'store_optimized'):
+        os.remove(optimized)
+    elif optimized:
+        new_name = storage.store_optimized(old_name, optimized)
+        if new_name != old_name:
+            model = type(obj)
+            if not model._default_manager.filter(pk=obj.pk, **{field_name: old_name}).update(**{field_name: new_name}):
+                storage.delete(new_name)
+                return
+            storage.delete(old_name)
+            setattr(obj, field_name, new_name)
+            # .update() skips post_save, so do the cache signals' part here.
+            bump_content_version(model)
+            invalidate_page_cache()
+    if isinstance(obj, OptimizedImageModel) and field_name in obj.image_fields:
+        obj.apply_renditions(field_name, result['renditions'], job=job)
+
+
+def run_jobs(pool, jobs, max_attempts=3, log=None):
+    """
+    Optimize the images behind claimed jobs on the pool and record the results.
+    Returns (done, failed) counts.
+    """
+    log = log or (lambda message: None)
+    futures = {}
+    done = failed = 0
+    for job in jobs:
+        try:
+            obj = job.get_object()
+        except ObjectDoesNotExist:
+            job.delete()
+            continue
+        image_field = getattr(obj, job.field_name, None)
+        if not image_field or not hasattr(image_field, 'path'):
+            _finish(job, obj, {'optimized': None, 'renditions': []})
+            done += 1
+            continue
+        futures[pool.submit(process_image, image_field.path, **image_work(obj, job.field_name))] = (job, obj)
+
+    for future in as_completed(futures):
+        job, obj = futures[future]
+        try:
+            _finish(job, obj, future.result())
+        except Exception as exc:
+            _fail(job, obj, exc, max_attempts)
+            failed += 1
+            log(f"Failed {job}: {exc}")
+        else:
+            done += 1
+            log(f"Processed {job}")
+    return done, failed
+
+
+def _finish(job, obj, result):
+    # Done only once the result is stored: a failure here (full disk, a
+    # storage error) leaves the job to be retried like a failed optimize.
+    apply_image_result(obj, job.field_name, result, job=job)
+    job.status = ImageOptimizationJob.STATUS_DONE
+    job.error = ''
+    job.save(update_fields=['status', 'error', 'updated_at'])
+
+
+def _fail(job, obj, exc, max_attempts):
+    job.attempts += 1
+    job.error = str(exc)
+    # An oversized image fails the same way every time.
+    if job.attempts >= max_attempts or isinstance(exc, ImageTooLarge):
+        job.status = ImageOptimizationJob.STATUS_FAILED
+        if isinstance(obj, OptimizedImageModel):
+            obj.mark_image_failed()
+    else:
+        job.status = ImageOptimizationJob.STATUS_PENDING
+    job.save(update_fields=['status', 'attempts', 'error', 'updated_at'])
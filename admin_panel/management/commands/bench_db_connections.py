@@ -0,0 +1,129 @@
+import copy
+import json
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+from django.db.backends.signals import connection_created
+from django.db.utils import ConnectionHandler
+
+from admin_panel.benchmark import percentile
+from admin_panel.models import News
+
+
+MODES = ('per-request', 'persistent', 'pool')
+BENCH_ALIAS = 'bench_connections'
+
+
+def mode_settings(base, mode, pool_size, timeout):
+    """A copy of the default database settings switched to one connection mode."""
+    db = copy.deepcopy(base)
+    options = db.setdefault('OPTIONS', {})
+    options.pop('pool', None)
+    db['CONN_MAX_AGE'] = None if mode == 'persistent' else 0
+    db['CONN_HEALTH_CHECKS'] = mode != 'per-request'
+    if mode == 'pool':
+        options['pool'] = {'min_size': pool_size, 'max_size': pool_size, 'timeout': timeout}
+    return db
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare request throughput with connect-per-request, persistent and pooled database connections. '
+        'Each simulated request runs one public-page query between the same open/close hooks Django uses.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+        parser.add_argument('--requests', type=int, default=2000, help='Simulated requests per mode.')
+        parser.add_argument('--concurrency', type=int, default=8, help='Worker threads issuing requests.')
+        parser.add_argument('--pool-size', type=int, default=4, help='Pool size; below --concurrency shows waiting.')
+        parser.add_argument('--pool-timeout', type=float, default=10.0)
+        parser.add_argument('--output', help='Also write the results as JSON.')
+
+    def handle(self, *args, **options):
+        base = settings.DATABASES[DEFAULT_DB_ALIAS]
+        if 'pool' in options['modes'] and base['ENGINE'] != 'django.db.backends.postgresql':
+            raise CommandError('The pool mode needs the PostgreSQL backend with psycopg 3.')
+
+        results = {}
+        self.stdout.write(f"{'mode':<12} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'connects':>9} {'wait ms':>8}")
+        for mode in options['modes']:
+            db = mode_settings(base, mode, options['pool_size'], options['pool_timeout'])
+            handler = ConnectionHandler({DEFAULT_DB_ALIAS: base, BENCH_ALIAS: db})
+            result = self.run_mode(handler, options['requests'], options['concurrency'])
+            results[mode] = result
+            self.stdout.write(
+                f"{mode:<12} {result['requests_per_second']:>9} {result['p50_ms']:>8} {result['p95_ms']:>8} "
+                f"{result['connections_opened']:>9} {result['pool_wait_ms']:>8}"
+            )
+
+        if options['output']:
+            with open(options['output'], 'w') as fh:
+                json.dump(results, fh, indent=2, sort_keys=True)
+                fh.write('\n')
+
+    def run_mode(self, handler, requests, concurrency):
+        latencies = []
+        lock = threading.Lock()
+        opened = [0]
+
+        def count_connect(sender, connection, **kwargs):
+            if connection.alias == BENCH_ALIAS:
+                with lock:
+                    opened[0] += 1
+
+        def worker(count):
+            connection = handler[BENCH_ALIAS]
+            sql, params = (
+                News.objects.filter(is_published=True).order_by('-published_date')[:6]
+                .query.get_compiler(connection=connection).as_sql()
+            )
+            timings = []
+            for _ in range(count):
+                started = time.perf_counter()
+                # The request_started / request_finished handlers.
+                connection.close_if_unusable_or_obsolete()
+                with connection.cursor() as cursor:
+                    cursor.execute(sql, params)
+                    cursor.fetchall()
+                connection.close_if_unusable_or_obsolete()
+                timings.append(time.perf_counter() - started)
+            connection.close()
+            with lock:
+                latencies.extend(timings)
+
+        connection_created.connect(count_connect)
+        threads = [
+            threading.Thread(target=worker, args=(requests // concurrency + (i < requests % concurrency),))
+            for i in range(concurrency)
+        ]
+        started = time.perf_counter()
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            connection_created.disconnect(count_connect)
+        elapsed = time.perf_counter() - started
+
+        connection = handler[BENCH_ALIAS]
+        pool = getattr(connection, 'pool', None)
+        stats = pool.get_stats() if pool is not None else {}
+        if pool is not None:
+            connection.close_pool()
+
+        latencies = [seconds * 1000 for seconds in latencies]
+        return {
+            'requests': len(latencies),
+            'concurrency': concurrency,
+            'requests_per_second': round(len(latencies) / elapsed, 1),
+            'p50_ms': round(percentile(latencies, 50), 2),
+            'p95_ms': round(percentile(latencies, 95), 2),
+            # With a pool, connection_created fires on every checkout instead.
+            'connections_opened': stats.get('connections_num', 0) if pool is not None else opened[0],
+            'pool_wait_ms': stats.get('requests_wait_ms', 0),
+        }
@@ -0,0 +1,120 @@
+import io
+import json
+import math
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from django.core.management.base import BaseCommand
+from PIL import Image
+
+from utils.image_optimizer import optimize_upload
+
+
+MODES = ('full', 'bounded')
+FORMATS = {'jpeg': ('JPEG', 'jpg'), 'png': ('PNG', 'png')}
+
+
+def _peak_rss_mb():
+    # On Linux ru_maxrss survives fork and exec, so a spawned child would
+    # start from the parent's peak; VmHWM belongs to this process alone.
+    try:
+        with open('/proc/self/status') as fh:
+            for line in fh:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def _full_decode(path, size=(1200, 1200), quality=75):
+    # The upload optimizer as it was before open_bounded: convert first, then scale.
+    with Image.open(path) as img:
+        img = img.convert('RGB')
+        img.thumbnail(size, Image.LANCZOS)
+        img.save(io.BytesIO(), 'JPEG', optimize=True, quality=quality)
+
+
+def probe(path, mode):
+    """Optimize one image in a fresh process; returns (peak RSS growth in MB, seconds)."""
+    baseline = _peak_rss_mb()
+    started = time.perf_counter()
+    if mode == 'full':
+        _full_decode(path)
+    else:
+        optimize_upload(path)
+    return _peak_rss_mb() - baseline, time.perf_counter() - started
+
+
+def synthetic_image(path, megapixels, pil_format):
+    # Noise compresses like a photo would, so the decoder does real work.
+    width = round(math.sqrt(megapixels * 1_000_000 * 4 / 3))
+    height = round(width * 3 / 4)
+    noise = Image.effect_noise((width // 8, height // 8), 64).resize((width, height), Image.BILINEAR)
+    Image.merge('RGB', (noise, noise.rotate(180), noise.transpose(Image.FLIP_LEFT_RIGHT))).save(path, pil_format)
+    return width, height
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure the peak memory of optimizing large uploads, decoding in full versus through '
+        'utils.image_optimizer.open_bounded. Each run uses a fresh process, so peaks do not carry over.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--megapixels', type=float, nargs='+', default=[12, 24, 48])
+        parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+        parser.add_argument('--format', choices=sorted(FORMATS), default='jpeg')
+        parser.add_argument('--repeat', type=int, default=3, help='Runs per size and mode; the median is kept.')
+        parser.add_argument('--output', help='Also write the results as JSON.')
+
+    def handle(self, *args, **options):
+        pil_format, ext = FORMATS[options['format']]
+        workdir = tempfile.mkdtemp(prefix='bench-image-memory-')
+        results = []
+        self.stdout.write(f"{'MP':>6} {'size':>11} {'mode':<8} {'peak MB':>8} {'MB/MP':>7} {'ms':>7}")
+        try:
+            for megapixels in options['megapixels']:
+                source = os.path.join(workdir, f'source.{ext}')
+                width, height = synthetic_image(source, megapixels, pil_format)
+                for mode in options['modes']:
+                    runs = sorted(self.run(source, mode, options['repeat']))
+                    peak, seconds = runs[len(runs) // 2]
+                    actual_mp = width * height / 1_000_000
+                    results.append({
+                        'megapixels': round(actual_mp, 1),
+                        'width': width,
+                        'height': height,
+                        'format': options['format'],
+                        'mode': mode,
+                        'peak_rss_mb': round(peak, 1),
+                        'peak_rss_mb_per_megapixel': round(peak / actual_mp, 2),
+                        'ms': round(seconds * 1000, 1),
+                    })
+                    row = results[-1]
+                    self.stdout.write(
+                        f"{row['megapixels']:>6} {f'{width}x{height}':>11} {mode:<8} {row['peak_rss_mb']:>8} "
+                        f"{row['peak_rss_mb_per_megapixel']:>7} {row['ms']:>7}"
+                    )
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        if options['output']:
+            with open(options['output'], 'w') as fh:
+                json.dump(results, fh, indent=2, sort_keys=True)
+                fh.write('\n')
+
+    def run(self, source, mode, repeat):
+        runs = []
+        for attempt in range(repeat):
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+                runs.append(pool.submit(probe, source, mode).result())
+        return runs
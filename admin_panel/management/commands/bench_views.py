@@ -0,0 +1,108 @@
+import json
+import subprocess
+
+import django
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from admin_panel.benchmark import DEFAULT_VOLUMES, measure, route_targets, seed_volumes
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed a throwaway database and report p50/p95 latency, SQL query count and response size '
+        'for every route in admin_panel/urls.py.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--volume', action='append', default=[], metavar='NAME=COUNT',
+            help=f'Rows to seed for one model (repeatable). Names: {", ".join(DEFAULT_VOLUMES)}.',
+        )
+        parser.add_argument('--scale', type=float, default=1.0, help='Multiply every default volume.')
+        parser.add_argument('--iterations', type=int, default=20, help='Timed requests per route.')
+        parser.add_argument('--warmup', type=int, default=2, help='Untimed requests per route first.')
+        parser.add_argument('--route', action='append', default=[], help='Only benchmark these route names.')
+        parser.add_argument('--cold-cache', action='store_true', help='Clear the cache before every request.')
+        parser.add_argument('--keepdb', action='store_true', help='Keep the benchmark database between runs.')
+        parser.add_argument('--output', default='bench_views.json', help='Where to write the JSON results.')
+        parser.add_argument('--compare', help='Earlier results file to print deltas against.')
+
+    def handle(self, *args, **options):
+        volumes = {name: max(1, int(count * options['scale'])) for name, count in DEFAULT_VOLUMES.items()}
+        for item in options['volume']:
+            name, _, count = item.partition('=')
+            if name not in volumes or not count.isdigit():
+                raise CommandError(f'Bad --volume {item!r}; expected one of {", ".join(volumes)} as NAME=COUNT.')
+            volumes[name] = int(count)
+
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options['keepdb'])
+        try:
+            results = self.run_benchmark(volumes, options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options['keepdb'])
+            teardown_test_environment()
+
+        with open(options['output'], 'w') as fh:
+            json.dump(results, fh, indent=2, sort_keys=True)
+            fh.write('\n')
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
+
+    def run_benchmark(self, volumes, options):
+        seed_volumes(volumes, log=self.stdout.write)
+
+        User = get_user_model()
+        user = User.objects.filter(username='bench').first() or User.objects.create_superuser(
+            'bench', 'bench@example.com', 'bench'
+        )
+        # Broken routes are reported with their 500 status instead of aborting the run.
+        anonymous, staff = Client(raise_request_exception=False), Client(raise_request_exception=False)
+        staff.force_login(user)
+
+        previous = {}
+        if options['compare']:
+            with open(options['compare']) as fh:
+                previous = json.load(fh).get('routes', {})
+
+        routes = {}
+        self.stdout.write(f"{'route':<24} {'p50 ms':>8} {'p95 ms':>8} {'queries':>8} {'bytes':>9}")
+        for name, path in route_targets():
+            if options['route'] and name not in options['route']:
+                continue
+            result = measure(
+                anonymous, staff, path, options['iterations'], options['warmup'],
+                before_request=cache.clear if options['cold_cache'] else None,
+            )
+            routes[name] = result
+            line = f"{name:<24} {result['p50_ms']:>8} {result['p95_ms']:>8} {result['queries']:>8} {result['bytes']:>9}"
+            if name in previous:
+                before = previous[name]
+                line += f"  ({result['p50_ms'] - before['p50_ms']:+.2f} ms, {result['queries'] - before['queries']:+d} queries)"
+            self.stdout.write(line)
+
+        return {
+            'meta': {
+                'commit': self.git_commit(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+                'iterations': options['iterations'],
+                'warmup': options['warmup'],
+                'cold_cache': options['cold_cache'],
+                'volumes': volumes,
+            },
+            'routes': routes,
+        }
+
+    def git_commit(self):
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ''
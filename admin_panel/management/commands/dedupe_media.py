@@ -0,0 +1,24 @@
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+
+from admin_panel.storage import ContentAddressedStorage, deduplicate_stored_media
+
+
+class Command(BaseCommand):
+    help = (
+        'Move media stored under upload names into the content-addressed layout, sharing identical files. '
+        'Old files are left for gc_media to remove.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Hash files and report duplicates without moving anything.')
+
+    def handle(self, *args, **options):
+        if not isinstance(default_storage, ContentAddressedStorage):
+            raise CommandError('The default storage is not admin_panel.storage.ContentAddressedStorage.')
+        stats = deduplicate_stored_media(options['dry_run'], log=self.stdout.write)
+        self.stdout.write(
+            f"{stats['rows']} rows, {stats['files']} files, {stats['duplicates']} duplicates "
+            f"({stats['bytes_saved'] / 1024 / 1024:.1f} MB), {stats['missing']} missing"
+            f"{' (dry run)' if options['dry_run'] else ''}"
+        )
@@ -0,0 +1,115 @@
+import re
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import override_settings
+
+from admin_panel.benchmark import route_targets
+from admin_panel.metrics import CaptureAllQueries
+
+
+# Plan lines that mean a whole table is read, or results are sorted after the fact.
+SEQ_SCAN_PATTERNS = {
+    'postgresql': re.compile(r'Seq Scan on (\w+)'),
+    'sqlite': re.compile(r'^SCAN (\w+)$'),
+}
+SORT_PATTERNS = {
+    'postgresql': re.compile(r'^\s*(?:->\s*)?Sort\b'),
+    'sqlite': re.compile(r'USE TEMP B-TREE FOR ORDER BY'),
+}
+APP_TABLE_PREFIX = 'admin_panel_'
+
+NO_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+
+
+class Command(BaseCommand):
+    help = (
+        'Request every GET route, EXPLAIN each SELECT it runs and flag sequential scans and '
+        'unindexed sorts on the app tables. Runs inside a rolled-back transaction.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--route', action='append', default=[], help='Only check these route names.')
+        parser.add_argument('--verbose-plans', action='store_true', help='Print the full plan of every query.')
+        parser.add_argument(
+            '--no-seqscan', action='store_true',
+            help='PostgreSQL only: disable seq scans so small tables still show whether an index is usable.',
+        )
+        parser.add_argument('--fail-on-seqscan', action='store_true', help='Exit non-zero if any scan is flagged.')
+
+    def handle(self, *args, **options):
+        vendor = connection.vendor
+        if vendor not in SEQ_SCAN_PATTERNS:
+            raise CommandError(f'No plan parser for the {vendor} backend.')
+
+        flagged = 0
+        with transaction.atomic(), override_settings(CACHES=NO_CACHE, ALLOWED_HOSTS=['*']):
+            if options['no_seqscan'] and vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+            user = get_user_model().objects.create_superuser('explain-views', 'explain@example.com', None)
+            # Signed in, so the page cache is bypassed and every queryset runs.
+            client = Client(raise_request_exception=False)
+            client.force_login(user)
+
+            explained = {}
+            for name, path in route_targets():
+                if options['route'] and name not in options['route']:
+                    continue
+                with CaptureAllQueries() as captured:
+                    response = client.get(path)
+                issues = []
+                for query in captured.captured_queries:
+                    sql = query['sql']
+                    if not sql.lstrip().upper().startswith('SELECT') or APP_TABLE_PREFIX not in sql:
+                        continue
+                    if sql not in explained:
+                        explained[sql] = self.explain(sql)
+                    plan = explained[sql]
+                    problems = self.problems(vendor, plan)
+                    if problems:
+                        issues.append((sql, problems, plan))
+                    elif options['verbose_plans']:
+                        self.stdout.write(f'  {sql}\n    ' + '\n    '.join(plan))
+
+                status = f'[{response.status_code}]'
+                if not issues:
+                    self.stdout.write(self.style.SUCCESS(f'ok    {name} {path} {status}'))
+                    continue
+                flagged += len(issues)
+                self.stdout.write(self.style.WARNING(f'FLAG  {name} {path} {status}'))
+                for sql, problems, plan in issues:
+                    self.stdout.write(f"  {', '.join(problems)}")
+                    self.stdout.write(f'    {sql[:300]}')
+                    if options['verbose_plans']:
+                        self.stdout.write('    ' + '\n    '.join(plan))
+
+            transaction.set_rollback(True)
+
+        summary = f'{flagged} queries with sequential scans or unindexed sorts.'
+        if flagged and options['fail_on_seqscan']:
+            raise CommandError(summary)
+        self.stdout.write(self.style.WARNING(summary) if flagged else self.style.SUCCESS(summary))
+
+    def explain(self, sql):
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(f'{connection.ops.explain_query_prefix()} {sql}')
+                rows = cursor.fetchall()
+        except Exception as exc:
+            return [f'(could not explain: {exc})']
+        # SQLite returns (id, parent, notused, detail); others one text column.
+        return [str(row[-1]) for row in rows]
+
+    def problems(self, vendor, plan):
+        found = []
+        for line in plan:
+            match = SEQ_SCAN_PATTERNS[vendor].search(line.strip())
+            if match and match.group(1).startswith(APP_TABLE_PREFIX):
+                found.append(f'seq scan on {match.group(1)}')
+            elif SORT_PATTERNS[vendor].search(line):
+                found.append('sort without index')
+        return found
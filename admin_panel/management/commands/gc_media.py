@@ -0,0 +1,39 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from admin_panel.media_gc import collect_garbage
+
+
+class Command(BaseCommand):
+    help = (
+        'Find files under MEDIA_ROOT that no FileField, ImageField or rendition references any more, '
+        'and quarantine or remove those older than the grace period.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-hours', type=float, default=72, help='Leave files modified more recently than this.')
+        parser.add_argument('--action', choices=('quarantine', 'remove'), default='quarantine')
+        parser.add_argument(
+            '--quarantine-dir', default=os.path.join(settings.BASE_DIR, 'media_quarantine'),
+            help='Orphans are moved here, under a folder per run. Keep it outside MEDIA_ROOT so it is not served.',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='List what would be swept and change nothing.')
+
+    def handle(self, *args, **options):
+        stats = collect_garbage(
+            options['grace_hours'] * 3600,
+            action=options['action'],
+            quarantine_root=options['quarantine_dir'],
+            dry_run=options['dry_run'],
+            log=self.stdout.write,
+        )
+        self.stdout.write(
+            f"{stats['files']} files: {stats['referenced']} referenced, {stats['recent']} inside the grace period, "
+            f"{stats['orphaned']} orphaned ({stats['bytes'] / 1024 / 1024:.1f} MB)"
+        )
+        if options['dry_run']:
+            self.stdout.write('Dry run: nothing was moved or removed.')
+        elif stats['swept'] and options['action'] == 'quarantine':
+            self.stdout.write(f"{stats['swept']} files moved to {stats['quarantine_dir']}")
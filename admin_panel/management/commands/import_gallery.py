@@ -0,0 +1,56 @@
+import os
+
+from django.core.files import File
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from admin_panel.gallery_upload import GALLERY_BULK_BATCH_SIZE, ingest_gallery_images
+from admin_panel.models import Category
+
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp', '.tif', '.tiff'}
+
+
+class Command(BaseCommand):
+    help = 'Bulk import image files or folders into a gallery category.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('category', help='Category name (created if missing).')
+        parser.add_argument('paths', nargs='+', help='Image files or folders to import.')
+        parser.add_argument('--batch-size', type=int, default=GALLERY_BULK_BATCH_SIZE)
+        parser.add_argument('--optimize', action='store_true', help='Run the queued optimization jobs before exiting.')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+
+    def iter_paths(self, paths):
+        for path in paths:
+            if os.path.isdir(path):
+                for root, _, names in os.walk(path):
+                    for name in sorted(names):
+                        if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS:
+                            yield os.path.join(root, name)
+            elif os.path.isfile(path):
+                yield path
+            else:
+                raise CommandError(f"No such file or directory: {path}")
+
+    def iter_files(self, paths):
+        for path in paths:
+            with open(path, 'rb') as fh:
+                yield File(fh, name=os.path.basename(path))
+
+    def handle(self, *args, **options):
+        category, _ = Category.objects.get_or_create(name=options['category'])
+        paths = list(self.iter_paths(options['paths']))
+        results = ingest_gallery_images(category, self.iter_files(paths), batch_size=options['batch_size'])
+
+        failed = 0
+        for result in results:
+            if result['status'] == 'ok':
+                self.stdout.write(f"ok     {result['name']} (#{result['id']})")
+            else:
+                failed += 1
+                self.stdout.write(f"error  {result['name']}: {result['error']}")
+        self.stdout.write(self.style.SUCCESS(f"Imported {len(results) - failed} of {len(results)} files into '{category}'"))
+
+        if options['optimize']:
+            call_command('process_image_jobs', once=True, workers=options['workers'], stdout=self.stdout)
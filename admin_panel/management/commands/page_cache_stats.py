@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from admin_panel.cache import page_cache_stats, reset_page_cache_stats
+
+
+class Command(BaseCommand):
+    help = 'Show hit/miss counts for the public page cache.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Reset the counters after printing them.')
+
+    def handle(self, *args, **options):
+        stats = page_cache_stats()
+        self.stdout.write(f"Hits:       {stats['hits']}")
+        self.stdout.write(f"Misses:     {stats['misses']}")
+        self.stdout.write(f"Hit ratio:  {stats['hit_ratio']:.1%}")
+        self.stdout.write(f"Generation: {stats['generation']}")
+        if options['reset']:
+            reset_page_cache_stats()
+            self.stdout.write(self.style.SUCCESS('Counters reset.'))
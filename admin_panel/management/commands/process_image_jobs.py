@@ -0,0 +1,32 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand
+
+from admin_panel.image_jobs import claim_jobs, image_pool, requeue_stale_jobs, run_jobs
+
+
+class Command(BaseCommand):
+    help = 'Run queued image optimization jobs on a pool of worker processes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+        parser.add_argument('--batch-size', type=int, default=50)
+        parser.add_argument('--max-attempts', type=int, default=3)
+        parser.add_argument('--poll-interval', type=float, default=2.0, help='Seconds to sleep when the queue is empty.')
+        parser.add_argument('--stale-after', type=int, default=600, help='Seconds before a claimed job is retried.')
+        parser.add_argument('--once', action='store_true', help='Drain the queue and exit.')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Image worker started with {options['workers']} processes")
+
+        with image_pool(options['workers']) as pool:
+            while True:
+                requeue_stale_jobs(options['stale_after'])
+                jobs = claim_jobs(options['batch_size'])
+                if not jobs:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+                run_jobs(pool, jobs, options['max_attempts'], log=self.stdout.write)
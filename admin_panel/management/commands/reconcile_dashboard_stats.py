@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from admin_panel.models import DashboardStats
+
+
+class Command(BaseCommand):
+    help = 'Recount the dashboard totals and fix any drift in the counter row.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Report drift without fixing it.')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            # Lock the row so signal updates wait until the recount is written.
+            stats = DashboardStats.objects.select_for_update().get(pk=DashboardStats.load().pk)
+            actual = DashboardStats.actual_counts()
+
+            drift = {
+                field: (getattr(stats, field), count)
+                for field, count in actual.items()
+                if getattr(stats, field) != count
+            }
+            for field, (stored, count) in drift.items():
+                self.stdout.write(f"{field}: stored {stored}, actual {count}")
+
+            if not drift:
+                self.stdout.write(self.style.SUCCESS('Dashboard stats are in sync.'))
+            elif options['dry_run']:
+                self.stdout.write(self.style.WARNING(f'{len(drift)} counters out of sync (dry run, nothing changed).'))
+            else:
+                DashboardStats.objects.filter(pk=stats.pk).update(**actual)
+                self.stdout.write(self.style.SUCCESS(f'Fixed {len(drift)} counters.'))
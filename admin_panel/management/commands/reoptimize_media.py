@@ -0,0 +1,58 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand
+
+from admin_panel.image_jobs import image_pool
+from admin_panel.reoptimize import ByteThrottle, Manifest, db_images, media_images, progress, reoptimize
+
+
+class Command(BaseCommand):
+    help = (
+        'Re-apply the image upload policies (IMAGE_UPLOAD_POLICY, IMAGE_FIELD_POLICIES) to files already in media/. '
+        'Files keep their names and formats and are replaced atomically, so it is safe on a live server; '
+        'interrupted runs resume from the manifest.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source', choices=('db', 'media'), default='db',
+            help='Walk the ImageField values in the database, or every image file under MEDIA_ROOT.',
+        )
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+        parser.add_argument('--manifest', default='reoptimize_manifest.jsonl', help='Resume log of finished files.')
+        parser.add_argument('--restart', action='store_true', help='Forget the manifest and start over.')
+        parser.add_argument('--dry-run', action='store_true', help='Encode in memory and report the projected savings only.')
+        parser.add_argument('--min-saving', type=float, default=0.05, help='Rewrite a file that already fits only if it shrinks by this share.')
+        parser.add_argument('--max-mbps', type=float, default=0, help='Cap disk traffic (read + written) in MB/s; 0 for no cap.')
+        parser.add_argument('--nice', type=int, default=10, help='Niceness added to the worker processes.')
+
+    def handle(self, *args, **options):
+        if options['restart'] and os.path.exists(options['manifest']):
+            os.remove(options['manifest'])
+        manifest = Manifest(options['manifest'])
+        images = db_images() if options['source'] == 'db' else media_images()
+        throttle = ByteThrottle(options['max_mbps'] * 1024 * 1024)
+
+        self.stdout.write(
+            f"Re-optimizing from {options['source']} with {options['workers']} processes"
+            f"{' (dry run)' if options['dry_run'] else ''}; {len(manifest.done)} files already in the manifest"
+        )
+        started = time.monotonic()
+        try:
+            with image_pool(options['workers'], nice=options['nice']) as pool:
+                stats = reoptimize(
+                    pool, options['workers'], images, manifest,
+                    dry_run=options['dry_run'],
+                    min_saving=options['min_saving'],
+                    throttle=throttle,
+                    log=self.stdout.write,
+                )
+        finally:
+            manifest.close()
+        elapsed = time.monotonic() - started
+
+        self.stdout.write(progress(stats))
+        self.stdout.write(f"{elapsed:.1f}s, {stats['files'] / elapsed if elapsed else 0:.1f} files/s")
+        if options['dry_run']:
+            self.stdout.write('Dry run: nothing was written.')
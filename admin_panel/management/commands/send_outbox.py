@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from admin_panel.outbox import claim_batch, deliver_batch, requeue_stale
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued outbound emails over a reused mail connection.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50)
+        parser.add_argument('--max-attempts', type=int, default=5, help='Attempts before an email is dead-lettered.')
+        parser.add_argument('--poll-interval', type=float, default=5.0, help='Seconds to sleep when the outbox is empty.')
+        parser.add_argument('--stale-after', type=int, default=600, help='Seconds before a claimed email is retried.')
+        parser.add_argument('--once', action='store_true', help='Drain what is due now and exit.')
+
+    def handle(self, *args, **options):
+        while True:
+            requeue_stale(options['stale_after'])
+            emails = claim_batch(options['batch_size'])
+            if not emails:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+            sent, retried, dead = deliver_batch(emails, options['max_attempts'])
+            self.stdout.write(f"Sent {sent}, retrying {retried}, dead-lettered {dead}")
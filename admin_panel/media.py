@@ -0,0 +1,173 @@
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+from django.views.decorators.http import require_safe
+
+from .storage import CONTENT_ROOT
+
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+# Content-addressed files and versioned renditions never change under their
+# name, so browsers may keep both.
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# Rendition names carry the source digest and pipeline version
+# (generate_renditions); older unversioned ones get the default policy.
+VERSIONED_RENDITION = re.compile(r'/renditions/[^/]+-[0-9a-f]{12}-v\d+-\d+w\.\w+$')
+DEFAULT_CACHE_CONTROL = 'public, max-age=3600'
+PRIVATE_CACHE_CONTROL = 'private, max-age=0, must-revalidate'
+
+
+class UnsatisfiableRange(Exception):
+    pass
+
+
+class FileRange:
+    """
+    Read-only view of bytes [start, start + length) of an open file.
+
+    It keeps fileno(), so a WSGI server's file_wrapper can still sendfile()
+    the slice: gunicorn sends Content-Length bytes from the current offset.
+    """
+
+    def __init__(self, fh, start, length):
+        fh.seek(start)
+        self._fh = fh
+        self._remaining = length
+
+    def read(self, size=-1):
+        if self._remaining <= 0:
+            return b''
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._fh.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self._fh.fileno()
+
+    def close(self):
+        self._fh.close()
+
+
+def parse_range(header, size):
+    """
+    Return (start, end) for a single "bytes=" range, or None to serve the whole
+    file (no header, multiple ranges or syntax we don't handle).
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if not match or match.groups() == ('', ''):
+        return None
+    start, end = match.groups()
+    if start == '':
+        suffix = int(end)
+        if suffix == 0:
+            raise UnsatisfiableRange
+        return max(0, size - suffix), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        raise UnsatisfiableRange
+    return start, end
+
+
+def _if_range_matches(request, etag, mtime):
+    if_range = request.headers.get('If-Range')
+    if not if_range:
+        return True
+    if if_range.startswith('"') or if_range.startswith('W/'):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == int(mtime)
+
+
+def _is_private(path):
+    return any(path.startswith(prefix) for prefix in getattr(settings, 'MEDIA_PRIVATE_PREFIXES', []))
+
+
+@require_safe
+def serve_media(request, path):
+    """
+    Serve a file from MEDIA_ROOT in production.
+
+    Supports conditional requests (ETag from mtime + size), single byte
+    ranges with If-Range, and zero-copy sends through the server's
+    wsgi.file_wrapper. With MEDIA_ACCEL_REDIRECT set, nginx streams the file
+    (X-Accel-Redirect) and Python only checks access and sets headers.
+    """
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404
+    # Check access on the resolved path: '/media/./donation_proofs/x.png'
+    # and 'gallery/../donation_proofs/x.png' must count as private too.
+    path = os.path.relpath(full_path, os.path.abspath(settings.MEDIA_ROOT)).replace(os.sep, '/')
+    if _is_private(path) and not request.user.is_authenticated:
+        raise Http404
+    try:
+        stat = os.stat(full_path)
+    except OSError:
+        raise Http404
+    if not os.path.isfile(full_path):
+        raise Http404
+
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if response is None:
+        response = _file_response(request, path, full_path, stat, etag)
+
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    if _is_private(path):
+        response['Cache-Control'] = PRIVATE_CACHE_CONTROL
+    elif path.startswith(CONTENT_ROOT) or VERSIONED_RENDITION.search(path):
+        response['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    else:
+        response['Cache-Control'] = DEFAULT_CACHE_CONTROL
+    return response
+
+
+def _file_response(request, path, full_path, stat, etag):
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or 'application/octet-stream'
+    size = stat.st_size
+
+    accel_prefix = getattr(settings, 'MEDIA_ACCEL_REDIRECT', '')
+    if accel_prefix:
+        # nginx handles Range itself for internal redirects. The header is
+        # a URI, which nginx decodes; raw non-ASCII names would be MIME-encoded.
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = accel_prefix.rstrip('/') + '/' + quote(path)
+        return response
+
+    try:
+        byte_range = parse_range(request.headers.get('Range'), size) if _if_range_matches(request, etag, stat.st_mtime) else None
+    except UnsatisfiableRange:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+
+    if request.method == 'HEAD':
+        response = HttpResponse(content_type=content_type)
+        response['Content-Length'] = size
+    elif byte_range is None:
+        response = FileResponse(open(full_path, 'rb'), content_type=content_type)
+    else:
+        start, end = byte_range
+        length = end - start + 1
+        response = FileResponse(FileRange(open(full_path, 'rb'), start, length), content_type=content_type, status=206)
+        response['Content-Length'] = length
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+
+    response['Accept-Ranges'] = 'bytes'
+    if encoding:
+        response['Content-Encoding'] = encoding
+    return response
@@ -0,0 +1,160 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.db import models
+
+from .models import OptimizedImageModel
+
+
+MARK_BATCH_SIZE = 5000
+
+
+def file_fields():
+    """(model, field name) of every FileField and ImageField on every installed model."""
+    for model in apps.get_models():
+        for field in model._meta.get_fields():
+            if isinstance(field, models.FileField):
+                yield model, field.name
+
+
+def iter_references():
+    """Every media name the database points at: file fields and image renditions, streamed."""
+    for model, field in file_fields():
+        names = (
+            model._default_manager.exclude(**{field: ''})
+            .exclude(**{f'{field}__isnull': True})
+            .values_list(field, flat=True)
+        )
+        yield from names.iterator(chunk_size=2000)
+    for model in apps.get_models():
+        if issubclass(model, OptimizedImageModel):
+            for renditions in model._default_manager.values_list('renditions', flat=True).iterator(chunk_size=2000):
+                for items in (renditions or {}).values():
+                    for item in items:
+                        yield item['name']
+
+
+def is_referenced(name):
+    """Live check for one name, just before it is swept."""
+    for model, field in file_fields():
+        if model._default_manager.filter(**{field: name}).exists():
+            return True
+    for model in apps.get_models():
+        if issubclass(model, OptimizedImageModel) and \
+                model._default_manager.filter(renditions__icontains=f'"{name}"').exists():
+            return True
+    return False
+
+
+class MarkSet:
+    """
+    Set of referenced names kept in a temporary SQLite file rather than in
+    memory, so the collector's footprint does not grow with the library.
+    """
+
+    def __init__(self):
+        fd, self.path = tempfile.mkstemp(prefix='gc-media-', suffix='.sqlite3')
+        os.close(fd)
+        self._db = sqlite3.connect(self.path)
+        self._db.execute('PRAGMA journal_mode = OFF')
+        self._db.execute('PRAGMA synchronous = OFF')
+        self._db.execute('CREATE TABLE marks (name TEXT PRIMARY KEY) WITHOUT ROWID')
+        self.count = 0
+
+    def add_all(self, names):
+        batch = []
+        for name in names:
+            batch.append((name,))
+            if len(batch) >= MARK_BATCH_SIZE:
+                self._insert(batch)
+                batch = []
+        self._insert(batch)
+        self.count = self._db.execute('SELECT COUNT(*) FROM marks').fetchone()[0]
+
+    def _insert(self, batch):
+        self._db.executemany('INSERT OR IGNORE INTO marks VALUES (?)', batch)
+        self._db.commit()
+
+    def __contains__(self, name):
+        return self._db.execute('SELECT 1 FROM marks WHERE name = ?', (name,)).fetchone() is not None
+
+    def close(self):
+        self._db.close()
+        os.remove(self.path)
+
+
+def walk_media(root, skip=()):
+    """
+    Yield (name, DirEntry) for every file under root, one directory handle
+    at a time; only the queue of directories still to visit is held.
+    """
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.path not in skip:
+                        pending.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield os.path.relpath(entry.path, root).replace(os.sep, '/'), entry
+
+
+def collect_garbage(grace_seconds, action='quarantine', quarantine_root=None, dry_run=False, log=None):
+    """
+    Mark every referenced media name, then sweep MEDIA_ROOT for files that
+    are not marked and were last modified more than grace_seconds ago. The
+    grace period covers uploads whose row is not committed yet and
+    renditions a worker has written but not recorded. Each orphan is checked
+    against the database once more right before it is moved or deleted,
+    because content-addressed files can gain a reference mid-run.
+    Quarantined files keep their relative path under a folder per run in
+    quarantine_root. Returns a dict of counters.
+    """
+    log = log or (lambda message: None)
+    root = os.path.abspath(settings.MEDIA_ROOT)
+    quarantine_root = os.path.abspath(quarantine_root or os.path.join(settings.BASE_DIR, 'media_quarantine'))
+    run_dir = os.path.join(quarantine_root, time.strftime('%Y%m%d-%H%M%S'))
+    stats = dict.fromkeys(('files', 'referenced', 'recent', 'orphaned', 'swept', 'bytes'), 0)
+    cutoff = time.time() - grace_seconds
+
+    marks = MarkSet()
+    try:
+        marks.add_all(iter_references())
+        log(f'Marked {marks.count} referenced names')
+        for name, entry in walk_media(root, skip={quarantine_root}):
+            stats['files'] += 1
+            if name in marks:
+                stats['referenced'] += 1
+                continue
+            stat = entry.stat(follow_symlinks=False)
+            if stat.st_mtime > cutoff:
+                stats['recent'] += 1
+                continue
+            stats['orphaned'] += 1
+            stats['bytes'] += stat.st_size
+            if dry_run:
+                log(f'Would {action} {name} ({stat.st_size / 1024:.1f} KB)')
+                continue
+            if is_referenced(name):
+                stats['orphaned'] -= 1
+                stats['bytes'] -= stat.st_size
+                stats['referenced'] += 1
+                continue
+            if action == 'remove':
+                os.remove(entry.path)
+            else:
+                target = os.path.join(run_dir, name)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.move(entry.path, target)
+            stats['swept'] += 1
+            log(f'{action.capitalize()}d {name}')
+    finally:
+        marks.close()
+    stats['quarantine_dir'] = run_dir
+    return stats
@@ -0,0 +1,393 @@
+import logging
+import os
+import socket
+import threading
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.http import Http404, HttpResponse
+from django.template import TemplateDoesNotExist
+from django.template.backends.django import DjangoTemplates, Template, reraise
+from django.utils.crypto import constant_time_compare
+
+from .checks import cache_is_shared
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the request latency histogram.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Each process publishes its totals to the shared cache at most this often,
+# so the hot path never touches the cache.
+METRICS_FLUSH_INTERVAL = 10
+METRICS_WORKERS_KEY = 'metrics:workers'
+METRICS_WORKER_TIMEOUT = 60 * 10
+
+# psycopg_pool statistics that are levels rather than running totals.
+POOL_GAUGES = {'pool_min', 'pool_max', 'pool_size', 'pool_available', 'requests_waiting'}
+
+_current = ContextVar('request_timings', default=None)
+# Lists receiving every query while a CaptureAllQueries block is open.
+_captures = []
+
+
+# ==================== PER-REQUEST TIMINGS ====================
+
+class RequestTimings:
+    __slots__ = ('queries', 'db', 'templates', 'cache_hits', 'cache_misses', '_template_depth', '_lock')
+
+    def __init__(self):
+        self.queries = 0
+        self.db = 0.0
+        self.templates = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._template_depth = 0
+        # Async views may run several queries for one request on different threads.
+        self._lock = threading.Lock()
+
+    def add_query(self, seconds):
+        with self._lock:
+            self.queries += 1
+            self.db += seconds
+
+    def server_timing(self, total):
+        return (
+            f'db;dur={self.db * 1000:.1f};desc="{self.queries} queries", '
+            f'tpl;dur={self.templates * 1000:.1f}, '
+            f'cache;desc="{self.cache_hits} hit {self.cache_misses} miss", '
+            f'total;dur={total * 1000:.1f}'
+        )
+
+
+def record_sql(execute, sql, params, many, context):
+    timings = _current.get()
+    if timings is None and not _captures:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        if timings is not None:
+            timings.add_query(elapsed)
+        if _captures:
+            if not many:
+                sql = context['connection'].ops.last_executed_query(context['cursor'].cursor, sql, params)
+            for captured in tuple(_captures):
+                captured.append({'sql': sql, 'time': f'{elapsed:.3f}'})
+
+
+class CaptureAllQueries:
+    """
+    CaptureQueriesContext for every connection on every thread. Views that
+    use gather_queries run their SQL on executor threads, each with its own
+    connection, which a capture of `connection` alone never sees.
+    """
+
+    def __enter__(self):
+        self.captured_queries = []
+        _captures.append(self.captured_queries)
+        return self
+
+    def __exit__(self, *exc_info):
+        _captures.remove(self.captured_queries)
+
+    def __len__(self):
+        return len(self.captured_queries)
+
+
+def install_sql_timing(sender, connection, **kwargs):
+    """
+    connection_created receiver: time every query on every connection,
+    whichever thread runs it. The request is found through a context
+    variable, which asgiref carries into sync_to_async threads.
+    """
+    if record_sql not in connection.execute_wrappers:
+        # First in the list, so execute_wrapper() blocks still pop their own.
+        connection.execute_wrappers.insert(0, record_sql)
+
+
+def record_cache(hit):
+    """Count an application cache lookup against the current request."""
+    timings = _current.get()
+    if timings is not None:
+        if hit:
+            timings.cache_hits += 1
+        else:
+            timings.cache_misses += 1
+
+
+class InstrumentedTemplate(Template):
+    def render(self, context=None, request=None):
+        timings = _current.get()
+        if timings is None:
+            return super().render(context, request)
+        # Only the outermost render counts; nested renders are inside it.
+        timings._template_depth += 1
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            timings._template_depth -= 1
+            if not timings._template_depth:
+                timings.templates += time.perf_counter() - started
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """The Django template backend, timing every top-level render."""
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return InstrumentedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
+
+
+# ==================== AGGREGATION ====================
+
+class RouteStats:
+    __slots__ = ('buckets', 'count', 'seconds', 'queries', 'db', 'templates', 'cache_hits', 'cache_misses')
+
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.seconds = 0.0
+        self.queries = 0
+        self.db = 0.0
+        self.templates = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def as_list(self):
+        return [self.buckets, self.count, self.seconds, self.queries, self.db, self.templates,
+                self.cache_hits, self.cache_misses]
+
+
+class MetricsRegistry:
+    """
+    Per-process totals by URL name. Processes publish snapshots to the
+    shared cache so /metrics can sum every worker.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.lock = threading.Lock()
+        self.worker_id = f'{socket.gethostname()}:{os.getpid()}'
+        self.flushed_at = 0.0
+        self.flusher = None
+
+    def observe(self, route, seconds, timings):
+        with self.lock:
+            stats = self.routes.get(route)
+            if stats is None:
+                stats = self.routes[route] = RouteStats()
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    stats.buckets[i] += 1
+                    break
+            stats.count += 1
+            stats.seconds += seconds
+            stats.queries += timings.queries
+            stats.db += timings.db
+            stats.templates += timings.templates
+            stats.cache_hits += timings.cache_hits
+            stats.cache_misses += timings.cache_misses
+        if time.monotonic() - self.flushed_at >= METRICS_FLUSH_INTERVAL:
+            self.flush_in_background()
+
+    def snapshot(self):
+        with self.lock:
+            routes = {route: stats.as_list() for route, stats in self.routes.items()}
+        return {'routes': routes, 'db_pool': db_pool_stats()}
+
+    def flush_in_background(self):
+        """
+        Publish from a short-lived thread. observe() runs on the request
+        path, under ASGI on the event loop, where blocking cache I/O stalls
+        every request on the worker (and a database cache refuses to run).
+        """
+        with self.lock:
+            if self.flusher is not None and self.flusher.is_alive():
+                return
+            self.flushed_at = time.monotonic()
+            self.flusher = threading.Thread(target=self._flush_and_close, name='metrics-flush', daemon=True)
+        self.flusher.start()
+
+    def _flush_and_close(self):
+        try:
+            self.flush()
+        finally:
+            # This thread's own connections, if the cache backend opened any.
+            connections.close_all()
+
+    def flush(self):
+        self.flushed_at = time.monotonic()
+        try:
+            cache.set(f'metrics:worker:{self.worker_id}', self.snapshot(), METRICS_WORKER_TIMEOUT)
+            workers = set(cache.get(METRICS_WORKERS_KEY, ()))
+            if self.worker_id not in workers:
+                workers.add(self.worker_id)
+                cache.set(METRICS_WORKERS_KEY, workers, None)
+        except Exception:
+            # Metrics must never take a request down with them.
+            logger.warning('Could not publish request metrics', exc_info=True)
+
+    def collect(self):
+        """Sum the snapshots of every live worker, including this one."""
+        self.flush()
+        workers = cache.get(METRICS_WORKERS_KEY, set())
+        snapshots = cache.get_many([f'metrics:worker:{worker}' for worker in workers])
+        live = {key.split(':', 2)[2] for key in snapshots}
+        if live != workers:
+            cache.set(METRICS_WORKERS_KEY, live, None)
+
+        totals, pool = {}, {}
+        for snapshot in snapshots.values():
+            for route, values in snapshot['routes'].items():
+                current = totals.get(route)
+                if current is None:
+                    totals[route] = [list(values[0])] + values[1:]
+                    continue
+                current[0] = [a + b for a, b in zip(current[0], values[0])]
+                for i in range(1, len(values)):
+                    current[i] += values[i]
+            for key, value in snapshot['db_pool'].items():
+                pool[key] = pool.get(key, 0) + value
+        return totals, pool
+
+
+registry = MetricsRegistry()
+
+
+def db_pool_stats():
+    """
+    psycopg_pool statistics for every pooled connection this process has
+    opened, as {(alias, stat): value}. Empty unless OPTIONS["pool"] is set.
+    """
+    stats = {}
+    for connection in connections.all(initialized_only=True):
+        # Only the PostgreSQL backend (Django 5.1+, psycopg 3) has a pool.
+        pool = getattr(connection, 'pool', None)
+        if pool is not None:
+            for key, value in pool.get_stats().items():
+                stats[(connection.alias, key)] = value
+    return stats
+
+
+def render_prometheus(totals, pool=None):
+    lines = [
+        '# HELP django_request_duration_seconds Request latency by URL name.',
+        '# TYPE django_request_duration_seconds histogram',
+    ]
+    for route, (buckets, count, seconds, *_) in sorted(totals.items()):
+        cumulative = 0
+        for bound, hits in zip(LATENCY_BUCKETS, buckets):
+            cumulative += hits
+            lines.append(f'django_request_duration_seconds_bucket{{view="{route}",le="{bound}"}} {cumulative}')
+        lines.append(f'django_request_duration_seconds_bucket{{view="{route}",le="+Inf"}} {count}')
+        lines.append(f'django_request_duration_seconds_sum{{view="{route}"}} {seconds:.6f}')
+        lines.append(f'django_request_duration_seconds_count{{view="{route}"}} {count}')
+
+    counters = [
+        (3, 'django_db_queries_total', 'SQL queries executed.'),
+        (4, 'django_db_seconds_total', 'Time spent in SQL.'),
+        (5, 'django_template_seconds_total', 'Time spent rendering templates.'),
+        (6, 'django_cache_hits_total', 'Application cache hits.'),
+        (7, 'django_cache_misses_total', 'Application cache misses.'),
+    ]
+    for index, name, help_text in counters:
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} counter')
+        for route, values in sorted(totals.items()):
+            value = values[index]
+            value = f'{value:.6f}' if isinstance(value, float) else value
+            lines.append(f'{name}{{view="{route}"}} {value}')
+
+    for stat in sorted({key for _, key in pool or {}}):
+        name = f'django_db_pool_{stat}'
+        lines.append(f'# TYPE {name} {"gauge" if stat in POOL_GAUGES else "counter"}')
+        for (alias, key), value in sorted(pool.items()):
+            if key == stat:
+                lines.append(f'{name}{{alias="{alias}"}} {value}')
+    return '\n'.join(lines) + '\n'
+
+
+# ==================== MIDDLEWARE & ENDPOINT ====================
+
+class RequestMetricsMiddleware:
+    """
+    Time each request, its SQL, template rendering and cache lookups. Adds a
+    Server-Timing header and feeds the per-URL-name totals behind /metrics.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.server_timing = getattr(settings, 'METRICS_SERVER_TIMING', True)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        timings = RequestTimings()
+        token = _current.set(timings)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, timings, started)
+
+    async def __acall__(self, request):
+        timings = RequestTimings()
+        token = _current.set(timings)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, timings, started)
+
+    def finish(self, request, response, timings, started):
+        total = time.perf_counter() - started
+        if self.server_timing:
+            response['Server-Timing'] = timings.server_timing(total)
+        match = request.resolver_match
+        # Unmatched paths share one label to keep the series count bounded.
+        registry.observe(match.view_name if match else 'unmatched', total, timings)
+        return response
+
+
+def _metrics_allowed(request):
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token:
+        header = request.headers.get('Authorization', '')
+        return constant_time_compare(header, f'Bearer {token}')
+    return request.user.is_staff
+
+
+def metrics_view(request):
+    """Prometheus text exposition of the request metrics."""
+    if not _metrics_allowed(request):
+        raise Http404
+    if not cache_is_shared():
+        # Each worker would publish to its own cache: the totals would be
+        # whichever worker answered, passed off as the whole site.
+        return HttpResponse(
+            'Metrics need a shared cache backend (DJANGO_CACHE_BACKEND) when running several workers.\n',
+            status=503, content_type='text/plain; charset=utf-8',
+        )
+    return HttpResponse(render_prometheus(*registry.collect()), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,110 @@
+from django.db import migrations
+
+
+POSTGRES_FORWARD = [
+    "ALTER TABLE admin_panel_news ADD COLUMN search_vector tsvector",
+    """
+    CREATE FUNCTION admin_panel_news_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.content, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER admin_panel_news_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, content ON admin_panel_news
+    FOR EACH ROW EXECUTE FUNCTION admin_panel_news_search_vector_update()
+    """,
+    "UPDATE admin_panel_news SET title = title",
+    "CREATE INDEX admin_panel_news_search_vector_gin ON admin_panel_news USING gin (search_vector)",
+]
+
+POSTGRES_REVERSE = [
+    "DROP TRIGGER IF EXISTS admin_panel_news_search_vector_trigger ON admin_panel_news",
+    "DROP FUNCTION IF EXISTS admin_panel_news_search_vector_update()",
+    "ALTER TABLE admin_panel_news DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE admin_panel_news_fts USING fts5(
+        title, content, content='admin_panel_news', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER admin_panel_news_fts_insert AFTER INSERT ON admin_panel_news BEGIN
+        INSERT INTO admin_panel_news_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER admin_panel_news_fts_delete AFTER DELETE ON admin_panel_news BEGIN
+        INSERT INTO admin_panel_news_fts(admin_panel_news_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER admin_panel_news_fts_update AFTER UPDATE OF title, content ON admin_panel_news BEGIN
+        INSERT INTO admin_panel_news_fts(admin_panel_news_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO admin_panel_news_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    "INSERT INTO admin_panel_news_fts(admin_panel_news_fts) VALUES ('rebuild')",
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS admin_panel_news_fts_insert",
+    "DROP TRIGGER IF EXISTS admin_panel_news_fts_delete",
+    "DROP TRIGGER IF EXISTS admin_panel_news_fts_update",
+    "DROP TABLE IF EXISTS admin_panel_news_fts",
+]
+
+
+def _run(schema_editor, statements):
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_FORWARD)
+    elif vendor == 'sqlite':
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+            if not cursor.fetchone()[0]:
+                return
+        _run(schema_editor, SQLITE_FORWARD)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_REVERSE)
+    elif vendor == 'sqlite':
+        _run(schema_editor, SQLITE_REVERSE)
+
+
+class Migration(migrations.Migration):
+    """
+    Full-text index for News search: a trigger-maintained tsvector column with
+    a GIN index on PostgreSQL, an external-content FTS5 table on SQLite.
+    Other backends fall back to icontains in admin_panel.search.
+
+    On SQLite, a later migration that alters or removes a News field makes
+    Django rebuild admin_panel_news (_remake_table), which drops the three
+    FTS triggers with the old table. admin_panel.search.repair_sqlite_fts()
+    puts them back and rebuilds the index from a post_migrate handler, so
+    every migrate run ends with the index in step again.
+    """
+
+    dependencies = [
+        ('admin_panel', '0003_image_optimization_queue'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0004_news_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_team', models.BigIntegerField(default=0)),
+                ('total_courses', models.BigIntegerField(default=0)),
+                ('total_news', models.BigIntegerField(default=0)),
+                ('total_albums', models.BigIntegerField(default=0)),
+                ('total_donations', models.BigIntegerField(default=0)),
+                ('total_messages', models.BigIntegerField(default=0)),
+                ('total_testimonials', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Dashboard Stats',
+            },
+        ),
+    ]
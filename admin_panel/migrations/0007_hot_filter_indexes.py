@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-18 16:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0006_outbound_email'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='alumnievent',
+            index=models.Index(condition=models.Q(('is_visible', True)), fields=['-date'], name='alumni_event_visible_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at'], name='course_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['category', '-uploaded_at', '-id'], name='gallery_category_uploaded_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['-uploaded_at', '-id'], name='gallery_uploaded_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-published_date', '-id'], name='news_published_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(condition=models.Q(('is_approved', True)), fields=['-created_at'], name='testimonial_approved_idx'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 6.0.1 on 2026-10-18 15:47
+
+from django.db import migrations, models
+
+
+IMAGE_FIELDS = {
+    'AlumniEvent': 'image',
+    'AlumniProfile': 'photo',
+    'GalleryImage': 'image',
+}
+
+
+def backfill_digests(apps, schema_editor):
+    # Images that already have renditions went through pipeline version 1.
+    # Hashing every stored file here would make the migration as slow as the
+    # media library is large, so record the name only; image_changed trusts
+    # a matching name while sha256 is None.
+    for model_name, field in IMAGE_FIELDS.items():
+        model = apps.get_model('admin_panel', model_name)
+        batch = []
+        for obj in model.objects.exclude(**{field: ''}).only('pk', field, 'renditions').iterator(chunk_size=2000):
+            if field not in (obj.renditions or {}):
+                continue
+            obj.image_digests = {field: {'name': getattr(obj, field).name, 'sha256': None, 'version': 1}}
+            batch.append(obj)
+            if len(batch) >= 2000:
+                model.objects.bulk_update(batch, ['image_digests'])
+                batch = []
+        model.objects.bulk_update(batch, ['image_digests'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0007_hot_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alumnievent',
+            name='image_digests',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='alumniprofile',
+            name='image_digests',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='galleryimage',
+            name='image_digests',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.RunPython(backfill_digests, migrations.RunPython.noop),
+    ]
@@ -1,21 +1,189 @@
+import logging
+import os
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
-from utils.image_optimizer import optimize_image
+from utils.image_optimizer import PIPELINE_VERSION, ImageTooLarge, file_digest
 from django.utils.text import slugify
 
+logger = logging.getLogger(__name__)
+
 class OptimizedImageModel(models.Model):
+    STATUS_PROCESSING = 'processing'
+    STATUS_READY = 'ready'
+    STATUS_FAILED = 'failed'
+    IMAGE_STATUS_CHOICES = [
+        (STATUS_PROCESSING, 'Processing'),
+        (STATUS_READY, 'Ready'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
     image_fields = []  
 
+    # {field_name: [{"width": 640, "format": "webp", "name": "gallery/renditions/x-1a2b3c4d5e6f-v1-640w.webp"}, ...]}
+    renditions = models.JSONField(default=dict, blank=True, editable=False)
+    image_status = models.CharField(max_length=20, choices=IMAGE_STATUS_CHOICES, default=STATUS_READY, editable=False)
+    # {field_name: {"name": "gallery/x.jpg", "sha256": "...", "version": 1}} of the processed file
+    image_digests = models.JSONField(default=dict, blank=True, editable=False)
+
     class Meta:
         abstract = True
 
     def save(self, *args, **kwargs):
         super().save(*args, **kwargs)
 
-        for field in self.image_fields:
-            image_field = getattr(self, field, None)
-            if image_field and hasattr(image_field, "path"):
-                optimize_image(image_field.path)
+        update_fields = kwargs.get('update_fields')
+        fields = [
+            field for field in self.image_fields
+            if getattr(self, field, None)
+            and (update_fields is None or field in update_fields)
+            and self.image_changed(field)
+        ]
+        if not fields:
+            return
+
+        if getattr(settings, 'IMAGE_OPTIMIZATION_QUEUE', True):
+            # Picked up by the process_image_jobs worker.
+            # Until the worker is done, templates fall back to the original file.
+            for field in fields:
+                ImageOptimizationJob.enqueue(self, field)
+            self.renditions = {k: v for k, v in self.renditions.items() if k not in fields}
+            self.image_digests = {k: v for k, v in self.image_digests.items() if k not in fields}
+            self.image_status = self.STATUS_PROCESSING
+            type(self).objects.filter(pk=self.pk).update(
+                renditions=self.renditions, image_status=self.image_status, image_digests=self.image_digests,
+            )
+        else:
+            from .image_jobs import process_now
+
+            for field in fields:
+                if not hasattr(getattr(self, field), "path"):
+                    continue
+                try:
+                    process_now(self, field)
+                except ImageTooLarge:
+                    logger.exception('Could not optimize %s.%s of %r', type(self).__name__, field, self.pk)
+                    self.mark_image_failed()
+
+    def image_changed(self, field):
+        """
+        True unless the field still holds the exact file the current pipeline
+        version produced. Re-encoding an already optimized JPEG costs CPU
+        and quality, so edits to other fields must not trigger it.
+        """
+        image_field = getattr(self, field)
+        recorded = self.image_digests.get(field)
+        if not recorded or recorded.get('version') != PIPELINE_VERSION or recorded.get('name') != image_field.name:
+            return True
+        if recorded.get('sha256') is None:
+            # Backfilled by migration 0008 from existing renditions: the name is all we know.
+            return False
+        try:
+            return file_digest(image_field.path) != recorded['sha256']
+        except (OSError, NotImplementedError):
+            return True
+
+    @property
+    def is_processing(self):
+        return self.image_status == self.STATUS_PROCESSING
+
+    def apply_renditions(self, field, renditions, job=None):
+        """
+        Store the renditions built for one image field and refresh
+        image_status. `job` is the optimization job delivering them, still
+        open until this returns.
+        """
+        image_field = getattr(self, field)
+        self.renditions = {
+            **self.renditions,
+            field: [
+                {
+                    "width": r["width"],
+                    "format": r["format"],
+                    "name": os.path.relpath(r["path"], image_field.storage.location).replace(os.sep, "/"),
+                }
+                for r in renditions
+            ],
+        }
+        try:
+            digest = file_digest(image_field.path)
+        except (OSError, NotImplementedError, ValueError):
+            self.image_digests = {k: v for k, v in self.image_digests.items() if k != field}
+        else:
+            self.image_digests = {
+                **self.image_digests,
+                field: {"name": image_field.name, "sha256": digest, "version": PIPELINE_VERSION},
+            }
+        open_jobs = ImageOptimizationJob.objects.for_object(self).filter(
+            status__in=[ImageOptimizationJob.STATUS_PENDING, ImageOptimizationJob.STATUS_PROCESSING]
+        )
+        if job is not None:
+            open_jobs = open_jobs.exclude(pk=job.pk)
+        still_open = open_jobs.exists()
+        self.image_status = self.STATUS_PROCESSING if still_open else self.STATUS_READY
+        type(self).objects.filter(pk=self.pk).update(
+            renditions=self.renditions, image_status=self.image_status, image_digests=self.image_digests,
+        )
+
+    def mark_image_failed(self):
+        self.image_status = self.STATUS_FAILED
+        type(self).objects.filter(pk=self.pk).update(image_status=self.image_status)
+
+
+class ImageOptimizationJobQuerySet(models.QuerySet):
+    def for_object(self, obj):
+        return self.filter(content_type=ContentType.objects.get_for_model(obj), object_id=obj.pk)
+
+
+class ImageOptimizationJob(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_PROCESSING = 'processing'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_PROCESSING, 'Processing'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    field_name = models.CharField(max_length=100)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ImageOptimizationJobQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'id']),
+            models.Index(fields=['content_type', 'object_id']),
+        ]
+
+    def __str__(self):
+        return f"{self.content_type.model} #{self.object_id} {self.field_name} ({self.status})"
+
+    @classmethod
+    def enqueue(cls, obj, field_name):
+        job, _ = cls.objects.get_or_create(
+            content_type=ContentType.objects.get_for_model(obj),
+            object_id=obj.pk,
+            field_name=field_name,
+            status=cls.STATUS_PENDING,
+        )
+        return job
+
+    def get_object(self):
+        content_type = ContentType.objects.get_for_id(self.content_type_id)
+        return content_type.get_object_for_this_type(pk=self.object_id)
 
 
 class ManagementTeam(models.Model):
@@ -45,6 +213,9 @@ class Course(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], condition=Q(is_active=True), name='course_active_created_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -67,6 +238,11 @@ class News(models.Model):
     class Meta:
         ordering = ['-published_date']
         verbose_name_plural = 'News'
+        indexes = [
+            models.Index(
+                fields=['-published_date', '-id'], condition=Q(is_published=True), name='news_published_date_idx',
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -101,6 +277,12 @@ class GalleryImage(OptimizedImageModel):
 
     image_fields = ["image"]
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["category", "-uploaded_at", "-id"], name="gallery_category_uploaded_idx"),
+            models.Index(fields=["-uploaded_at", "-id"], name="gallery_uploaded_idx"),
+        ]
+
     def __str__(self):
         return self.title if self.title else f"Image {self.id}"
 
@@ -175,6 +357,9 @@ class Testimonial(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], condition=Q(is_approved=True), name='testimonial_approved_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.designation}"
@@ -221,5 +406,105 @@ class AlumniEvent(OptimizedImageModel):
 
     image_fields = ["image"]
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-date"], condition=Q(is_visible=True), name="alumni_event_visible_idx"),
+        ]
+
+    def __str__(self):
+        return self.event_name
+
+class DashboardStats(models.Model):
+    """
+    Single-row counter cache for the dashboard totals. Kept current by the
+    signals in signals.py; `manage.py reconcile_dashboard_stats` fixes drift.
+    """
+    # model name -> counter field
+    COUNTERS = {
+        'ManagementTeam': 'total_team',
+        'Course': 'total_courses',
+        'News': 'total_news',
+        'GalleryImage': 'total_albums',
+        'DonationDetails': 'total_donations',
+        'ContactMessage': 'total_messages',
+        'Testimonial': 'total_testimonials',
+    }
+
+    total_team = models.BigIntegerField(default=0)
+    total_courses = models.BigIntegerField(default=0)
+    total_news = models.BigIntegerField(default=0)
+    total_albums = models.BigIntegerField(default=0)
+    total_donations = models.BigIntegerField(default=0)
+    total_messages = models.BigIntegerField(default=0)
+    total_testimonials = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = 'Dashboard Stats'
+
+    def __str__(self):
+        return 'Dashboard stats'
+
+    @classmethod
+    def counted_models(cls):
+        from django.apps import apps
+        return {apps.get_model('admin_panel', name): field for name, field in cls.COUNTERS.items()}
+
+    @classmethod
+    def actual_counts(cls):
+        return {field: model.objects.count() for model, field in cls.counted_models().items()}
+
+    @classmethod
+    def load(cls):
+        stats = cls.objects.filter(pk=1).first()
+        if stats is None:
+            stats, _ = cls.objects.get_or_create(pk=1, defaults=cls.actual_counts())
+        return stats
+
+    @classmethod
+    def increment(cls, field, delta=1):
+        updated = cls.objects.filter(pk=1).update(**{field: models.F(field) + delta}, updated_at=timezone.now())
+        if not updated:
+            # First write ever: load() seeds the row from real counts,
+            # which already include this change.
+            cls.load()
+
+    def as_context(self):
+        return {field: getattr(self, field) for field in self.COUNTERS.values()}
+
+
+class OutboundEmail(models.Model):
+    """
+    Transactional outbox for notification emails. Rows are written in the
+    same transaction as the data they describe and delivered by
+    `manage.py send_outbox`.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_SENDING = 'sending'
+    STATUS_SENT = 'sent'
+    STATUS_DEAD = 'dead'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_SENDING, 'Sending'),
+        (STATUS_SENT, 'Sent'),
+        (STATUS_DEAD, 'Dead letter'),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    html_body = models.TextField(blank=True)
+    from_email = models.CharField(max_length=255)
+    to = models.JSONField(default=list)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [models.Index(fields=['status', 'next_attempt_at'])]
+
     def __str__(self):
-        return self.event_name
\ No newline at end of file
+        return f"{self.subject} -> {', '.join(self.to)} ({self.status})"
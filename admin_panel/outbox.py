@@ -0,0 +1,104 @@
+from datetime import timedelta
+
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from .models import OutboundEmail
+
+
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 60 * 60
+
+
+def queue_email(subject, html_message, to, from_email):
+    """
+    Add an HTML email to the outbox. Call it inside the transaction that
+    saves the related data, so the email exists exactly when the data does.
+    """
+    return OutboundEmail.objects.create(
+        subject=subject,
+        body=strip_tags(html_message),
+        html_body=html_message,
+        from_email=from_email,
+        to=list(to),
+    )
+
+
+def requeue_stale(seconds):
+    cutoff = timezone.now() - timedelta(seconds=seconds)
+    return OutboundEmail.objects.filter(
+        status=OutboundEmail.STATUS_SENDING, next_attempt_at__lt=cutoff
+    ).update(status=OutboundEmail.STATUS_PENDING)
+
+
+def claim_batch(batch_size):
+    now = timezone.now()
+    with transaction.atomic():
+        emails = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboundEmail.STATUS_PENDING, next_attempt_at__lte=now)
+            .order_by('id')[:batch_size]
+        )
+        # next_attempt_at doubles as the claim time for requeue_stale().
+        OutboundEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+            status=OutboundEmail.STATUS_SENDING, next_attempt_at=now
+        )
+    return emails
+
+
+def backoff(attempts):
+    return timedelta(seconds=min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS))
+
+
+def deliver_batch(emails, max_attempts=5, connection=None):
+    """
+    Send claimed emails over one reused backend connection.
+    Returns (sent, retried, dead) counts.
+    """
+    sent = retried = dead = 0
+    connection = connection or get_connection()
+    try:
+        connection.open()
+    except Exception as exc:
+        # Nothing can go out; push the whole batch back with a backoff.
+        for email in emails:
+            retried, dead = _record_failure(email, exc, max_attempts, retried, dead)
+        return sent, retried, dead
+
+    try:
+        for email in emails:
+            message = EmailMultiAlternatives(
+                email.subject, email.body, email.from_email, email.to, connection=connection
+            )
+            if email.html_body:
+                message.attach_alternative(email.html_body, 'text/html')
+            try:
+                message.send(fail_silently=False)
+            except Exception as exc:
+                retried, dead = _record_failure(email, exc, max_attempts, retried, dead)
+            else:
+                email.status = OutboundEmail.STATUS_SENT
+                email.sent_at = timezone.now()
+                email.attempts += 1
+                email.last_error = ''
+                email.save(update_fields=['status', 'sent_at', 'attempts', 'last_error'])
+                sent += 1
+    finally:
+        connection.close()
+    return sent, retried, dead
+
+
+def _record_failure(email, exc, max_attempts, retried, dead):
+    email.attempts += 1
+    email.last_error = str(exc)
+    if email.attempts >= max_attempts:
+        email.status = OutboundEmail.STATUS_DEAD
+        dead += 1
+    else:
+        email.status = OutboundEmail.STATUS_PENDING
+        email.next_attempt_at = timezone.now() + backoff(email.attempts)
+        retried += 1
+    email.save(update_fields=['status', 'attempts', 'last_error', 'next_attempt_at'])
+    return retried, dead
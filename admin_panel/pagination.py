@@ -0,0 +1,144 @@
+import base64
+from collections import defaultdict
+from datetime import datetime
+
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+from django.utils.functional import cached_property
+
+
+def encode_cursor(value, pk):
+    raw = f"{value.isoformat()}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """Return (datetime, pk) for a cursor token, or None if it is malformed."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        value, pk = raw.rsplit("|", 1)
+        return datetime.fromisoformat(value), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+class KeysetPage:
+    """
+    One page of a newest-first keyset pagination. Mirrors the parts of
+    Django's Page that the templates use, with opaque cursors instead of
+    page numbers.
+    """
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+def keyset_paginate(queryset, field, per_page, after=None, before=None):
+    """
+    Page through ``queryset`` newest-first on ``(field, id)``.
+
+    ``after`` returns the page following that cursor, ``before`` the page
+    preceding it. Each page is a single indexed range scan with LIMIT
+    per_page + 1. There is no COUNT and no OFFSET, so a deep page costs the
+    same as the first one.
+    """
+    after = decode_cursor(after)
+    before = decode_cursor(before) if not after else None
+
+    if before:
+        value, pk = before
+        rows = list(
+            queryset.filter(Q(**{f"{field}__gt": value}) | Q(**{field: value, "id__gt": pk}))
+            .order_by(field, "id")[:per_page + 1]
+        )
+        has_more = len(rows) > per_page
+        rows = rows[:per_page][::-1]
+        has_newer, has_older = has_more, True
+    else:
+        if after:
+            value, pk = after
+            queryset = queryset.filter(Q(**{f"{field}__lt": value}) | Q(**{field: value, "id__lt": pk}))
+        rows = list(queryset.order_by(f"-{field}", "-id")[:per_page + 1])
+        has_older = len(rows) > per_page
+        rows = rows[:per_page]
+        has_newer = after is not None
+
+    if not rows:
+        return KeysetPage(rows)
+
+    first, last = rows[0], rows[-1]
+    return KeysetPage(
+        rows,
+        next_cursor=encode_cursor(getattr(last, field), last.pk) if has_older else None,
+        previous_cursor=encode_cursor(getattr(first, field), first.pk) if has_newer else None,
+    )
+
+
+class CountedPaginator(Paginator):
+    """A Paginator for a count that is already known, so it never runs COUNT(*)."""
+
+    def __init__(self, count, per_page, **kwargs):
+        super().__init__([], per_page, **kwargs)
+        self._count = count
+
+    @cached_property
+    def count(self):
+        return self._count
+
+
+def partitioned_pages(queryset, partition_field, order_by, groups, per_page):
+    """
+    Fetch one page per group in a single windowed query.
+
+    ``groups`` maps a partition value to (total_count, requested_page_number).
+    Rows are numbered per partition with ROW_NUMBER() OVER (PARTITION BY ...),
+    and each group's page window is selected from that numbering. Returns
+    {partition value: Page}. Invalid page numbers fall back to the first or
+    last page like the dashboard paginators do.
+    """
+    pages = {}
+    windows = defaultdict(list)
+    for key, (count, number) in groups.items():
+        paginator = CountedPaginator(count, per_page)
+        try:
+            number = paginator.validate_number(number)
+        except PageNotAnInteger:
+            number = 1
+        except EmptyPage:
+            number = paginator.num_pages
+        pages[key] = (paginator, number)
+        if count:
+            windows[(number - 1) * per_page].append(key)
+
+    rows = defaultdict(list)
+    if windows:
+        condition = Q()
+        for offset, keys in windows.items():
+            condition |= Q(**{f"{partition_field}__in": keys, "row_number__gt": offset, "row_number__lte": offset + per_page})
+        numbered = queryset.annotate(
+            row_number=Window(RowNumber(), partition_by=[F(partition_field)], order_by=order_by)
+        ).filter(condition).order_by(partition_field, "row_number")
+        for obj in numbered:
+            rows[getattr(obj, partition_field)].append(obj)
+
+    return {key: Page(rows[key], number, paginator) for key, (paginator, number) in pages.items()}
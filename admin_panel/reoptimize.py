@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import models
+
+from utils.image_optimizer import reoptimize_file
+
+from .storage import CONTENT_ROOT, field_policy, upload_policy
+
+
+def policy_key(policy):
+    return hashlib.md5(json.dumps(policy, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def db_images():
+    """(name, policy) for every stored ImageField value, streamed model by model."""
+    for model in apps.get_models():
+        for field in model._meta.get_fields():
+            if not isinstance(field, models.ImageField):
+                continue
+            policy = field_policy(field)
+            if policy is None:
+                continue
+            names = (
+                model._default_manager.exclude(**{field.name: ''})
+                .exclude(**{f'{field.name}__isnull': True})
+                # Rewriting a content-addressed file would break its address;
+                # those went through the pipeline on upload anyway.
+                .exclude(**{f'{field.name}__startswith': CONTENT_ROOT})
+                .order_by('pk')
+                .values_list(field.name, flat=True)
+            )
+            for name in names.iterator(chunk_size=2000):
+                yield name, policy
+
+
+def media_images(root=None):
+    """(name, policy) for every image file under MEDIA_ROOT, renditions excluded."""
+    root = os.fspath(root or settings.MEDIA_ROOT)
+    for directory, dirnames, filenames in os.walk(root):
+        # Pruned in place so os.walk never descends into them.
+        dirnames[:] = sorted(
+            d for d in dirnames
+            if d != 'renditions' and not (directory == root and d == CONTENT_ROOT.rstrip('/'))
+        )
+        for filename in sorted(filenames):
+            name = os.path.relpath(os.path.join(directory, filename), root).replace(os.sep, '/')
+            policy = upload_policy(name)
+            if policy is not None:
+                yield name, policy
+
+
+class Manifest:
+    """
+    Append-only JSON lines log of finished files, so an interrupted run picks
+    up where it stopped. An entry only counts for the policy it was made
+    under: change a field's policy and its files are processed again.
+    """
+
+    def __init__(self, path):
+        self.done = set()
+        if os.path.exists(path):
+            with open(path) as fh:
+                for line in fh:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # a line cut short by a crash
+                    self.done.add((entry['name'], entry['policy']))
+        self._fh = open(path, 'a')
+
+    def __contains__(self, item):
+        return item in self.done
+
+    def record(self, name, key, status, before, after):
+        self._fh.write(json.dumps({'name': name, 'policy': key, 'status': status, 'before': before, 'after': after}) + '\n')
+        self._fh.flush()
+
+    def close(self):
+        self._fh.close()
+
+
+class ByteThrottle:
+    """Sleeps as needed to keep average disk traffic under `limit` bytes per second (0 = no limit)."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.total = 0
+        self.started = time.monotonic()
+
+    def add(self, nbytes):
+        if not self.limit:
+            return
+        self.total += nbytes
+        ahead = self.total / self.limit - (time.monotonic() - self.started)
+        if ahead > 0:
+            time.sleep(ahead)
+
+
+def reoptimize(pool, workers, images, manifest=None, dry_run=False, min_saving=0.05, throttle=None, log=None):
+    """
+    Re-run the upload policy over stored images on a process pool, keeping
+    at most two files per worker in flight. Files already in the manifest
+    under the same policy are skipped. Returns a dict of counters.
+    """
+    log = log or (lambda message: None)
+    throttle = throttle or ByteThrottle(0)
+    seen = manifest.done if manifest is not None else set()
+    stats = dict.fromkeys(
+        ('files', 'changed', 'unchanged', 'skipped', 'missing', 'failed', 'bytes_before', 'bytes_after'), 0
+    )
+    in_flight = {}
+
+    def collect(futures):
+        for future in futures:
+            name, key = in_flight.pop(future)
+            try:
+                before, after = future.result()
+            except FileNotFoundError:
+                stats['missing'] += 1
+                status, before, after = 'missing', 0, 0
+            except Exception as exc:
+                stats['failed'] += 1
+                log(f'Failed {name}: {exc}')
+                continue  # not recorded, so the next run tries again
+            else:
+                status = 'changed' if after != before else 'unchanged'
+                stats[status] += 1
+                stats['bytes_before'] += before
+                stats['bytes_after'] += after
+                # Read once, written once more when it changed.
+                throttle.add(before + (after if status == 'changed' and not dry_run else 0))
+            stats['files'] += 1
+            if manifest is not None and not dry_run:
+                manifest.record(name, key, status, before, after)
+            if stats['files'] % 500 == 0:
+                log(progress(stats))
+
+    for name, policy in images:
+        key = policy_key(policy)
+        if (name, key) in seen:
+            stats['skipped'] += 1
+            continue
+        seen.add((name, key))
+        if len(in_flight) >= workers * 2:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            collect(done)
+        future = pool.submit(
+            reoptimize_file,
+            default_storage.path(name),
+            max_size=tuple(policy['max_size']),
+            quality=policy.get('quality', 75),
+            min_saving=min_saving,
+            dry_run=dry_run,
+        )
+        in_flight[future] = (name, key)
+    collect(wait(in_flight).done)
+    return stats
+
+
+def progress(stats):
+    saved = stats['bytes_before'] - stats['bytes_after']
+    share = saved / stats['bytes_before'] * 100 if stats['bytes_before'] else 0
+    return (
+        f"{stats['files']} files: {stats['changed']} changed, {stats['unchanged']} unchanged, "
+        f"{stats['missing']} missing, {stats['failed']} failed, {stats['skipped']} already done; "
+        f"{stats['bytes_before'] / 1024 / 1024:.1f} MB → {stats['bytes_after'] / 1024 / 1024:.1f} MB "
+        f"({saved / 1024 / 1024:.1f} MB, {share:.0f}% saved)"
+    )
@@ -0,0 +1,136 @@
+from django.db import connections, transaction
+from django.db.models import BooleanField, FloatField, Q, TextField
+from django.db.models.expressions import RawSQL
+
+from .models import News
+
+
+# Markers placed around matched words by the database; the highlight
+# filter escapes the snippet and turns them into <mark> tags.
+HIGHLIGHT_START = '\x02'
+HIGHLIGHT_STOP = '\x03'
+
+NEWS_FTS_TABLE = 'admin_panel_news_fts'
+
+# The triggers that keep the FTS5 table in step with admin_panel_news, as
+# created by migration 0004.
+NEWS_FTS_TRIGGERS = {
+    'admin_panel_news_fts_insert': """
+        CREATE TRIGGER admin_panel_news_fts_insert AFTER INSERT ON admin_panel_news BEGIN
+            INSERT INTO admin_panel_news_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+        END
+    """,
+    'admin_panel_news_fts_delete': """
+        CREATE TRIGGER admin_panel_news_fts_delete AFTER DELETE ON admin_panel_news BEGIN
+            INSERT INTO admin_panel_news_fts(admin_panel_news_fts, rowid, title, content)
+            VALUES ('delete', old.id, old.title, old.content);
+        END
+    """,
+    'admin_panel_news_fts_update': """
+        CREATE TRIGGER admin_panel_news_fts_update AFTER UPDATE OF title, content ON admin_panel_news BEGIN
+            INSERT INTO admin_panel_news_fts(admin_panel_news_fts, rowid, title, content)
+            VALUES ('delete', old.id, old.title, old.content);
+            INSERT INTO admin_panel_news_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+        END
+    """,
+}
+
+_fts_tables = {}
+
+
+def has_sqlite_fts(connection):
+    return NEWS_FTS_TABLE in connection.introspection.table_names()
+
+
+def _has_sqlite_fts(alias):
+    if alias not in _fts_tables:
+        _fts_tables[alias] = has_sqlite_fts(connections[alias])
+    return _fts_tables[alias]
+
+
+def repair_sqlite_fts(connection):
+    """
+    Recreate any missing FTS5 sync trigger and rebuild the index. SQLite
+    drops a table's triggers along with the table, and Django's SQLite
+    schema editor rebuilds admin_panel_news for most later field changes
+    (_remake_table), after which the index silently stops following edits.
+    Runs after every migrate (see signals.repair_search_index), so requests
+    never write. Returns True if anything was repaired.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = %s", [News._meta.db_table]
+        )
+        present = {row[0] for row in cursor.fetchall()}
+        missing = [name for name in NEWS_FTS_TRIGGERS if name not in present]
+        if not missing:
+            return False
+        with transaction.atomic(using=connection.alias):
+            for name in missing:
+                cursor.execute(NEWS_FTS_TRIGGERS[name])
+            cursor.execute(f"INSERT INTO {NEWS_FTS_TABLE}({NEWS_FTS_TABLE}) VALUES ('rebuild')")
+    return True
+
+
+def _fts5_query(query):
+    # Quote every term so user input can never be read as FTS5 syntax.
+    terms = [term.replace('"', '""') for term in query.split()]
+    return ' '.join(f'"{term}"' for term in terms if term)
+
+
+def _postgres_search(queryset, query):
+    table = News._meta.db_table
+    tsquery = "websearch_to_tsquery('english', %s)"
+    options = f'StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxWords=35, MinWords=15'
+    return (
+        queryset
+        .alias(search_match=RawSQL(f"{table}.search_vector @@ {tsquery}", [query], output_field=BooleanField()))
+        .filter(search_match=True)
+        .annotate(
+            search_rank=RawSQL(f"ts_rank_cd({table}.search_vector, {tsquery})", [query], output_field=FloatField()),
+            search_snippet=RawSQL(
+                f"ts_headline('english', {table}.content, {tsquery}, %s)", [query, options], output_field=TextField()
+            ),
+        )
+        .order_by('-search_rank', '-published_date', '-id')
+    )
+
+
+def _sqlite_search(queryset, query):
+    table = News._meta.db_table
+    match = _fts5_query(query)
+    if not match:
+        return queryset.none()
+    lookup = f"FROM {NEWS_FTS_TABLE} WHERE {NEWS_FTS_TABLE} MATCH %s AND {NEWS_FTS_TABLE}.rowid = {table}.id"
+    return (
+        queryset
+        .alias(search_match=RawSQL(
+            f"{table}.id IN (SELECT rowid FROM {NEWS_FTS_TABLE} WHERE {NEWS_FTS_TABLE} MATCH %s)",
+            [match], output_field=BooleanField(),
+        ))
+        .filter(search_match=True)
+        .annotate(
+            # bm25() is lower-is-better; title matches weigh 10x body matches.
+            search_rank=RawSQL(f"(SELECT -bm25({NEWS_FTS_TABLE}, 10.0, 1.0) {lookup})", [match], output_field=FloatField()),
+            search_snippet=RawSQL(
+                f"(SELECT snippet({NEWS_FTS_TABLE}, 1, %s, %s, '…', 30) {lookup})",
+                [HIGHLIGHT_START, HIGHLIGHT_STOP, match], output_field=TextField(),
+            ),
+        )
+        .order_by('-search_rank', '-published_date', '-id')
+    )
+
+
+def search_news(queryset, query):
+    """
+    Filter a News queryset by a free-text query using the database's full-text
+    index. Results are ordered by relevance and carry ``search_rank`` and a
+    ``search_snippet`` with highlight markers. Falls back to icontains when no
+    index exists for the current backend.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor == 'postgresql':
+        return _postgres_search(queryset, query)
+    if connection.vendor == 'sqlite' and _has_sqlite_fts(queryset.db):
+        return _sqlite_search(queryset, query)
+    return queryset.filter(Q(title__icontains=query) | Q(content__icontains=query))
@@ -0,0 +1,120 @@
+import logging
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connections, models
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_init, post_migrate, post_save
+
+from utils.image_optimizer import ImageTooLarge
+
+from .cache import bump_content_version, invalidate_page_cache
+from .image_jobs import process_now
+from .metrics import install_sql_timing
+from .models import (
+    AlumniEvent, AlumniProfile, Category, Course, DashboardStats, GalleryImage, ImageOptimizationJob,
+    ManagementTeam, News, OptimizedImageModel, Testimonial,
+)
+from .search import has_sqlite_fts, repair_sqlite_fts
+from .storage import field_policy
+
+logger = logging.getLogger(__name__)
+
+
+# Models whose rows are rendered on the cached public pages.
+PAGE_CACHE_MODELS = [Course, News, Testimonial, GalleryImage, ManagementTeam]
+
+# Models with a content version used to key shared cached data and
+# HTTP validators.
+CONTENT_VERSION_MODELS = [
+    Course, News, Category, GalleryImage, ManagementTeam, Testimonial, AlumniProfile, AlumniEvent,
+]
+
+
+def invalidate_public_pages(sender, **kwargs):
+    invalidate_page_cache()
+
+
+def bump_model_version(sender, **kwargs):
+    bump_content_version(sender)
+
+
+def optimized_image_fields(model):
+    return [
+        field.name for field in model._meta.get_fields()
+        if isinstance(field, models.ImageField) and field_policy(field) is not None
+    ]
+
+
+# ImageFields optimized by the image worker on models without renditions;
+# OptimizedImageModel queues its own fields in save().
+IMAGE_FIELDS = {
+    model: optimized_image_fields(model) for model in apps.get_models()
+    if not issubclass(model, OptimizedImageModel) and optimized_image_fields(model)
+}
+
+
+def _stored_name(instance, field):
+    # Read from __dict__ so deferred fields are not loaded just for this.
+    value = instance.__dict__.get(field)
+    return getattr(value, 'name', value)
+
+
+def remember_image_names(sender, instance, **kwargs):
+    instance._stored_image_names = {field: _stored_name(instance, field) for field in IMAGE_FIELDS[sender]}
+
+
+def queue_image_optimization(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    before = getattr(instance, '_stored_image_names', {})
+    for field in IMAGE_FIELDS[sender]:
+        name = _stored_name(instance, field)
+        if not name or name == before.get(field) or (update_fields is not None and field not in update_fields):
+            continue
+        if getattr(settings, 'IMAGE_OPTIMIZATION_QUEUE', True):
+            ImageOptimizationJob.enqueue(instance, field)
+        else:
+            try:
+                process_now(instance, field)
+            except ImageTooLarge:
+                logger.exception('Could not optimize %s.%s of %r', sender.__name__, field, instance.pk)
+    remember_image_names(sender, instance)
+
+
+def repair_search_index(sender, using, **kwargs):
+    connection = connections[using]
+    if connection.vendor == 'sqlite' and has_sqlite_fts(connection):
+        repair_sqlite_fts(connection)
+
+
+def count_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        DashboardStats.increment(DashboardStats.COUNTERS[sender.__name__])
+
+
+def count_deleted(sender, instance, **kwargs):
+    DashboardStats.increment(DashboardStats.COUNTERS[sender.__name__], -1)
+
+
+for model in PAGE_CACHE_MODELS:
+    post_save.connect(invalidate_public_pages, sender=model, dispatch_uid=f'page_cache_save_{model.__name__}')
+    post_delete.connect(invalidate_public_pages, sender=model, dispatch_uid=f'page_cache_delete_{model.__name__}')
+
+for model in CONTENT_VERSION_MODELS:
+    post_save.connect(bump_model_version, sender=model, dispatch_uid=f'content_version_save_{model.__name__}')
+    post_delete.connect(bump_model_version, sender=model, dispatch_uid=f'content_version_delete_{model.__name__}')
+
+for model in IMAGE_FIELDS:
+    post_init.connect(remember_image_names, sender=model, dispatch_uid=f'image_names_init_{model.__name__}')
+    post_save.connect(queue_image_optimization, sender=model, dispatch_uid=f'image_queue_save_{model.__name__}')
+
+for model in DashboardStats.counted_models():
+    post_save.connect(count_created, sender=model, dispatch_uid=f'dashboard_stats_save_{model.__name__}')
+    post_delete.connect(count_deleted, sender=model, dispatch_uid=f'dashboard_stats_delete_{model.__name__}')
+
+post_migrate.connect(
+    repair_search_index, sender=apps.get_app_config('admin_panel'), dispatch_uid='news_search_index_repair',
+)
+
+connection_created.connect(install_sql_timing, dispatch_uid='request_metrics_sql')
@@ -0,0 +1,232 @@
+import hashlib
+import logging
+import os
+
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.base import File
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.db import models
+from PIL import Image
+
+from utils.image_optimizer import ImageTooLarge, check_image_size
+
+
+logger = logging.getLogger(__name__)
+
+# upload_to directory -> policy, filled in by register_image_fields().
+_policies = {}
+# (model, field name) of every ImageField, for deduplicate_stored_media().
+_image_fields = []
+
+# Content-addressed files live under here, named after their SHA-256.
+CONTENT_ROOT = 'content/'
+
+
+def field_policy(field):
+    """The upload policy of one ImageField: the site default with the field's overrides on top."""
+    overrides = settings.IMAGE_FIELD_POLICIES.get(f'{field.model._meta.label}.{field.name}', {})
+    if overrides is None:
+        return None
+    return {**settings.IMAGE_UPLOAD_POLICY, **overrides}
+
+
+def register_image_fields():
+    """
+    Record the policy of every ImageField on every installed model, keyed by
+    its upload_to directory. Called from AdminPanelConfig.ready(), so new
+    models are covered without opting in.
+    """
+    _policies.clear()
+    _image_fields.clear()
+    for model in apps.get_models():
+        for field in model._meta.get_fields():
+            if isinstance(field, models.ImageField):
+                _image_fields.append((model, field.name))
+            if isinstance(field, models.ImageField) and isinstance(field.upload_to, str):
+                # strftime placeholders ('%Y/%m/') come after the fixed part.
+                prefix = field.upload_to.split('%', 1)[0]
+                _policies[prefix] = field_policy(field)
+
+
+def upload_policy(name):
+    """Policy for a file about to be stored as `name`, or None to store it untouched."""
+    matches = [prefix for prefix in _policies if name.startswith(prefix)]
+    if matches:
+        return _policies[max(matches, key=len)]
+    # Images saved outside a registered field still get the default.
+    if os.path.splitext(name)[1].lower() in Image.registered_extensions():
+        return settings.IMAGE_UPLOAD_POLICY
+    return None
+
+
+def is_content_addressable(name):
+    # Private files keep their upload path: serve_media checks access by prefix.
+    return not any(name.startswith(prefix) for prefix in getattr(settings, 'MEDIA_PRIVATE_PREFIXES', []))
+
+
+def content_name(digest, extension):
+    return f'{CONTENT_ROOT}{digest[:2]}/{digest[2:4]}/{digest}{extension.lower()}'
+
+
+class ImageRejected(SuspiciousFileOperation):
+    """An image upload refused before it is stored; Django answers 400."""
+
+
+class ImagePipelineStorage(FileSystemStorage):
+    """
+    Media storage for the image pipeline. Uploads are stored as they come,
+    after a header-only check that refuses images over MAX_IMAGE_SIDE or
+    MAX_IMAGE_PIXELS. Resizing and re-encoding to IMAGE_UPLOAD_POLICY and
+    IMAGE_FIELD_POLICIES happen off the request, in the ImageOptimizationJob
+    worker, which hands its result back through store_optimized().
+    """
+
+    def save(self, name, content, max_length=None):
+        self.check(name, content)
+        return super().save(name, content, max_length)
+
+    def check(self, name, content):
+        if name and content is not None and upload_policy(name) is not None:
+            try:
+                check_image_size(content)
+            except ImageTooLarge as exc:
+                logger.warning('Rejected upload %s: %s', name, exc)
+                raise ImageRejected(str(exc)) from exc
+
+    def store_optimized(self, name, path):
+        """
+        Replace the stored file `name` with the optimized file at `path`
+        (which is consumed) and return the name it ends up under. The
+        extension follows the new format; same-format results replace the
+        file in place, atomically.
+        """
+        stem, old_extension = os.path.splitext(name)
+        extension = os.path.splitext(path)[1]
+        if Image.registered_extensions().get(old_extension.lower()) != \
+                Image.registered_extensions().get(extension.lower()):
+            new_name = self.get_available_name(f'{stem}{extension}')
+        else:
+            new_name = name
+        before = self.size(name)
+        os.replace(path, self.path(new_name))
+        logger.info('Optimized %s: %.1f KB → %.1f KB', new_name, before / 1024, self.size(new_name) / 1024)
+        return new_name
+
+
+class ContentAddressedStorage(ImagePipelineStorage):
+    """
+    ImagePipelineStorage that keeps each distinct file once, at
+    content/ab/cd/<sha256>.<ext>. The same photo uploaded to the gallery,
+    a news post and an alumni event is written once and shared, and since a
+    name can never hold different bytes, serve_media marks these URLs
+    immutable.
+
+    Rows share files, so delete() never removes a content-addressed file:
+    gc_media sweeps the ones nothing references any more, in one pass
+    instead of a query per field on every delete. Private prefixes
+    (MEDIA_PRIVATE_PREFIXES) are stored under their upload path as before.
+    """
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        self.check(name, content)
+        if not is_content_addressable(name):
+            return FileSystemStorage.save(self, name, content, max_length)
+        return self.store_by_content(name, content)
+
+    def store_optimized(self, name, path):
+        if not name.startswith(CONTENT_ROOT):
+            return super().store_optimized(name, path)
+        # The raw upload keeps its address (other rows may share it) and is
+        # swept by gc_media once nothing points at it.
+        try:
+            with open(path, 'rb') as fh:
+                return self.store_by_content(path, File(fh))
+        finally:
+            os.remove(path)
+
+    def store_by_content(self, name, content):
+        """Store `content` under its content address (keeping the extension of `name`) and return that name."""
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        name = content_name(digest.hexdigest(), os.path.splitext(name)[1])
+        if self.exists(name):
+            # Refresh the mtime so gc_media's grace period covers the new
+            # reference too: its row may not be committed before the sweep.
+            try:
+                os.utime(self.path(name))
+            except FileNotFoundError:
+                pass  # swept in between; store it again
+            else:
+                return name
+        # Two identical uploads racing here leave the loser under a suffixed
+        # name: a duplicate, but never a wrong file.
+        return self._save(name, content)
+
+    def delete(self, name):
+        if name and name.startswith(CONTENT_ROOT):
+            return
+        super().delete(name)
+
+
+def deduplicate_stored_media(dry_run=False, log=None):
+    """
+    Move files stored under their upload names into the content-addressed
+    layout and point the rows at them. The old files stay where they are
+    until gc_media sweeps them, so pages cached with the old URLs keep
+    working. Returns a dict of counters.
+    """
+    from .cache import bump_content_version, invalidate_page_cache
+
+    log = log or (lambda message: None)
+    storage = default_storage
+    stats = dict.fromkeys(('rows', 'files', 'duplicates', 'missing', 'bytes_saved'), 0)
+    moved = {}  # old name -> content name
+    targets = set()
+    for model, field in _image_fields:
+        rows = (
+            model._default_manager.exclude(**{field: ''})
+            .exclude(**{f'{field}__isnull': True})
+            .exclude(**{f'{field}__startswith': CONTENT_ROOT})
+            .order_by('pk')
+            .values_list('pk', field)
+        )
+        field_rows = 0
+        for pk, name in rows.iterator(chunk_size=2000):
+            if not is_content_addressable(name):
+                continue
+            if name not in moved:
+                try:
+                    with storage.open(name) as fh:
+                        digest = hashlib.sha256()
+                        for chunk in fh.chunks():
+                            digest.update(chunk)
+                        target = content_name(digest.hexdigest(), os.path.splitext(name)[1])
+                        if target in targets or storage.exists(target):
+                            stats['duplicates'] += 1
+                            stats['bytes_saved'] += fh.size
+                        elif not dry_run:
+                            target = storage.store_by_content(name, fh)
+                except FileNotFoundError:
+                    stats['missing'] += 1
+                    continue
+                moved[name] = target
+                targets.add(target)
+                stats['files'] += 1
+            stats['rows'] += 1
+            field_rows += 1
+            if not dry_run:
+                model._default_manager.filter(pk=pk).update(**{field: moved[name]})
+        if field_rows:
+            log(f'{model._meta.label}.{field}: {field_rows} rows')
+            if not dry_run:
+                bump_content_version(model)
+    if not dry_run and stats['rows']:
+        invalidate_page_cache()
+    return stats
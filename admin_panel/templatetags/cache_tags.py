@@ -0,0 +1,74 @@
+import hashlib
+
+from django import template
+from django.apps import apps
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import cache
+
+from admin_panel.cache import CONTENT_CACHE_TIMEOUT, content_version
+from admin_panel.metrics import record_cache
+
+register = template.Library()
+
+
+def _static_version():
+    # Fragments embed hashed static URLs, so a new collectstatic needs new keys.
+    return getattr(staticfiles_storage, "manifest_hash", "") or ""
+
+
+class ContentCacheNode(template.Node):
+    def __init__(self, nodelist, name, models, vary_on):
+        self.nodelist = nodelist
+        self.name = name
+        self.models = models
+        self.vary_on = vary_on
+
+    def render(self, context):
+        name = self.name.resolve(context)
+        vary = "|".join(str(var.resolve(context)) for var in self.vary_on)
+        key = "fragment:{}:{}:{}:{}".format(
+            name,
+            content_version(*self.models) if self.models else "0",
+            _static_version(),
+            hashlib.md5(vary.encode()).hexdigest(),
+        )
+        content = cache.get(key)
+        record_cache(content is not None)
+        if content is None:
+            content = self.nodelist.render(context)
+            cache.set(key, content, CONTENT_CACHE_TIMEOUT)
+        return content
+
+
+@register.tag
+def content_cache(parser, token):
+    """
+    Cache a template fragment until the content of the named models changes.
+
+        {% content_cache "site-header" models="Course News" %}
+            ...
+        {% endcontent_cache %}
+
+    The key carries each model's content version (bumped by the signals in
+    signals.py), so an edit produces a fresh fragment on the next render and
+    nothing has to be deleted. Extra arguments are varied on, like the
+    built-in {% cache %} tag. Only wrap markup that is the same for every
+    visitor: no CSRF tokens, user names or messages.
+    """
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' needs a fragment name.")
+    models = []
+    vary_on = []
+    for bit in bits[2:]:
+        if bit.startswith("models="):
+            labels = bit[len("models="):].strip("\"'").split()
+            try:
+                models = [apps.get_model("admin_panel", label) for label in labels]
+            except LookupError as exc:
+                raise template.TemplateSyntaxError(f"'{bits[0]}': {exc}")
+        else:
+            vary_on.append(parser.compile_filter(bit))
+    nodelist = parser.parse(("endcontent_cache",))
+    parser.delete_first_token()
+    return ContentCacheNode(nodelist, parser.compile_filter(bits[1]), models, vary_on)
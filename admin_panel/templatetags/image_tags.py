@@ -0,0 +1,36 @@
+from django import template
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+
+register = template.Library()
+
+
+@register.simple_tag
+def responsive_image(obj, field="image", sizes="100vw", **attrs):
+    """
+    Render an image field as <picture> with WebP and JPEG srcsets built from
+    the model's renditions, falling back to a plain <img> of the original.
+
+    {% responsive_image item "image" sizes="(max-width: 767px) 100vw, 33vw" alt=item.title %}
+    """
+    image = getattr(obj, field, None)
+    if not image:
+        return ""
+
+    renditions = (getattr(obj, "renditions", None) or {}).get(field) or []
+    attrs = flatatt(attrs)
+    if not renditions:
+        return format_html('<img src="{}"{}>', image.url, attrs)
+
+    def srcset(fmt):
+        return ", ".join(
+            f"{image.storage.url(r['name'])} {r['width']}w" for r in renditions if r["format"] == fmt
+        )
+
+    jpeg = [r for r in renditions if r["format"] == "jpeg"]
+    fallback = image.storage.url(jpeg[-1]["name"]) if jpeg else image.url
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}" sizes="{}">'
+        '<img src="{}" srcset="{}" sizes="{}"{}></picture>',
+        srcset("webp"), sizes, fallback, srcset("jpeg"), sizes, attrs,
+    )
@@ -0,0 +1,16 @@
+from django import template
+from django.utils.html import escape, strip_tags
+from django.utils.safestring import mark_safe
+
+from admin_panel.search import HIGHLIGHT_START, HIGHLIGHT_STOP
+
+register = template.Library()
+
+
+@register.filter
+def highlight(snippet):
+    """Escape a search snippet and turn its match markers into <mark> tags."""
+    if not snippet:
+        return ""
+    text = escape(strip_tags(snippet))
+    return mark_safe(text.replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_STOP, "</mark>"))
@@ -1,3 +1,743 @@
-from django.test import TestCase
+import asyncio
+import io
+import itertools
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache, caches
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.mail import get_connection
+from django.core.management import call_command
+from django.core.management.sql import emit_post_migrate_signal
+from django.db import connection, transaction
+from django.db.models import F
+from django.http import HttpResponse
+from django.template import Context, Template, TemplateSyntaxError, engines
+from django.test import AsyncClient, RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from PIL import Image
+
+from utils.image_optimizer import ImageTooLarge, check_image_size, open_bounded
+
+from .async_queries import gather_queries
+from .cache import PAGE_CACHE_GENERATION_KEY, cache_public_page, invalidate_page_cache
+from .checks import check_static_manifest
+from .context_processors import global_navbar_data
+from .gallery_upload import ingest_gallery_images
+from .image_jobs import claim_jobs, run_jobs
+from .media_gc import collect_garbage
+from .metrics import METRICS_WORKERS_KEY, MetricsRegistry, RequestTimings, render_prometheus
+from .models import (
+    AlumniProfile, Category, Course, DashboardStats, GalleryImage, ImageOptimizationJob, News, OutboundEmail,
+)
+from .outbox import claim_batch, deliver_batch, queue_email
+from .pagination import decode_cursor, encode_cursor, keyset_paginate, partitioned_pages
+from .reoptimize import Manifest, media_images, reoptimize
+from .search import HIGHLIGHT_START, NEWS_FTS_TRIGGERS, has_sqlite_fts, search_news
+from .storage import CONTENT_ROOT, ImageRejected
+
+
+def image_upload(name='photo.jpg', color='red', size=(64, 48)):
+    buf = io.BytesIO()
+    Image.new('RGB', size, color).save(buf, 'JPEG')
+    return SimpleUploadedFile(name, buf.getvalue(), content_type='image/jpeg')
+
+
+class TempMediaMixin:
+    """Point MEDIA_ROOT at a throwaway directory for the test."""
+
+    def setUp(self):
+        super().setUp()
+        self.media_root = tempfile.mkdtemp(prefix='darul-fatheh-media-')
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+
+class ServeMediaTests(TempMediaMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        os.makedirs(os.path.join(self.media_root, 'donation_proofs'))
+        os.makedirs(os.path.join(self.media_root, 'gallery'))
+        with open(os.path.join(self.media_root, 'donation_proofs', 'receipt.png'), 'wb') as fh:
+            fh.write(b'private')
+        with open(os.path.join(self.media_root, 'gallery', 'public.jpg'), 'wb') as fh:
+            fh.write(b'public')
+
+    def test_public_file_is_served(self):
+        response = self.client.get('/media/gallery/public.jpg')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), b'public')
+
+    def test_private_prefix_hidden_from_anonymous_users(self):
+        for path in (
+            '/media/donation_proofs/receipt.png',
+            '/media/./donation_proofs/receipt.png',
+            '/media/gallery/../donation_proofs/receipt.png',
+            '/media/gallery/%2e%2e/donation_proofs/receipt.png',
+            '/media/donation_proofs//receipt.png',
+        ):
+            with self.subTest(path=path):
+                self.assertEqual(self.client.get(path).status_code, 404)
+
+    def test_accel_redirect_is_percent_encoded(self):
+        with open(os.path.join(self.media_root, 'gallery', 'صورة 1.jpg'), 'wb') as fh:
+            fh.write(b'public')
+        with override_settings(MEDIA_ACCEL_REDIRECT='/protected-media/'):
+            response = self.client.get('/media/gallery/%D8%B5%D9%88%D8%B1%D8%A9%201.jpg')
+        self.assertEqual(response['X-Accel-Redirect'], '/protected-media/gallery/%D8%B5%D9%88%D8%B1%D8%A9%201.jpg')
+
+    def test_traversal_out_of_media_root_is_refused(self):
+        self.assertEqual(self.client.get('/media/../settings.py').status_code, 404)
+
+    def test_private_file_served_to_signed_in_users_without_shared_caching(self):
+        self.client.force_login(User.objects.create_user('staff', password='x'))
+        response = self.client.get('/media/donation_proofs/receipt.png')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Cache-Control'].startswith('private'))
+
+
+class PageCacheTests(TestCase):
+    def setUp(self):
+        invalidate_page_cache()
+        self.calls = 0
+
+        @cache_public_page
+        def view(request):
+            self.calls += 1
+            return HttpResponse(f'render {self.calls}')
+
+        self.view = view
+        self.factory = RequestFactory()
+
+    def get(self, path='/page/'):
+        request = self.factory.get(path)
+        request.user = mock.Mock(is_authenticated=False)
+        return self.view(request)
+
+    def test_second_request_is_a_hit(self):
+        self.assertEqual(self.get()['X-Page-Cache'], 'MISS')
+        response = self.get()
+        self.assertEqual(response['X-Page-Cache'], 'HIT')
+        self.assertEqual(response.content, b'render 1')
+        self.assertEqual(self.calls, 1)
+
+    def test_saving_a_public_model_invalidates_the_cache(self):
+        self.get()
+        News.objects.create(title='Open day', content='Doors open at nine.')
+        response = self.get()
+        self.assertEqual(response['X-Page-Cache'], 'MISS')
+        self.assertEqual(response.content, b'render 2')
+
+    def test_expired_generation_does_not_revive_stale_pages(self):
+        self.get()
+        News.objects.create(title='Open day', content='Doors open at nine.')
+        self.get()
+        # The counter expiring or being evicted must not lead back to a
+        # generation that older pages are stored under.
+        cache.delete(PAGE_CACHE_GENERATION_KEY)
+        response = self.get()
+        self.assertEqual(response['X-Page-Cache'], 'MISS')
+        self.assertEqual(response.content, b'render 3')
+
+    def test_signed_in_users_bypass_the_cache(self):
+        self.get()
+        request = self.factory.get('/page/')
+        request.user = mock.Mock(is_authenticated=True)
+        self.view(request)
+        self.assertEqual(self.calls, 2)
+
+
+class NavbarCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.course = Course.objects.create(title='Hifz', description='Memorisation', duration='3 years')
+        self.request = RequestFactory().get('/')
+
+    def test_nothing_is_loaded_until_a_template_reads_it(self):
+        with self.assertNumQueries(0):
+            global_navbar_data(self.request)
+
+    def test_second_request_reads_the_cache(self):
+        self.assertEqual(list(global_navbar_data(self.request)['navbar_courses']), [self.course])
+        with self.assertNumQueries(0):
+            self.assertEqual(list(global_navbar_data(self.request)['navbar_courses']), [self.course])
+
+    def test_saving_a_course_refreshes_the_navbar(self):
+        list(global_navbar_data(self.request)['navbar_courses'])
+        self.course.title = 'Hifz programme'
+        self.course.save()
+        self.assertEqual(global_navbar_data(self.request)['navbar_courses'][0].title, 'Hifz programme')
+
+
+# Committed data: gather_queries reads on connections of its own.
+class AsyncViewTests(TransactionTestCase):
+    def setUp(self):
+        invalidate_page_cache()
+        self.course = Course.objects.create(title='Hifz', description='Memorisation', duration='3 years')
+
+    def test_gather_queries_runs_them_at_once(self):
+        # Each query waits for the other: run one after another, both time out.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def query(value):
+            barrier.wait()
+            return value
+
+        results = async_to_sync(gather_queries)(lambda: query('a'), lambda: query('b'))
+        self.assertEqual(results, ['a', 'b'])
+
+    def test_gather_queries_evaluates_querysets_and_callables(self):
+        courses, count = async_to_sync(gather_queries)(Course.objects.all(), Course.objects.count)
+        self.assertEqual((courses, count), ([self.course], 1))
+
+    def test_public_pages_render(self):
+        client = AsyncClient()
+        response = async_to_sync(client.get)('/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['courses'], [self.course])
+        self.assertEqual(response.context['total_courses'], 1)
+        # The async view is cached like the sync ones.
+        self.assertEqual(async_to_sync(client.get)('/')['X-Page-Cache'], 'HIT')
+        for path in ('/about/', '/alumni/'):
+            with self.subTest(path=path):
+                self.assertEqual(async_to_sync(client.get)(path).status_code, 200)
+
+    def test_alumni_page_past_the_end_shows_the_last_page(self):
+        AlumniProfile.objects.bulk_create(
+            AlumniProfile(name=f'Alumnus {i}', description='d', photo='alumni/photos/a.jpg') for i in range(7)
+        )
+        response = async_to_sync(AsyncClient().get)('/alumni/', {'page': 9})
+        alumni = response.context['alumni']
+        self.assertEqual((alumni.number, len(alumni)), (2, 1))
+
+
+class ContentCacheTagTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.renders = itertools.count(1)
+
+    def render(self, source, **context):
+        return Template('{% load cache_tags %}' + source).render(Context({'renders': self.renders.__next__, **context}))
+
+    def test_fragment_is_reused_until_its_model_changes(self):
+        source = '{% content_cache "news" models="News" %}render {{ renders }}{% endcontent_cache %}'
+        self.assertEqual(self.render(source), 'render 1')
+        self.assertEqual(self.render(source), 'render 1')
+        News.objects.create(title='Open day', content='c')
+        self.assertEqual(self.render(source), 'render 2')
+        # Other models' edits leave it alone.
+        Course.objects.create(title='Hifz', description='Memorisation', duration='3 years')
+        self.assertEqual(self.render(source), 'render 2')
+
+    def test_varies_on_extra_arguments(self):
+        source = '{% content_cache "greeting" lang %}render {{ renders }}{% endcontent_cache %}'
+        self.assertEqual(self.render(source, lang='en'), 'render 1')
+        self.assertEqual(self.render(source, lang='ml'), 'render 2')
+        self.assertEqual(self.render(source, lang='en'), 'render 1')
+
+    def test_unknown_model_is_a_syntax_error(self):
+        with self.assertRaises(TemplateSyntaxError):
+            self.render('{% content_cache "x" models="Nope" %}{% endcontent_cache %}')
+
+    def test_templates_are_compiled_once(self):
+        loader = engines['django'].engine.template_loaders[0]
+        self.assertEqual(type(loader).__module__, 'django.template.loaders.cached')
+        self.assertIs(loader.get_template('index.html'), loader.get_template('index.html'))
+
+
+class ConditionalPageTests(TestCase):
+    def setUp(self):
+        Course.objects.create(title='Hifz', description='Memorisation', duration='3 years')
+
+    def test_matching_etag_gets_304(self):
+        response = self.client.get('/courses/')
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        response = self.client.get('/courses/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_edit_changes_the_etag(self):
+        etag = self.client.get('/courses/')['ETag']
+        course = Course.objects.get()
+        course.title = 'Hifz programme'
+        course.save()
+        response = self.client.get('/courses/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        # Two rows share each timestamp so the id tie-break is exercised.
+        for i in range(14):
+            News.objects.create(
+                title=f'News {i}', content='c', published_date=now - timedelta(hours=i // 2),
+            )
+        self.queryset = News.objects.all()
+        self.newest_first = list(News.objects.order_by('-published_date', '-id'))
+
+    def test_cursor_round_trip(self):
+        news = self.newest_first[0]
+        self.assertEqual(decode_cursor(encode_cursor(news.published_date, news.pk)), (news.published_date, news.pk))
+
+    def test_malformed_cursor_is_ignored(self):
+        self.assertIsNone(decode_cursor('not-a-cursor'))
+        page = keyset_paginate(self.queryset, 'published_date', 6, after='not-a-cursor')
+        self.assertEqual(list(page), self.newest_first[:6])
+
+    def test_walks_forward_and_back_without_gaps(self):
+        first = keyset_paginate(self.queryset, 'published_date', 6)
+        self.assertFalse(first.has_previous())
+        second = keyset_paginate(self.queryset, 'published_date', 6, after=first.next_cursor)
+        third = keyset_paginate(self.queryset, 'published_date', 6, after=second.next_cursor)
+        self.assertEqual(list(first) + list(second) + list(third), self.newest_first)
+        self.assertFalse(third.has_next())
+
+        back = keyset_paginate(self.queryset, 'published_date', 6, before=second.previous_cursor)
+        self.assertEqual(list(back), list(first))
+        self.assertFalse(back.has_previous())
+
+
+class PartitionedPagesTests(TestCase):
+    def setUp(self):
+        self.campus = Category.objects.create(name='Campus')
+        self.events = Category.objects.create(name='Events')
+        self.images = {
+            category: [GalleryImage.objects.create(category=category, title=str(i)) for i in range(count)]
+            for category, count in ((self.campus, 5), (self.events, 2))
+        }
+
+    def pages(self, groups):
+        return partitioned_pages(
+            GalleryImage.objects.all(), 'category_id', [F('uploaded_at').desc(), F('id').desc()], groups, 2,
+        )
+
+    def test_every_page_in_one_query(self):
+        with self.assertNumQueries(1):
+            pages = self.pages({self.campus.pk: (5, '2'), self.events.pk: (2, 1)})
+        newest_first = self.images[self.campus][::-1]
+        self.assertEqual(list(pages[self.campus.pk]), newest_first[2:4])
+        self.assertEqual(pages[self.campus.pk].number, 2)
+        self.assertTrue(pages[self.campus.pk].has_next())
+        self.assertEqual(list(pages[self.events.pk]), self.images[self.events][::-1])
+
+    def test_invalid_page_numbers_fall_back(self):
+        pages = self.pages({self.campus.pk: (5, 'abc'), self.events.pk: (2, 9)})
+        self.assertEqual(pages[self.campus.pk].number, 1)
+        self.assertEqual(pages[self.events.pk].number, 1)
+        self.assertEqual(len(pages[self.events.pk]), 2)
+
+    def test_empty_group_needs_no_query(self):
+        empty = Category.objects.create(name='Empty')
+        with self.assertNumQueries(0):
+            pages = self.pages({empty.pk: (0, 1)})
+        self.assertEqual(list(pages[empty.pk]), [])
+
+    def test_dashboard_view(self):
+        GalleryImage.objects.update(image='gallery/photo.jpg')
+        self.client.force_login(User.objects.create_user('staff', password='x'))
+        response = self.client.get('/dashboard/list-images/', {f'page_{self.campus.pk}': 3})
+        self.assertEqual(response.status_code, 200)
+        # 8 per page: both categories fit on page 1, so page 3 is clamped.
+        page = response.context['category_pages'][self.campus.pk]
+        self.assertEqual((page.number, len(page)), (1, 5))
+
+
+class DashboardStatsTests(TestCase):
+    def test_first_load_seeds_from_real_counts(self):
+        Course.objects.create(title='Hifz', description='Memorisation', duration='3 years')
+        DashboardStats.objects.all().delete()
+        self.assertEqual(DashboardStats.load().total_courses, 1)
+
+    def test_saves_and_deletes_keep_the_counters(self):
+        DashboardStats.load()
+        news = News.objects.create(title='Open day', content='c')
+        News.objects.create(title='Exams', content='c')
+        news.title = 'Open day moved'
+        news.save()
+        self.assertEqual(DashboardStats.load().total_news, 2)
+        news.delete()
+        self.assertEqual(DashboardStats.load().total_news, 1)
+
+    def test_reconcile_fixes_drift(self):
+        News.objects.create(title='Open day', content='c')
+        # bulk_create skips the signals, the way drift happens in practice.
+        News.objects.bulk_create([News(title='Exams', content='c')])
+        out = io.StringIO()
+        call_command('reconcile_dashboard_stats', '--dry-run', stdout=out)
+        self.assertIn('total_news: stored 1, actual 2', out.getvalue())
+        self.assertEqual(DashboardStats.load().total_news, 1)
+
+        call_command('reconcile_dashboard_stats', stdout=io.StringIO())
+        self.assertEqual(DashboardStats.load().total_news, 2)
+
+    def test_dashboard_reads_the_counter_row(self):
+        self.client.force_login(User.objects.create_user('staff', password='x'))
+        DashboardStats.objects.filter(pk=DashboardStats.load().pk).update(total_courses=42)
+        self.assertEqual(self.client.get('/dashboard/').context['total_courses'], 42)
+
+
+class OutboxTests(TestCase):
+    def setUp(self):
+        self.email = queue_email('Donation received', '<p>Thank you</p>', ['donor@example.com'], 'office@example.com')
+        self.connection = get_connection('django.core.mail.backends.locmem.EmailBackend')
+
+    def test_delivers_pending_email(self):
+        self.assertEqual(deliver_batch(claim_batch(10), connection=self.connection), (1, 0, 0))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].body, 'Thank you')
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, OutboundEmail.STATUS_SENT)
+        self.assertEqual(claim_batch(10), [])
+
+    def test_failed_send_is_retried_later(self):
+        with mock.patch.object(self.connection, 'send_messages', side_effect=OSError('relay down')):
+            self.assertEqual(deliver_batch(claim_batch(10), connection=self.connection), (0, 1, 0))
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, OutboundEmail.STATUS_PENDING)
+        self.assertEqual(self.email.attempts, 1)
+        self.assertEqual(self.email.last_error, 'relay down')
+        self.assertGreater(self.email.next_attempt_at, timezone.now())
+        # Backing off: not claimable until next_attempt_at.
+        self.assertEqual(claim_batch(10), [])
+
+    def test_gives_up_after_max_attempts(self):
+        with mock.patch.object(self.connection, 'send_messages', side_effect=OSError('relay down')):
+            self.assertEqual(deliver_batch(claim_batch(10), max_attempts=1, connection=self.connection), (0, 0, 1))
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, OutboundEmail.STATUS_DEAD)
+
+
+class NewsSearchTests(TestCase):
+    def setUp(self):
+        if connection.vendor == 'sqlite' and not has_sqlite_fts(connection):
+            self.skipTest('SQLite was built without FTS5')
+        self.body_match = News.objects.create(title='Open day', content='Families can ask about zakat at the desk.')
+        self.title_match = News.objects.create(title='Zakat collection', content='The office is open all week.')
+
+    def test_title_matches_rank_first(self):
+        results = list(search_news(News.objects.all(), 'zakat'))
+        self.assertEqual(results, [self.title_match, self.body_match])
+        self.assertIn(HIGHLIGHT_START, results[1].search_snippet)
+
+    def test_query_syntax_is_searched_as_text(self):
+        self.assertEqual(list(search_news(News.objects.all(), 'zakat OR "NEAR(')), [])
+
+    def test_migrate_restores_dropped_sqlite_triggers(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite only')
+        # What a later migration rebuilding admin_panel_news leaves behind.
+        with connection.cursor() as cursor:
+            for name in NEWS_FTS_TRIGGERS:
+                cursor.execute(f'DROP TRIGGER {name}')
+        News.objects.create(title='Graduation', content='Held in the main hall.')
+        self.assertEqual(list(search_news(News.objects.all(), 'graduation')), [])
+
+        emit_post_migrate_signal(0, False, 'default')
+        self.assertEqual([n.title for n in search_news(News.objects.all(), 'graduation')], ['Graduation'])
+        self.body_match.title = 'Graduation day'
+        self.body_match.save()
+        self.assertEqual(len(search_news(News.objects.all(), 'graduation')), 2)
+
+
+class ImagePipelineTests(TempMediaMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.category = Category.objects.create(name='Campus')
+
+    def test_caption_edit_does_not_requeue(self):
+        with override_settings(IMAGE_OPTIMIZATION_QUEUE=False):
+            image = GalleryImage.objects.create(category=self.category, title='Before', image=image_upload())
+        image.refresh_from_db()
+        self.assertEqual(image.image_status, GalleryImage.STATUS_READY)
+        self.assertTrue(image.renditions['image'])
+
+        image.title = 'After'
+        image.save()
+        self.assertFalse(ImageOptimizationJob.objects.for_object(image).exists())
+
+    def test_new_file_is_requeued(self):
+        with override_settings(IMAGE_OPTIMIZATION_QUEUE=False):
+            image = GalleryImage.objects.create(category=self.category, image=image_upload())
+        image.image = image_upload(color='blue')
+        image.save()
+        self.assertEqual(ImageOptimizationJob.objects.for_object(image).count(), 1)
+        self.assertEqual(image.image_status, GalleryImage.STATUS_PROCESSING)
+
+    def test_queued_image_is_ready_once_its_job_is_done(self):
+        image = GalleryImage.objects.create(category=self.category, image=image_upload())
+        with ThreadPoolExecutor(1) as pool:
+            self.assertEqual(run_jobs(pool, claim_jobs(10)), (1, 0))
+        image.refresh_from_db()
+        self.assertEqual(image.image_status, GalleryImage.STATUS_READY)
+        self.assertEqual(ImageOptimizationJob.objects.get().status, ImageOptimizationJob.STATUS_DONE)
+
+    def test_job_that_fails_to_store_its_result_is_retried(self):
+        GalleryImage.objects.create(category=self.category, image=image_upload())
+        with ThreadPoolExecutor(1) as pool, mock.patch(
+            'admin_panel.image_jobs.apply_image_result', side_effect=OSError('disk full'),
+        ):
+            self.assertEqual(run_jobs(pool, claim_jobs(10)), (0, 1))
+        job = ImageOptimizationJob.objects.get()
+        self.assertEqual(job.status, ImageOptimizationJob.STATUS_PENDING)
+        self.assertEqual((job.attempts, job.error), (1, 'disk full'))
+
+    def test_identical_uploads_share_one_file(self):
+        first = News.objects.create(title='One', content='c', image=image_upload('a.jpg'))
+        second = News.objects.create(title='Two', content='c', image=image_upload('b.jpg'))
+        self.assertTrue(first.image.name.startswith(CONTENT_ROOT))
+        self.assertEqual(first.image.name, second.image.name)
+
+    def test_shared_file_survives_delete_until_gc_finds_it_orphaned(self):
+        first = News.objects.create(title='One', content='c', image=image_upload('a.jpg'))
+        second = News.objects.create(title='Two', content='c', image=image_upload('b.jpg'))
+        path = first.image.path
+
+        first.image.delete(save=False)
+        first.delete()
+        self.assertTrue(os.path.exists(path))
+        collect_garbage(0, action='remove')
+        self.assertTrue(os.path.exists(path))
+
+        second.delete()
+        stats = collect_garbage(0, action='remove')
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(stats['swept'], 1)
+
+    def test_reused_file_is_not_swept_before_its_row_commits(self):
+        name = default_storage.store_by_content('a.jpg', image_upload('a.jpg'))
+        path = default_storage.path(name)
+        an_hour_ago = time.time() - 3600
+        os.utime(path, (an_hour_ago, an_hour_ago))
+
+        # A second upload of the same photo reuses the file; gc_media runs
+        # before the row pointing at it is saved.
+        self.assertEqual(default_storage.store_by_content('b.jpg', image_upload('b.jpg')), name)
+        collect_garbage(60, action='remove')
+        self.assertTrue(os.path.exists(path))
+
+
+class BoundedDecodeTests(TempMediaMixin, TestCase):
+    def test_large_jpeg_is_decoded_at_reduced_scale(self):
+        upload = image_upload(size=(2000, 1600))
+        with open_bounded(upload, (200, 200)) as img:
+            img.load()
+            self.assertEqual(img.size, (250, 200))
+
+    @mock.patch('utils.image_optimizer.MAX_IMAGE_PIXELS', 1000)
+    def test_oversized_header_is_refused_before_decoding(self):
+        upload = image_upload(size=(64, 48))
+        with mock.patch.object(Image.Image, 'load', side_effect=AssertionError('decoded')):
+            with self.assertRaisesMessage(ImageTooLarge, 'photo.jpg is 64x48'):
+                check_image_size(upload)
+        self.assertEqual(upload.tell(), 0)
+
+    def test_non_images_pass_the_size_check(self):
+        upload = SimpleUploadedFile('notes.txt', b'not an image')
+        check_image_size(upload)
+        self.assertEqual(upload.tell(), 0)
+
+    @mock.patch('utils.image_optimizer.MAX_IMAGE_PIXELS', 1000)
+    def test_storage_refuses_oversized_uploads(self):
+        with self.assertRaises(ImageRejected), self.assertLogs('admin_panel.storage', 'WARNING'), transaction.atomic():
+            News.objects.create(title='One', content='c', image=image_upload())
+        self.assertFalse(News.objects.exists())
+        self.assertEqual(os.listdir(self.media_root), [])
+
+
+class GalleryIngestTests(TempMediaMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.category = Category.objects.create(name='Campus')
+
+    def test_valid_files_are_stored_in_batches_and_queued(self):
+        files = [image_upload(f'{i}.jpg', color=color) for i, color in enumerate(['red', 'green', 'blue'])]
+        results = ingest_gallery_images(self.category, files, batch_size=2)
+
+        self.assertEqual([r['status'] for r in results], ['ok'] * 3)
+        images = GalleryImage.objects.filter(pk__in=[r['id'] for r in results])
+        self.assertEqual(images.count(), 3)
+        self.assertTrue(all(image.image_status == GalleryImage.STATUS_PROCESSING for image in images))
+        self.assertEqual(ImageOptimizationJob.objects.count(), 3)
+        self.assertEqual(DashboardStats.load().total_albums, 3)
+
+    def test_invalid_file_is_reported_and_skipped(self):
+        files = [
+            image_upload('a.jpg'), SimpleUploadedFile('notes.jpg', b'not an image'), image_upload('b.jpg', color='blue'),
+        ]
+        results = ingest_gallery_images(self.category, files)
+
+        self.assertEqual([r['status'] for r in results], ['ok', 'error', 'ok'])
+        self.assertIsNone(results[1]['id'])
+        self.assertEqual(GalleryImage.objects.count(), 2)
+
+    @override_settings(IMAGE_OPTIMIZATION_QUEUE=False)
+    def test_optimizes_in_place_without_the_queue(self):
+        with mock.patch('admin_panel.gallery_upload.image_pool', lambda workers: ThreadPoolExecutor(1)):
+            results = ingest_gallery_images(self.category, [image_upload()])
+        image = GalleryImage.objects.get(pk=results[0]['id'])
+        self.assertEqual(image.image_status, GalleryImage.STATUS_READY)
+        self.assertEqual(ImageOptimizationJob.objects.get().status, ImageOptimizationJob.STATUS_DONE)
+
+
+class RequestMetricsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def worker(self, worker_id, *observations):
+        registry = MetricsRegistry()
+        registry.worker_id = worker_id
+        registry.flushed_at = time.monotonic()  # no background flush mid-test
+        for route, seconds, queries in observations:
+            timings = RequestTimings()
+            timings.queries = queries
+            registry.observe(route, seconds, timings)
+        registry.flush()
+        return registry
+
+    def test_collect_sums_every_worker(self):
+        self.worker('web-1', ('index', 0.004, 3), ('index', 0.2, 5))
+        registry = self.worker('web-2', ('index', 0.004, 2), ('news', 3.0, 1))
+
+        totals, _ = registry.collect()
+        buckets, count, seconds, queries = totals['index'][:4]
+        self.assertEqual((count, queries), (3, 10))
+        self.assertAlmostEqual(seconds, 0.208)
+        self.assertEqual(buckets[0], 2)
+        self.assertEqual(totals['news'][1], 1)
+
+    def test_expired_worker_is_dropped(self):
+        self.worker('web-1', ('index', 0.004, 1))
+        registry = self.worker('web-2', ('index', 0.004, 1))
+        cache.delete('metrics:worker:web-1')
+
+        totals, _ = registry.collect()
+        self.assertEqual(totals['index'][1], 1)
+        self.assertNotIn('web-1', cache.get(METRICS_WORKERS_KEY))
+
+    def test_prometheus_buckets_are_cumulative(self):
+        totals, _ = self.worker('web-1', ('index', 0.004, 1), ('index', 0.02, 1)).collect()
+        text = render_prometheus(totals)
+        self.assertIn('django_request_duration_seconds_bucket{view="index",le="0.005"} 1\n', text)
+        self.assertIn('django_request_duration_seconds_bucket{view="index",le="0.025"} 2\n', text)
+        self.assertIn('django_request_duration_seconds_bucket{view="index",le="+Inf"} 2\n', text)
+        self.assertIn('django_db_queries_total{view="index"} 2\n', text)
+
+    def test_server_timing_header(self):
+        response = self.client.get('/courses/')
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="\d+ queries", tpl;dur=')
+
+    def test_endpoint_is_for_staff_or_the_scraper_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 404)
+        with override_settings(METRICS_TOKEN='s3cret'):
+            self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code, 404)
+            response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer s3cret')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('# TYPE django_request_duration_seconds histogram', response.content.decode())
+
+        self.client.force_login(User.objects.create_user('staff', password='x', is_staff=True))
+        self.assertEqual(self.client.get('/metrics').status_code, 200)
+
+
+class ReoptimizeMediaTests(TempMediaMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        manifest_dir = tempfile.mkdtemp(prefix='darul-fatheh-manifest-')
+        self.addCleanup(shutil.rmtree, manifest_dir, ignore_errors=True)
+        self.manifest_path = os.path.join(manifest_dir, 'manifest.jsonl')
+        for directory in ('gallery', 'gallery/renditions', CONTENT_ROOT):
+            os.makedirs(os.path.join(self.media_root, directory), exist_ok=True)
+        self.big = self.write('gallery/big.jpg', (2000, 1500))
+        self.write('gallery/renditions/big-320w.jpg', (320, 240))
+        self.write(f'{CONTENT_ROOT}ab.jpg', (2000, 1500))
+
+    def write(self, name, size):
+        path = os.path.join(self.media_root, name)
+        with open(path, 'wb') as fh:
+            fh.write(image_upload(size=size).read())
+        return path
+
+    def run_once(self, **kwargs):
+        manifest = Manifest(self.manifest_path)
+        try:
+            with ThreadPoolExecutor(2) as pool:
+                return reoptimize(pool, 2, media_images(), manifest, **kwargs)
+        finally:
+            manifest.close()
+
+    def test_walk_skips_renditions_and_content_addressed_files(self):
+        self.assertEqual([name for name, _ in media_images()], ['gallery/big.jpg'])
+
+    def test_rewrites_in_place_and_resumes_from_the_manifest(self):
+        stats = self.run_once()
+        self.assertEqual((stats['files'], stats['changed']), (1, 1))
+        with Image.open(self.big) as img:
+            self.assertEqual((img.format, img.size), ('JPEG', (1200, 900)))
+
+        stats = self.run_once()
+        self.assertEqual((stats['files'], stats['skipped']), (0, 1))
+
+    def test_dry_run_writes_nothing(self):
+        with open(self.big, 'rb') as fh:
+            before = fh.read()
+        stats = self.run_once(dry_run=True)
+        self.assertEqual(stats['changed'], 1)
+        self.assertLess(stats['bytes_after'], stats['bytes_before'])
+        with open(self.big, 'rb') as fh:
+            self.assertEqual(fh.read(), before)
+        self.assertEqual(self.run_once(dry_run=True)['skipped'], 0)
+
+    def test_command(self):
+        out = io.StringIO()
+        call_command(
+            'reoptimize_media', '--source', 'media', '--workers', '1', '--manifest', self.manifest_path, stdout=out,
+        )
+        self.assertIn('1 files: 1 changed', out.getvalue())
+
+
+class MetricsFlushTests(TestCase):
+    def test_async_request_publishes_off_the_event_loop(self):
+        registry = MetricsRegistry()
+        calls = []
+        # Patched on the class: each thread gets its own backend instance.
+        backend = type(caches['default'])
+        real_set = backend.set
+
+        def recording_set(self, *args, **kwargs):
+            calls.append(asyncio._get_running_loop())
+            return real_set(self, *args, **kwargs)
+
+        async def request():
+            registry.observe('index', 0.01, RequestTimings())
+
+        with mock.patch.object(backend, 'set', recording_set):
+            async_to_sync(request)()
+            registry.flusher.join()
+
+        self.assertTrue(calls)
+        self.assertEqual(calls, [None] * len(calls))
+        self.assertIn(registry.worker_id, cache.get(METRICS_WORKERS_KEY))
+        self.assertEqual(cache.get(f'metrics:worker:{registry.worker_id}')['routes']['index'][1], 1)
+
+
+class StaticManifestCheckTests(TestCase):
+    def test_missing_manifest_is_an_error(self):
+        with tempfile.TemporaryDirectory() as static_root, override_settings(STATIC_ROOT=static_root):
+            self.assertEqual([e.id for e in check_static_manifest(None)], ['admin_panel.E002'])
+
+    def test_collected_manifest_passes(self):
+        self.assertEqual(check_static_manifest(None), [])
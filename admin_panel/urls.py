@@ -28,6 +28,7 @@ urlpatterns = [
 
     # Gallery
     path('gallery/', views.gallery_page, name='gallery'),
+    path('gallery/more/', views.gallery_more, name='gallery_more'),
 
     # Donate
     path('donate/', views.donate, name='donate'), 
@@ -1,21 +1,33 @@
 from django.shortcuts import render, redirect, get_object_or_404
+from django.http import JsonResponse
+from django.template.loader import render_to_string
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from django.db.models import Count, Q
+from django.core.paginator import Paginator, EmptyPage, Page, PageNotAnInteger
+from django.db.models import Count, F
 from django.utils import timezone
 from django.utils.text import slugify
 from django.core.mail import send_mail
 from django.conf import settings
+from django.db import transaction
 from .forms import StudentRegistrationForm
-from django.core.mail import EmailMultiAlternatives
-from django.utils.html import strip_tags
 import os
 
+from .async_queries import gather_queries, render_async
+from .cache import cache_public_page
+from .conditional import (
+    alumni_condition, blog_condition, course_detail_condition, courses_condition,
+    gallery_condition, news_detail_condition, team_condition,
+)
+from .gallery_upload import ingest_gallery_images
+from .outbox import queue_email
+from .pagination import CountedPaginator, keyset_paginate, partitioned_pages
+from .search import search_news
 from .models import (
     ManagementTeam, Course, News, Category,
-    GalleryImage, DonationDetails, ContactMessage, Testimonial, StudentRegistration, AlumniProfile,AlumniEvent
+    GalleryImage, DonationDetails, ContactMessage, Testimonial, StudentRegistration, AlumniProfile,AlumniEvent,
+    DashboardStats,
 )
 
 from .forms import (
@@ -54,14 +66,9 @@ def logout_view(request):
 @login_required(login_url='admin_panel:login')
 def dashboard(request):
     context = {
-        'total_team': ManagementTeam.objects.count(),
-        'total_courses': Course.objects.count(),
-        'total_news': News.objects.count(),
-        'total_albums': GalleryImage.objects.count(),
-        'total_donations': DonationDetails.objects.count(),
-        'total_messages': ContactMessage.objects.all().count(),
+        # total_team, total_courses, total_news, ... from the counter row
+        **DashboardStats.load().as_context(),
         # 'total_downloads': Download.objects.count(),
-        'total_testimonials': Testimonial.objects.count(),
         'recent_messages': ContactMessage.objects.all().order_by('-created_at')[:5],
         'recent_donations': DonationDetails.objects.all().order_by('-donated_at')[:5],
     }
@@ -269,19 +276,20 @@ def news_delete(request, pk):
 
 @login_required(login_url="admin_panel:login")
 def gallery_images(request):
-    categories = Category.objects.all().prefetch_related("images")
-    category_pages = {}
+    # One query for categories with counts, one windowed query for every page.
+    categories = list(Category.objects.annotate(image_count=Count("images")))
+    category_pages = partitioned_pages(
+        GalleryImage.objects.all(),
+        "category_id",
+        [F("uploaded_at").desc(), F("id").desc()],
+        {
+            category.id: (category.image_count, request.GET.get(f"page_{category.id}", 1))
+            for category in categories
+        },
+        8,
+    )
     for category in categories:
-        images_qs = category.images.all().order_by("-uploaded_at")
-        paginator = Paginator(images_qs, 8)
-        page_number = request.GET.get(f"page_{category.id}", 1)
-        try:
-            page_obj = paginator.page(page_number)
-        except PageNotAnInteger:
-            page_obj = paginator.page(1)
-        except EmptyPage:
-            page_obj = paginator.page(paginator.num_pages)
-        category_pages[category.id] = page_obj
+        category.page_obj = category_pages[category.id]
 
     return render(
         request,
@@ -299,13 +307,18 @@ def add_image(request):
         category_id = request.POST.get("category")
         category = Category.objects.get(id=category_id)
         files = request.FILES.getlist("images")
-        for file in files:
-            GalleryImage.objects.create(
-                category=category,
-                title=file.name,
-                image=file,
-            )
-        messages.success(request, "Images uploaded succesfully")
+        results = ingest_gallery_images(category, files)
+        failed = [r for r in results if r["status"] == "error"]
+        if "application/json" in request.headers.get("Accept", ""):
+            return JsonResponse({
+                "uploaded": len(results) - len(failed),
+                "failed": len(failed),
+                "results": results,
+            })
+        if len(failed) < len(results):
+            messages.success(request, f"{len(results) - len(failed)} images uploaded succesfully")
+        for result in failed:
+            messages.error(request, f"{result['name']}: {result['error']}")
         return redirect("admin_panel:list_image")
     return render(request, "admin_panel/add_image.html", {"categories": categories})
 
@@ -552,13 +565,16 @@ def testimonial_delete(request, pk):
 
 
 # ==================== PUBLIC WEBSITE VIEWS (Frontend) ====================
-def index(request):
-    courses = Course.objects.filter(is_active=True).order_by('-created_at')[:4]
-    news = News.objects.filter(is_published=True).order_by('-published_date')[:3]
-    testimonials = Testimonial.objects.filter(is_approved=True).order_by('-created_at')
-    gallery_images = GalleryImage.objects.all().order_by('-uploaded_at')[:8]
-    total_courses = Course.objects.filter(is_active=True).count()
-    total_team = ManagementTeam.objects.count()
+@cache_public_page
+async def index(request):
+    courses, news, testimonials, gallery_images, total_courses, total_team = await gather_queries(
+        Course.objects.filter(is_active=True).order_by('-created_at')[:4],
+        News.objects.filter(is_published=True).order_by('-published_date')[:3],
+        Testimonial.objects.filter(is_approved=True).order_by('-created_at'),
+        GalleryImage.objects.all().order_by('-uploaded_at')[:8],
+        Course.objects.filter(is_active=True).count,
+        ManagementTeam.objects.count,
+    )
     context = {
         'courses': courses,
         'news': news,
@@ -567,18 +583,21 @@ def index(request):
         'total_courses': total_courses,
         'total_team': total_team,
     }
-    return render(request, 'index.html', context)
+    return await render_async(request, 'index.html', context)
 
 
-def about_page(request):
-    team = ManagementTeam.objects.all().order_by('name')
-    testimonials = Testimonial.objects.filter(is_approved=True).order_by('-created_at')
+async def about_page(request):
+    team, testimonials = await gather_queries(
+        ManagementTeam.objects.all().order_by('name'),
+        Testimonial.objects.filter(is_approved=True).order_by('-created_at'),
+    )
     context = {
         'team': team,
         'testimonials': testimonials,
     }
-    return render(request, 'about.html', context)
+    return await render_async(request, 'about.html', context)
 
+@team_condition
 def our_team(request):
     team_qs = ManagementTeam.objects.all().order_by('name')
     paginator = Paginator(team_qs, 6) 
@@ -586,6 +605,7 @@ def our_team(request):
     team = paginator.get_page(page_number)
     return render(request, 'team.html', {'team': team})
 
+@courses_condition
 def courses_page(request):
     course_list = Course.objects.filter(is_active=True).order_by('-created_at')
     paginator = Paginator(course_list, 8) 
@@ -599,6 +619,7 @@ def courses_page(request):
     context = {'courses': courses}
     return render(request, 'courses.html', context)
 
+@course_detail_condition
 def course_detail(request, slug):
     course = get_object_or_404(Course, slug=slug)
     all_courses = Course.objects.filter(is_active=True).exclude(slug=slug).order_by('-created_at')
@@ -623,28 +644,33 @@ def contact_page(request):
         return render(request, 'contact.html', {'success': True})
     return render(request, 'contact.html')
 
+@blog_condition
 def blog_page(request):
     search_query = request.GET.get('search-field') or request.POST.get('search-field')
     news_list = News.objects.filter(is_published=True).order_by('-published_date')
     if search_query:
-        news_list = news_list.filter(
-            Q(title__icontains=search_query) | 
-            Q(content__icontains=search_query)
+        # Ranked results are not ordered by date, so search keeps page numbers.
+        news_list = search_news(news_list, search_query)
+        paginator = Paginator(news_list, 6)
+        page_number = request.GET.get('page')
+        try:
+            news = paginator.page(page_number)
+        except PageNotAnInteger:
+            news = paginator.page(1)
+        except EmptyPage:
+            news = paginator.page(paginator.num_pages)
+    else:
+        news = keyset_paginate(
+            news_list, 'published_date', 6,
+            after=request.GET.get('after'), before=request.GET.get('before'),
         )
-    paginator = Paginator(news_list, 6)
-    page_number = request.GET.get('page')
-    try:
-        news = paginator.page(page_number)
-    except PageNotAnInteger:
-        news = paginator.page(1)
-    except EmptyPage:
-        news = paginator.page(paginator.num_pages)
     context = {
         'news': news,
         'search_query': search_query
     }
     return render(request, 'blog.html', context)
 
+@news_detail_condition
 def news_detail(request, slug):
     news = get_object_or_404(News, slug=slug)
     recent_news = News.objects.filter(is_published=True).exclude(slug=slug).order_by('-published_date')[:3]
@@ -671,20 +697,21 @@ def faq_page(request):
 def not_found_page(request):
     return render(request, 'not-found.html')
 
-def gallery_page(request):
+def _gallery_page_images(request):
     category_id = request.GET.get('category')
-    categories = Category.objects.all()
-    images_list = GalleryImage.objects.all().order_by('-uploaded_at')
+    images_list = GalleryImage.objects.all()
     if category_id:
         images_list = images_list.filter(category__id=category_id)
-    paginator = Paginator(images_list, 9)
-    page = request.GET.get('page')
-    try:
-        images = paginator.page(page)
-    except PageNotAnInteger:
-        images = paginator.page(1)
-    except EmptyPage:
-        images = paginator.page(paginator.num_pages)
+    images = keyset_paginate(
+        images_list, 'uploaded_at', 9,
+        after=request.GET.get('after'), before=request.GET.get('before'),
+    )
+    return images, category_id
+
+@gallery_condition
+def gallery_page(request):
+    images, category_id = _gallery_page_images(request)
+    categories = Category.objects.all()
     context = {
         'images': images,
         'categories': categories,
@@ -692,6 +719,14 @@ def gallery_page(request):
     }
     return render(request, 'gallery.html', context)
 
+def gallery_more(request):
+    """Next batch of gallery items as an HTML fragment for infinite scroll."""
+    images, _ = _gallery_page_images(request)
+    return JsonResponse({
+        'html': render_to_string('gallery-items.html', {'images': images}, request=request),
+        'next': images.next_cursor,
+    })
+
 #public donate view
 def donate(request):
     if request.method == 'POST':
@@ -724,93 +759,24 @@ def register_view(request):
         form = StudentRegistrationForm(request.POST)
 
         if form.is_valid():
-            student = form.save()
-
-            course_title = student.course.title if student.course else "Not Selected"
-            program_specific = student.program_name if student.program_name else "N/A"
-
-            subject = "New Student Registration"
-
-            html_message = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-</head>
-<body style="margin:0; padding:0; background-color:#f4f4f4; font-family: Arial, sans-serif;">
-    <table width="100%" cellpadding="0" cellspacing="0" style="padding:40px 20px;">
-        <tr>
-            <td align="center">
-                <table width="600" cellpadding="0" cellspacing="0"
-                       style="background:#ffffff; border-radius:8px; overflow:hidden;
-                              box-shadow:0 2px 8px rgba(0,0,0,0.1);">
-
-                    <tr>
-                        <td style="background:#2D4636; padding:30px; text-align:center;">
-                            <h2 style="margin:0; color:#ffffff;">
-                                New Student Registration
-                            </h2>
-                        </td>
-                    </tr>
-
-                    <tr>
-                        <td style="padding:30px;">
-                            <p style="color:#555; font-size:15px;">
-                                A new student has registered on the website.
-                            </p>
-
-                            <table width="100%" cellpadding="0" cellspacing="0"
-                                   style="border:1px solid #e0e0e0; border-radius:6px;">
-                                <tr>
-                                    <td style="padding:12px; font-weight:bold;">Full Name</td>
-                                    <td style="padding:12px;">{student.first_name} {student.last_name}</td>
-                                </tr>
-                                <tr style="background:#f8f9fa;">
-                                    <td style="padding:12px; font-weight:bold;">Email</td>
-                                    <td style="padding:12px;">{student.email}</td>
-                                </tr>
-                                <tr>
-                                    <td style="padding:12px; font-weight:bold;">Mobile</td>
-                                    <td style="padding:12px;">{student.mobile}</td>
-                                </tr>
-                                <tr style="background:#f8f9fa;">
-                                    <td style="padding:12px; font-weight:bold;">Course</td>
-                                    <td style="padding:12px;">{course_title}</td>
-                                </tr>
-                                <tr>
-                                    <td style="padding:12px; font-weight:bold;">Program</td>
-                                    <td style="padding:12px;">{program_specific}</td>
-                                </tr>
-                            </table>
-                        </td>
-                    </tr>
-
-                    <tr>
-                        <td style="background:#f8f9fa; padding:20px; text-align:center;">
-                            <p style="margin:0; font-size:13px; color:#888;">
-                                Darul Fatheh Islamic Complex
-                            </p>
-                        </td>
-                    </tr>
-
-                </table>
-            </td>
-        </tr>
-    </table>
-</body>
-</html>
-"""
-
-            plain_message = strip_tags(html_message)
-
-            email = EmailMultiAlternatives(
-                subject,
-                plain_message,
-                settings.EMAIL_HOST_USER,
-                [settings.EMAIL_HOST_USER],
-            )
-            email.attach_alternative(html_message, "text/html")
-            email.send(fail_silently=False)
+            with transaction.atomic():
+                student = form.save()
+
+                course_title = student.course.title if student.course else "Not Selected"
+                program_specific = student.program_name if student.program_name else "N/A"
+
+                html_message = render_to_string('emails/student_registration.html', {
+                    'student': student,
+                    'course_title': course_title,
+                    'program_specific': program_specific,
+                })
+                # Delivered by `manage.py send_outbox`, never inline.
+                queue_email(
+                    "New Student Registration",
+                    html_message,
+                    [settings.EMAIL_HOST_USER],
+                    settings.EMAIL_HOST_USER,
+                )
 
             messages.success(request, "Registration successful!")
             return redirect('admin_panel:register')
@@ -979,23 +945,35 @@ def alumni_event_delete(request, pk):
     messages.success(request, 'Alumni Event deleted successfully!')
     return redirect('admin_panel:alumni_event_list')
 
-def alumni_public_view(request):
-    events = AlumniEvent.objects.filter(is_visible=True).order_by('-date')
+@alumni_condition
+async def alumni_public_view(request):
+    per_page = 6
     alumni_list = AlumniProfile.objects.all().order_by('-created_at')
-    paginator = Paginator(alumni_list, 6) 
-    page = request.GET.get('page')
     try:
-        alumni = paginator.page(page)
-    except PageNotAnInteger:
-        alumni = paginator.page(1)
+        number = int(request.GET.get('page'))
+    except (TypeError, ValueError):
+        number = 1
+    # Fetch the requested page alongside its count instead of after it.
+    start = max(number - 1, 0) * per_page
+    events, count, rows = await gather_queries(
+        AlumniEvent.objects.filter(is_visible=True).order_by('-date'),
+        alumni_list.count,
+        alumni_list[start:start + per_page],
+    )
+    paginator = CountedPaginator(count, per_page)
+    try:
+        number = paginator.validate_number(number)
     except EmptyPage:
-        alumni = paginator.page(paginator.num_pages)
+        number = paginator.num_pages
+        start = (number - 1) * per_page
+        [rows] = await gather_queries(alumni_list[start:start + per_page])
+    alumni = Page(rows, number, paginator)
 
     context = {
         'events': events,
         'alumni': alumni,
     }
-    return render(request, 'alumni.html', context)
+    return await render_async(request, 'alumni.html', context)
 
 
 
@@ -1,5 +1,6 @@
 from pathlib import Path
 import os
+from django.core.exceptions import ImproperlyConfigured
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -25,6 +26,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'admin_panel.metrics.RequestMetricsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -33,14 +36,31 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# WhiteNoise is sync-only; under ASGI it would push every request through a
+# thread hop. The ASGI profile (deploy/gunicorn_asgi.py) sets SERVE_STATIC=0
+# and lets the proxy serve STATIC_ROOT instead.
+SERVE_STATIC = os.environ.get('SERVE_STATIC', '1') == '1'
+if not SERVE_STATIC:
+    MIDDLEWARE.remove('whitenoise.middleware.WhiteNoiseMiddleware')
+
 ROOT_URLCONF = 'darul_fatheh_project.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # Stock DjangoTemplates plus render timing for Server-Timing/metrics.
+        'BACKEND': 'admin_panel.metrics.InstrumentedDjangoTemplates',
+        'NAME': 'django',
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
+            # Compile each template once per process, in DEBUG too (runserver
+            # still picks up edits). Shared partials are additionally cached
+            # as rendered HTML with {% content_cache %}.
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
@@ -64,6 +84,69 @@ DATABASES = {
     }
 }
 
+# DB_CONN_MODE picks how connections are reused:
+#   per-request  open and close a connection for every request (old behaviour)
+#   persistent   keep one connection per worker thread for DB_CONN_MAX_AGE
+#                seconds, health-checked before reuse (WSGI workers)
+#   pool         psycopg 3 connection pool per worker process, bounded by
+#                DB_POOL_MIN_SIZE/DB_POOL_MAX_SIZE; requests wait up to
+#                DB_POOL_TIMEOUT seconds for a free connection (use for ASGI)
+# Pool statistics, including time spent waiting, are exported at /metrics.
+DB_CONN_MODE = os.environ.get('DB_CONN_MODE', 'persistent')
+
+if DB_CONN_MODE == 'persistent':
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 60))
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+elif DB_CONN_MODE == 'pool':
+    # Django tests each pooled connection on checkout when health checks are on.
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+            'timeout': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+            'max_idle': float(os.environ.get('DB_POOL_MAX_IDLE', 600)),
+        },
+    }
+elif DB_CONN_MODE != 'per-request':
+    raise ImproperlyConfigured(f'Unknown DB_CONN_MODE {DB_CONN_MODE!r}')
+
+# Threads per process that the async public views use to run independent
+# queries side by side; each holds its own connection.
+ASYNC_QUERY_WORKERS = int(os.environ.get('ASYNC_QUERY_WORKERS', 8))
+
+# Every worker process must see the same cache, or page cache invalidation
+# only reaches the worker that handled the edit. Production uses Redis
+# (deploy/gunicorn_asgi.py); the default is a file cache every process on
+# the host shares. `manage.py check` fails on LocMemCache unless DEBUG.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('DJANGO_CACHE_BACKEND', 'django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': os.environ.get('DJANGO_CACHE_LOCATION', str(BASE_DIR / '.cache')),
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
+}
+
+# Uploaded images are resized, re-encoded and given renditions by
+# `manage.py process_image_jobs`. Set to False to do it inline during the
+# request instead.
+IMAGE_OPTIMIZATION_QUEUE = True
+
+# Every ImageField upload is stored once per distinct content
+# (admin_panel.storage), then resized and re-encoded by the image worker.
+# format: 'JPEG', 'WEBP', 'PNG' or None to keep the uploaded format.
+IMAGE_UPLOAD_POLICY = {'max_size': (1200, 1200), 'format': None, 'quality': 75}
+# Per-field overrides, keyed 'app_label.Model.field'. None stores uploads as-is.
+IMAGE_FIELD_POLICIES = {
+    'admin_panel.ManagementTeam.photo': {'max_size': (600, 600), 'format': 'JPEG', 'quality': 80},
+    'admin_panel.Testimonial.photo': {'max_size': (400, 400), 'format': 'JPEG', 'quality': 80},
+    'admin_panel.AlumniProfile.photo': {'max_size': (600, 600), 'format': 'JPEG', 'quality': 80},
+    'admin_panel.Course.thumbnail': {'max_size': (1200, 800), 'format': 'JPEG'},
+    'admin_panel.News.image': {'max_size': (1600, 1200), 'format': 'JPEG'},
+    # Payment screenshots are text: keep them tall and sharp.
+    'admin_panel.DonationDetails.screenshot': {'max_size': (1200, 2400), 'quality': 85},
+}
+
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
 USE_I18N = True
@@ -73,11 +156,61 @@ STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 
+# collectstatic writes content-hashed copies plus .gz/.br siblings; WhiteNoise
+# serves them with the best encoding the client accepts and, for hashed
+# names, a far-future immutable Cache-Control.
+STORAGES = {
+    'default': {
+        'BACKEND': 'admin_panel.storage.ContentAddressedStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'darul_fatheh_project.storage.StaticFilesStorage',
+    },
+}
+# Templates reference a few files that are not shipped; render those
+# unhashed instead of raising. staticfiles.json itself must exist: run
+# collectstatic after changing anything under static/, and admin_panel.E002
+# refuses to start without it.
+WHITENOISE_MANIFEST_STRICT = False
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+# Served by admin_panel.media.serve_media. Set MEDIA_ACCEL_REDIRECT to an
+# nginx "internal" location (e.g. /protected-media/) aliased to MEDIA_ROOT to
+# let nginx stream the bytes after Django has checked access.
+MEDIA_ACCEL_REDIRECT = os.environ.get('MEDIA_ACCEL_REDIRECT', '')
+# Payment screenshots are only served to signed-in dashboard users.
+MEDIA_PRIVATE_PREFIXES = ['donation_proofs/']
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# ================= REQUEST METRICS =================
+
+# /metrics is served to staff, or only to a scraper sending
+# "Authorization: Bearer $METRICS_TOKEN" when that is set. Workers sum
+# their totals through the default cache, so it must be shared.
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+METRICS_SERVER_TIMING = True
+
+# ================= LOGGING =================
+
+# The image pipeline and the background workers report through the
+# admin_panel and utils loggers; under systemd stderr ends up in the journal.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'plain': {'format': '%(levelname)s %(name)s: %(message)s'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': 'plain'},
+    },
+    'loggers': {
+        'admin_panel': {'handlers': ['console'], 'level': 'INFO'},
+        'utils': {'handlers': ['console'], 'level': 'INFO'},
+    },
+}
+
 # ================= SMTP CONFIG =================
 
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
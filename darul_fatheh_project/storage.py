@@ -0,0 +1,18 @@
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+class StaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    Hashed + gzip/brotli precompressed static files.
+
+    The bundled theme CSS and templates point at a few images that were
+    never shipped; leave those references unhashed instead of failing
+    collectstatic or the page. Every file that does exist is in
+    staticfiles.json, which admin_panel.E002 requires at startup.
+    """
+
+    def hashed_name(self, name, content=None, filename=None):
+        try:
+            return super().hashed_name(name, content, filename)
+        except ValueError:
+            return name
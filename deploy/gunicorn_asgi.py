@@ -0,0 +1,72 @@
+"""
+Gunicorn settings for serving the site over ASGI with uvicorn workers.
+
+    gunicorn -c deploy/gunicorn_asgi.py darul_fatheh_project.asgi:application
+
+Each worker runs one event loop. The async public views (index, about,
+alumni) fan their queries out to ASYNC_QUERY_WORKERS threads, so size the
+database pool to match: DB_POOL_MAX_SIZE >= ASYNC_QUERY_WORKERS + a few for
+the sync views. nginx serves /static/ and /protected-media/ (see
+deploy/nginx.conf).
+
+The workers share the page cache, content versions and metrics through
+Redis at DJANGO_CACHE_LOCATION (redis-py is in requirements.txt).
+
+Static URLs resolve through staticfiles/staticfiles.json, so every deploy
+that touches static/ runs, before restarting gunicorn:
+
+    python manage.py collectstatic --noinput
+
+The master runs Django's system checks before forking and refuses to start
+on errors such as a missing manifest or an unshared cache.
+
+Two background workers run next to gunicorn; deploy/systemd/ has a unit
+for each, and for gunicorn itself:
+
+    python manage.py send_outbox          # emails queued by the views
+    python manage.py process_image_jobs   # upload optimization and renditions
+
+Both loop until stopped. The image worker clears the page cache after each
+image, so give it the same DJANGO_CACHE_* settings as the web workers.
+Settings shared by all three go in /etc/darul-fatheh.env.
+"""
+import multiprocessing
+import os
+
+# Read by settings.py in each worker; values already in the environment win.
+os.environ.setdefault('DB_CONN_MODE', 'pool')
+os.environ.setdefault('DB_POOL_MIN_SIZE', '2')
+os.environ.setdefault('DB_POOL_MAX_SIZE', '12')
+os.environ.setdefault('ASYNC_QUERY_WORKERS', '8')
+os.environ.setdefault('SERVE_STATIC', '0')
+os.environ.setdefault('MEDIA_ACCEL_REDIRECT', '/protected-media/')
+# Per-process LocMemCache would leave each worker with its own page cache,
+# and a database cache would put queries back on every cached hit.
+os.environ.setdefault('DJANGO_CACHE_BACKEND', 'django.core.cache.backends.redis.RedisCache')
+os.environ.setdefault('DJANGO_CACHE_LOCATION', 'redis://127.0.0.1:6379/1')
+
+bind = os.environ.get('GUNICORN_BIND', '127.0.0.1:8000')
+worker_class = 'uvicorn_worker.UvicornWorker'
+# An event loop keeps one core busy on its own; more workers than cores
+# only adds database connections.
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers now and then so a slow leak can't grow without bound.
+max_requests = 2000
+max_requests_jitter = 200
+
+accesslog = '-'
+errorlog = '-'
+
+
+def on_starting(server):
+    import django
+    from django.core.management import call_command
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'darul_fatheh_project.settings')
+    django.setup()
+    call_command('check')
@@ -0,0 +1,592 @@
+// Avoid `console` errors in browsers that lack a console.
+(function() {
+    var method;
+    var noop = function() {};
+    var methods = [
+        'assert', 'clear', 'count', 'debug', 'dir', 'dirxml', 'error',
+        'exception', 'group', 'groupCollapsed', 'groupEnd', 'info', 'log',
+        'markTimeline', 'profile', 'profileEnd', 'table', 'time', 'timeEnd',
+        'timeline', 'timelineEnd', 'timeStamp', 'trace', 'warn'
+    ];
+    var length = methods.length;
+    var console = (window.console = window.console || {});
+
+    while (length--) {
+        method = methods[length];
+
+        // Only stub undefined methods.
+        if (!console[method]) {
+            console[method] = noop;
+        }
+    }
+}());
+
+// Place any jQuery/helper plugins in here.
+
+/*!
+ * The Final Countdown for jQuery v2.2.0 (http://hilios.github.io/jQuery.countdown/)
+ * Copyright (c) 2016 Edson Hilios
+ * 
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of
+ * this software and associated documentation files (the "Software"), to deal in
+ * the Software without restriction, including without limitation the rights to
+ * use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+ * the Software, and to permit persons to whom the Software is furnished to do so,
+ * subject to the following conditions:
+ * 
+ * The above copyright notice and this permission notice shall be included in all
+ * copies or substantial portions of the Software.
+ * 
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+ * FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+ * COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+ * IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+! function(a) { "use strict"; "function" == typeof define && define.amd ? define(["jquery"], a) : a(jQuery) }(function(a) {
+    "use strict";
+
+    function b(a) { if (a instanceof Date) return a; if (String(a).match(g)) return String(a).match(/^[0-9]*$/) && (a = Number(a)), String(a).match(/\-/) && (a = String(a).replace(/\-/g, "/")), new Date(a); throw new Error("Couldn't cast `" + a + "` to a date object.") }
+
+    function c(a) { var b = a.toString().replace(/([.?*+^$[\]\\(){}|-])/g, "\\$1"); return new RegExp(b) }
+
+    function d(a) {
+        return function(b) {
+            var d = b.match(/%(-|!)?[A-Z]{1}(:[^;]+;)?/gi);
+            if (d)
+                for (var f = 0, g = d.length; f < g; ++f) {
+                    var h = d[f].match(/%(-|!)?([a-zA-Z]{1})(:[^;]+;)?/),
+                        j = c(h[0]),
+                        k = h[1] || "",
+                        l = h[3] || "",
+                        m = null;
+                    h = h[2], i.hasOwnProperty(h) && (m = i[h], m = Number(a[m])), null !== m && ("!" === k && (m = e(l, m)), "" === k && m < 10 && (m = "0" + m.toString()), b = b.replace(j, m.toString()))
+                }
+            return b = b.replace(/%%/, "%")
+        }
+    }
+
+    function e(a, b) {
+        var c = "s",
+            d = "";
+        return a && (a = a.replace(/(:|;|\s)/gi, "").split(/\,/), 1 === a.length ? c = a[0] : (d = a[0], c = a[1])), Math.abs(b) > 1 ? c : d
+    }
+    var f = [],
+        g = [],
+        h = { precision: 100, elapse: !1, defer: !1 };
+    g.push(/^[0-9]*$/.source), g.push(/([0-9]{1,2}\/){2}[0-9]{4}( [0-9]{1,2}(:[0-9]{2}){2})?/.source), g.push(/[0-9]{4}([\/\-][0-9]{1,2}){2}( [0-9]{1,2}(:[0-9]{2}){2})?/.source), g = new RegExp(g.join("|"));
+    var i = { Y: "years", m: "months", n: "daysToMonth", d: "daysToWeek", w: "weeks", W: "weeksToMonth", H: "hours", M: "minutes", S: "seconds", D: "totalDays", I: "totalHours", N: "totalMinutes", T: "totalSeconds" },
+        j = function(b, c, d) { this.el = b, this.$el = a(b), this.interval = null, this.offset = {}, this.options = a.extend({}, h), this.firstTick = !0, this.instanceNumber = f.length, f.push(this), this.$el.data("countdown-instance", this.instanceNumber), d && ("function" == typeof d ? (this.$el.on("update.countdown", d), this.$el.on("stoped.countdown", d), this.$el.on("finish.countdown", d)) : this.options = a.extend({}, h, d)), this.setFinalDate(c), this.options.defer === !1 && this.start() };
+    a.extend(j.prototype, {
+        start: function() {
+            null !== this.interval && clearInterval(this.interval);
+            var a = this;
+            this.update(), this.interval = setInterval(function() { a.update.call(a) }, this.options.precision)
+        },
+        stop: function() { clearInterval(this.interval), this.interval = null, this.dispatchEvent("stoped") },
+        toggle: function() { this.interval ? this.stop() : this.start() },
+        pause: function() { this.stop() },
+        resume: function() { this.start() },
+        remove: function() { this.stop.call(this), f[this.instanceNumber] = null, delete this.$el.data().countdownInstance },
+        setFinalDate: function(a) { this.finalDate = b(a) },
+        update: function() { if (0 === this.$el.closest("html").length) return void this.remove(); var a, b = new Date; return a = this.finalDate.getTime() - b.getTime(), a = Math.ceil(a / 1e3), a = !this.options.elapse && a < 0 ? 0 : Math.abs(a), this.totalSecsLeft === a || this.firstTick ? void(this.firstTick = !1) : (this.totalSecsLeft = a, this.elapsed = b >= this.finalDate, this.offset = { seconds: this.totalSecsLeft % 60, minutes: Math.floor(this.totalSecsLeft / 60) % 60, hours: Math.floor(this.totalSecsLeft / 60 / 60) % 24, days: Math.floor(this.totalSecsLeft / 60 / 60 / 24) % 7, daysToWeek: Math.floor(this.totalSecsLeft / 60 / 60 / 24) % 7, daysToMonth: Math.floor(this.totalSecsLeft / 60 / 60 / 24 % 30.4368), weeks: Math.floor(this.totalSecsLeft / 60 / 60 / 24 / 7), weeksToMonth: Math.floor(this.totalSecsLeft / 60 / 60 / 24 / 7) % 4, months: Math.floor(this.totalSecsLeft / 60 / 60 / 24 / 30.4368), years: Math.abs(this.finalDate.getFullYear() - b.getFullYear()), totalDays: Math.floor(this.totalSecsLeft / 60 / 60 / 24), totalHours: Math.floor(this.totalSecsLeft / 60 / 60), totalMinutes: Math.floor(this.totalSecsLeft / 60), totalSeconds: this.totalSecsLeft }, void(this.options.elapse || 0 !== this.totalSecsLeft ? this.dispatchEvent("update") : (this.stop(), this.dispatchEvent("finish")))) },
+        dispatchEvent: function(b) {
+            var c = a.Event(b + ".countdown");
+            c.finalDate = this.finalDate, c.elapsed = this.elapsed, c.offset = a.extend({}, this.offset), c.strftime = d(this.offset), this.$el.trigger(c)
+        }
+    }), a.fn.countdown = function() {
+        var b = Array.prototype.slice.call(arguments, 0);
+        return this.each(function() {
+            var c = a(this).data("countdown-instance");
+            if (void 0 !== c) {
+                var d = f[c],
+                    e = b[0];
+                j.prototype.hasOwnProperty(e) ? d[e].apply(d, b.slice(1)) : null === String(e).match(/^[$A-Z_][0-9A-Z_$]*$/i) ? (d.setFinalDate.call(d, e), d.start()) : a.error("Method %s does not exist on jQuery.countdown".replace(/\%s/gi, e))
+            } else new j(this, b[0], b[1])
+        })
+    }
+});
+
+
+
+
+/* Jquery Tilter */
+(function(a) {
+    "function" === typeof define && define.amd ? define(["jquery"], a) : "object" === typeof module && module.exports ? module.exports = function(d, c) {
+        void 0 === c && (c = "undefined" !== typeof window ? require("jquery") : require("jquery")(d));
+        a(c);
+        return c
+    } : a(jQuery)
+})(function(a) {
+    a.fn.tilt = function(d) {
+        var c = function() {
+                var b = this;
+                void 0 !== this.timeout && clearTimeout(this.timeout);
+                a(this).css({ transition: this.settings.speed + "ms " + this.settings.easing });
+                this.settings.glare && this.glareElement.css({
+                    transition: "opacity " +
+                        this.settings.speed + "ms " + this.settings.easing
+                });
+                this.timeout = setTimeout(function() {
+                    a(b).css({ transition: "" });
+                    b.settings.glare && b.glareElement.css({ transition: "" })
+                }, this.settings.speed)
+            },
+            k = function(b) {
+                this.ticking = !1;
+                a(this).css({ "will-change": "transform" });
+                c.call(this);
+                a(this).trigger("tilt.mouseEnter")
+            },
+            e = function(b) { "undefined" === typeof b && (b = { pageX: a(this).offset().left + a(this).outerWidth() / 2, pageY: a(this).offset().top + a(this).outerHeight() / 2 }); return { x: b.pageX, y: b.pageY } },
+            l = function(a) {
+                this.mousePositions =
+                    e(a);
+                this.ticking || (requestAnimationFrame(f.bind(this)), this.ticking = !0)
+            },
+            g = function() {
+                c.call(this);
+                this.reset = !0;
+                this.ticking || (requestAnimationFrame(f.bind(this)), this.ticking = !0);
+                a(this).trigger("tilt.mouseLeave")
+            },
+            h = function() {
+                var b = a(this).outerWidth(),
+                    c = a(this).outerHeight(),
+                    d = a(this).offset().left,
+                    e = a(this).offset().top,
+                    f = (this.mousePositions.x - d) / b,
+                    g = (this.mousePositions.y - e) / c,
+                    h = (this.settings.maxTilt / 2 - f * this.settings.maxTilt).toFixed(2),
+                    k = (g * this.settings.maxTilt - this.settings.maxTilt /
+                        2).toFixed(2);
+                return { tiltX: h, tiltY: k, percentageX: 100 * f, percentageY: 100 * g, angle: 180 / Math.PI * Math.atan2(this.mousePositions.x - (d + b / 2), -(this.mousePositions.y - (e + c / 2))) }
+            },
+            f = function() {
+                this.transforms = h.call(this);
+                this.reset ? (this.reset = !1, a(this).css("transform", "perspective(" + this.settings.perspective + "px) rotateX(0deg) rotateY(0deg)"), this.settings.glare && (this.glareElement.css("transform", "rotate(180deg) translate(-50%, -50%)"), this.glareElement.css("opacity", "0"))) : (a(this).css("transform", "perspective(" +
+                        this.settings.perspective + "px) rotateX(" + ("x" === this.settings.disableAxis ? 0 : this.transforms.tiltY) + "deg) rotateY(" + ("y" === this.settings.disableAxis ? 0 : this.transforms.tiltX) + "deg) scale3d(" + this.settings.scale + "," + this.settings.scale + "," + this.settings.scale + ")"), this.settings.glare && (this.glareElement.css("transform", "rotate(" + this.transforms.angle + "deg) translate(-50%, -50%)"), this.glareElement.css("opacity", "" + this.transforms.percentageY * this.settings.maxGlare / 100)), a(this).trigger("change", [this.transforms]),
+                    this.ticking = !1)
+            },
+            m = function() { this.glareElement.css({ width: "" + 2 * a(this).outerWidth(), height: "" + 2 * a(this).outerWidth() }) };
+        a.fn.tilt.destroy = function() {
+            a(this).each(function() {
+                a(this).find(".js-tilt-glare").remove();
+                a(this).css({ "will-change": "", transform: "" });
+                a(this).off("mousemove mouseenter mouseleave")
+            })
+        };
+        a.fn.tilt.getValues = function() {
+            var b = [];
+            a(this).each(function() {
+                this.mousePositions = e.call(this);
+                b.push(h.call(this))
+            });
+            return b
+        };
+        a.fn.tilt.reset = function() {
+            a(this).each(function() {
+                var b = this;
+                this.mousePositions = e.call(this);
+                this.settings = a(this).data("settings");
+                g.call(this);
+                setTimeout(function() { b.reset = !1 }, this.settings.transition)
+            })
+        };
+        return this.each(function() {
+            var b = this;
+            this.settings = a.extend({
+                maxTilt: a(this).is("[data-tilt-max]") ? a(this).data("tilt-max") : 20,
+                perspective: a(this).is("[data-tilt-perspective]") ? a(this).data("tilt-perspective") : 300,
+                easing: a(this).is("[data-tilt-easing]") ? a(this).data("tilt-easing") : "cubic-bezier(.03,.98,.52,.99)",
+                scale: a(this).is("[data-tilt-scale]") ?
+                    a(this).data("tilt-scale") : "1",
+                speed: a(this).is("[data-tilt-speed]") ? a(this).data("tilt-speed") : "400",
+                transition: a(this).is("[data-tilt-transition]") ? a(this).data("tilt-transition") : !0,
+                disableAxis: a(this).is("[data-tilt-disable-axis]") ? a(this).data("tilt-disable-axis") : null,
+                axis: a(this).is("[data-tilt-axis]") ? a(this).data("tilt-axis") : null,
+                reset: a(this).is("[data-tilt-reset]") ? a(this).data("tilt-reset") : !0,
+                glare: a(this).is("[data-tilt-glare]") ? a(this).data("tilt-glare") : !1,
+                maxGlare: a(this).is("[data-tilt-maxglare]") ?
+                    a(this).data("tilt-maxglare") : 1
+            }, d);
+            null !== this.settings.axis && (console.warn("Tilt.js: the axis setting has been renamed to disableAxis. See https://github.com/gijsroge/tilt.js/pull/26 for more information"), this.settings.disableAxis = this.settings.axis);
+            this.init = function() {
+                a(b).data("settings", b.settings);
+                if (b.settings.glare) {
+                    var c = b.settings.glarePrerender;
+                    c || a(b).append('<div class="js-tilt-glare"><div class="js-tilt-glare-inner"></div></div>');
+                    b.glareElementWrapper = a(b).find(".js-tilt-glare");
+                    b.glareElement = a(b).find(".js-tilt-glare-inner");
+                    c || (b.glareElementWrapper.css({ position: "absolute", top: "0", left: "0", width: "100%", height: "100%" }).css({ overflow: "hidden", "pointer-events": "none" }), b.glareElement.css({ position: "absolute", top: "50%", left: "50%", "background-image": "linear-gradient(0deg, rgba(255,255,255,0) 0%, rgba(255,255,255,1) 100%)", width: "" + 2 * a(b).outerWidth(), height: "" + 2 * a(b).outerWidth(), transform: "rotate(180deg) translate(-50%, -50%)", "transform-origin": "0% 0%", opacity: "0" }))
+                }
+                a(b).on("mousemove",
+                    l);
+                a(b).on("mouseenter", k);
+                if (b.settings.reset) a(b).on("mouseleave", g);
+                if (b.settings.glare) a(window).on("resize", m.bind(b))
+            };
+            this.init()
+        })
+    };
+    return !0
+});
+
+
+
+
+
+/* aos.min.js */
+
+! function(e, t) { "object" == typeof exports && "object" == typeof module ? module.exports = t() : "function" == typeof define && define.amd ? define([], t) : "object" == typeof exports ? exports.AOS = t() : e.AOS = t() }(this, function() {
+    return function(e) {
+        function t(o) { if (n[o]) return n[o].exports; var i = n[o] = { exports: {}, id: o, loaded: !1 }; return e[o].call(i.exports, i, i.exports, t), i.loaded = !0, i.exports }
+        var n = {};
+        return t.m = e, t.c = n, t.p = "dist/", t(0)
+    }([function(e, t, n) {
+        "use strict";
+
+        function o(e) { return e && e.__esModule ? e : { default: e } }
+        var i = Object.assign || function(e) { for (var t = 1; t < arguments.length; t++) { var n = arguments[t]; for (var o in n) Object.prototype.hasOwnProperty.call(n, o) && (e[o] = n[o]) } return e },
+            r = n(1),
+            a = (o(r), n(6)),
+            u = o(a),
+            c = n(7),
+            s = o(c),
+            f = n(8),
+            d = o(f),
+            l = n(9),
+            p = o(l),
+            m = n(10),
+            b = o(m),
+            v = n(11),
+            y = o(v),
+            g = n(14),
+            h = o(g),
+            w = [],
+            k = !1,
+            x = { offset: 120, delay: 0, easing: "ease", duration: 400, disable: !1, once: !1, startEvent: "DOMContentLoaded", throttleDelay: 99, debounceDelay: 50, disableMutationObserver: !1 },
+            j = function() { var e = arguments.length > 0 && void 0 !== arguments[0] && arguments[0]; if (e && (k = !0), k) return w = (0, y.default)(w, x), (0, b.default)(w, x.once), w },
+            O = function() { w = (0, h.default)(), j() },
+            M = function() { w.forEach(function(e, t) { e.node.removeAttribute("data-aos"), e.node.removeAttribute("data-aos-easing"), e.node.removeAttribute("data-aos-duration"), e.node.removeAttribute("data-aos-delay") }) },
+            S = function(e) { return e === !0 || "mobile" === e && p.default.mobile() || "phone" === e && p.default.phone() || "tablet" === e && p.default.tablet() || "function" == typeof e && e() === !0 },
+            _ = function(e) {
+                x = i(x, e), w = (0, h.default)();
+                var t = document.all && !window.atob;
+                return S(x.disable) || t ? M() : (x.disableMutationObserver || d.default.isSupported() || (console.info('\n      aos: MutationObserver is not supported on this browser,\n      code mutations observing has been disabled.\n      You may have to call "refreshHard()" by yourself.\n    '), x.disableMutationObserver = !0), document.querySelector("body").setAttribute("data-aos-easing", x.easing), document.querySelector("body").setAttribute("data-aos-duration", x.duration), document.querySelector("body").setAttribute("data-aos-delay", x.delay), "DOMContentLoaded" === x.startEvent && ["complete", "interactive"].indexOf(document.readyState) > -1 ? j(!0) : "load" === x.startEvent ? window.addEventListener(x.startEvent, function() { j(!0) }) : document.addEventListener(x.startEvent, function() { j(!0) }), window.addEventListener("resize", (0, s.default)(j, x.debounceDelay, !0)), window.addEventListener("orientationchange", (0, s.default)(j, x.debounceDelay, !0)), window.addEventListener("scroll", (0, u.default)(function() {
+                    (0, b.default)(w, x.once)
+                }, x.throttleDelay)), x.disableMutationObserver || d.default.ready("[data-aos]", O), w)
+            };
+        e.exports = { init: _, refresh: j, refreshHard: O }
+    }, function(e, t) {}, , , , , function(e, t) {
+        (function(t) {
+            "use strict";
+
+            function n(e, t, n) {
+                function o(t) {
+                    var n = b,
+                        o = v;
+                    return b = v = void 0, k = t, g = e.apply(o, n)
+                }
+
+                function r(e) { return k = e, h = setTimeout(f, t), M ? o(e) : g }
+
+                function a(e) {
+                    var n = e - w,
+                        o = e - k,
+                        i = t - n;
+                    return S ? j(i, y - o) : i
+                }
+
+                function c(e) {
+                    var n = e - w,
+                        o = e - k;
+                    return void 0 === w || n >= t || n < 0 || S && o >= y
+                }
+
+                function f() { var e = O(); return c(e) ? d(e) : void(h = setTimeout(f, a(e))) }
+
+                function d(e) { return h = void 0, _ && b ? o(e) : (b = v = void 0, g) }
+
+                function l() { void 0 !== h && clearTimeout(h), k = 0, b = w = v = h = void 0 }
+
+                function p() { return void 0 === h ? g : d(O()) }
+
+                function m() {
+                    var e = O(),
+                        n = c(e);
+                    if (b = arguments, v = this, w = e, n) { if (void 0 === h) return r(w); if (S) return h = setTimeout(f, t), o(w) }
+                    return void 0 === h && (h = setTimeout(f, t)), g
+                }
+                var b, v, y, g, h, w, k = 0,
+                    M = !1,
+                    S = !1,
+                    _ = !0;
+                if ("function" != typeof e) throw new TypeError(s);
+                return t = u(t) || 0, i(n) && (M = !!n.leading, S = "maxWait" in n, y = S ? x(u(n.maxWait) || 0, t) : y, _ = "trailing" in n ? !!n.trailing : _), m.cancel = l, m.flush = p, m
+            }
+
+            function o(e, t, o) {
+                var r = !0,
+                    a = !0;
+                if ("function" != typeof e) throw new TypeError(s);
+                return i(o) && (r = "leading" in o ? !!o.leading : r, a = "trailing" in o ? !!o.trailing : a), n(e, t, { leading: r, maxWait: t, trailing: a })
+            }
+
+            function i(e) { var t = "undefined" == typeof e ? "undefined" : c(e); return !!e && ("object" == t || "function" == t) }
+
+            function r(e) { return !!e && "object" == ("undefined" == typeof e ? "undefined" : c(e)) }
+
+            function a(e) { return "symbol" == ("undefined" == typeof e ? "undefined" : c(e)) || r(e) && k.call(e) == d }
+
+            function u(e) {
+                if ("number" == typeof e) return e;
+                if (a(e)) return f;
+                if (i(e)) {
+                    var t = "function" == typeof e.valueOf ? e.valueOf() : e;
+                    e = i(t) ? t + "" : t
+                }
+                if ("string" != typeof e) return 0 === e ? e : +e;
+                e = e.replace(l, "");
+                var n = m.test(e);
+                return n || b.test(e) ? v(e.slice(2), n ? 2 : 8) : p.test(e) ? f : +e
+            }
+            var c = "function" == typeof Symbol && "symbol" == typeof Symbol.iterator ? function(e) { return typeof e } : function(e) { return e && "function" == typeof Symbol && e.constructor === Symbol && e !== Symbol.prototype ? "symbol" : typeof e },
+                s = "Expected a function",
+                f = NaN,
+                d = "[object Symbol]",
+                l = /^\s+|\s+$/g,
+                p = /^[-+]0x[0-9a-f]+$/i,
+                m = /^0b[01]+$/i,
+                b = /^0o[0-7]+$/i,
+                v = parseInt,
+                y = "object" == ("undefined" == typeof t ? "undefined" : c(t)) && t && t.Object === Object && t,
+                g = "object" == ("undefined" == typeof self ? "undefined" : c(self)) && self && self.Object === Object && self,
+                h = y || g || Function("return this")(),
+                w = Object.prototype,
+                k = w.toString,
+                x = Math.max,
+                j = Math.min,
+                O = function() { return h.Date.now() };
+            e.exports = o
+        }).call(t, function() { return this }())
+    }, function(e, t) {
+        (function(t) {
+            "use strict";
+
+            function n(e, t, n) {
+                function i(t) {
+                    var n = b,
+                        o = v;
+                    return b = v = void 0, O = t, g = e.apply(o, n)
+                }
+
+                function r(e) { return O = e, h = setTimeout(f, t), M ? i(e) : g }
+
+                function u(e) {
+                    var n = e - w,
+                        o = e - O,
+                        i = t - n;
+                    return S ? x(i, y - o) : i
+                }
+
+                function s(e) {
+                    var n = e - w,
+                        o = e - O;
+                    return void 0 === w || n >= t || n < 0 || S && o >= y
+                }
+
+                function f() { var e = j(); return s(e) ? d(e) : void(h = setTimeout(f, u(e))) }
+
+                function d(e) { return h = void 0, _ && b ? i(e) : (b = v = void 0, g) }
+
+                function l() { void 0 !== h && clearTimeout(h), O = 0, b = w = v = h = void 0 }
+
+                function p() { return void 0 === h ? g : d(j()) }
+
+                function m() {
+                    var e = j(),
+                        n = s(e);
+                    if (b = arguments, v = this, w = e, n) { if (void 0 === h) return r(w); if (S) return h = setTimeout(f, t), i(w) }
+                    return void 0 === h && (h = setTimeout(f, t)), g
+                }
+                var b, v, y, g, h, w, O = 0,
+                    M = !1,
+                    S = !1,
+                    _ = !0;
+                if ("function" != typeof e) throw new TypeError(c);
+                return t = a(t) || 0, o(n) && (M = !!n.leading, S = "maxWait" in n, y = S ? k(a(n.maxWait) || 0, t) : y, _ = "trailing" in n ? !!n.trailing : _), m.cancel = l, m.flush = p, m
+            }
+
+            function o(e) { var t = "undefined" == typeof e ? "undefined" : u(e); return !!e && ("object" == t || "function" == t) }
+
+            function i(e) { return !!e && "object" == ("undefined" == typeof e ? "undefined" : u(e)) }
+
+            function r(e) { return "symbol" == ("undefined" == typeof e ? "undefined" : u(e)) || i(e) && w.call(e) == f }
+
+            function a(e) {
+                if ("number" == typeof e) return e;
+                if (r(e)) return s;
+                if (o(e)) {
+                    var t = "function" == typeof e.valueOf ? e.valueOf() : e;
+                    e = o(t) ? t + "" : t
+                }
+                if ("string" != typeof e) return 0 === e ? e : +e;
+                e = e.replace(d, "");
+                var n = p.test(e);
+                return n || m.test(e) ? b(e.slice(2), n ? 2 : 8) : l.test(e) ? s : +e
+            }
+            var u = "function" == typeof Symbol && "symbol" == typeof Symbol.iterator ? function(e) { return typeof e } : function(e) { return e && "function" == typeof Symbol && e.constructor === Symbol && e !== Symbol.prototype ? "symbol" : typeof e },
+                c = "Expected a function",
+                s = NaN,
+                f = "[object Symbol]",
+                d = /^\s+|\s+$/g,
+                l = /^[-+]0x[0-9a-f]+$/i,
+                p = /^0b[01]+$/i,
+                m = /^0o[0-7]+$/i,
+                b = parseInt,
+                v = "object" == ("undefined" == typeof t ? "undefined" : u(t)) && t && t.Object === Object && t,
+                y = "object" == ("undefined" == typeof self ? "undefined" : u(self)) && self && self.Object === Object && self,
+                g = v || y || Function("return this")(),
+                h = Object.prototype,
+                w = h.toString,
+                k = Math.max,
+                x = Math.min,
+                j = function() { return g.Date.now() };
+            e.exports = n
+        }).call(t, function() { return this }())
+    }, function(e, t) {
+        "use strict";
+
+        function n(e) {
+            var t = void 0,
+                o = void 0,
+                i = void 0;
+            for (t = 0; t < e.length; t += 1) { if (o = e[t], o.dataset && o.dataset.aos) return !0; if (i = o.children && n(o.children)) return !0 }
+            return !1
+        }
+
+        function o() { return window.MutationObserver || window.WebKitMutationObserver || window.MozMutationObserver }
+
+        function i() { return !!o() }
+
+        function r(e, t) {
+            var n = window.document,
+                i = o(),
+                r = new i(a);
+            u = t, r.observe(n.documentElement, { childList: !0, subtree: !0, removedNodes: !0 })
+        }
+
+        function a(e) {
+            e && e.forEach(function(e) {
+                var t = Array.prototype.slice.call(e.addedNodes),
+                    o = Array.prototype.slice.call(e.removedNodes),
+                    i = t.concat(o);
+                if (n(i)) return u()
+            })
+        }
+        Object.defineProperty(t, "__esModule", { value: !0 });
+        var u = function() {};
+        t.default = { isSupported: i, ready: r }
+    }, function(e, t) {
+        "use strict";
+
+        function n(e, t) { if (!(e instanceof t)) throw new TypeError("Cannot call a class as a function") }
+
+        function o() { return navigator.userAgent || navigator.vendor || window.opera || "" }
+        Object.defineProperty(t, "__esModule", { value: !0 });
+        var i = function() {
+                function e(e, t) {
+                    for (var n = 0; n < t.length; n++) {
+                        var o = t[n];
+                        o.enumerable = o.enumerable || !1, o.configurable = !0, "value" in o && (o.writable = !0), Object.defineProperty(e, o.key, o)
+                    }
+                }
+                return function(t, n, o) { return n && e(t.prototype, n), o && e(t, o), t }
+            }(),
+            r = /(android|bb\d+|meego).+mobile|avantgo|bada\/|blackberry|blazer|compal|elaine|fennec|hiptop|iemobile|ip(hone|od)|iris|kindle|lge |maemo|midp|mmp|mobile.+firefox|netfront|opera m(ob|in)i|palm( os)?|phone|p(ixi|re)\/|plucker|pocket|psp|series(4|6)0|symbian|treo|up\.(browser|link)|vodafone|wap|windows ce|xda|xiino/i,
+            a = /1207|6310|6590|3gso|4thp|50[1-6]i|770s|802s|a wa|abac|ac(er|oo|s\-)|ai(ko|rn)|al(av|ca|co)|amoi|an(ex|ny|yw)|aptu|ar(ch|go)|as(te|us)|attw|au(di|\-m|r |s )|avan|be(ck|ll|nq)|bi(lb|rd)|bl(ac|az)|br(e|v)w|bumb|bw\-(n|u)|c55\/|capi|ccwa|cdm\-|cell|chtm|cldc|cmd\-|co(mp|nd)|craw|da(it|ll|ng)|dbte|dc\-s|devi|dica|dmob|do(c|p)o|ds(12|\-d)|el(49|ai)|em(l2|ul)|er(ic|k0)|esl8|ez([4-7]0|os|wa|ze)|fetc|fly(\-|_)|g1 u|g560|gene|gf\-5|g\-mo|go(\.w|od)|gr(ad|un)|haie|hcit|hd\-(m|p|t)|hei\-|hi(pt|ta)|hp( i|ip)|hs\-c|ht(c(\-| |_|a|g|p|s|t)|tp)|hu(aw|tc)|i\-(20|go|ma)|i230|iac( |\-|\/)|ibro|idea|ig01|ikom|im1k|inno|ipaq|iris|ja(t|v)a|jbro|jemu|jigs|kddi|keji|kgt( |\/)|klon|kpt |kwc\-|kyo(c|k)|le(no|xi)|lg( g|\/(k|l|u)|50|54|\-[a-w])|libw|lynx|m1\-w|m3ga|m50\/|ma(te|ui|xo)|mc(01|21|ca)|m\-cr|me(rc|ri)|mi(o8|oa|ts)|mmef|mo(01|02|bi|de|do|t(\-| |o|v)|zz)|mt(50|p1|v )|mwbp|mywa|n10[0-2]|n20[2-3]|n30(0|2)|n50(0|2|5)|n7(0(0|1)|10)|ne((c|m)\-|on|tf|wf|wg|wt)|nok(6|i)|nzph|o2im|op(ti|wv)|oran|owg1|p800|pan(a|d|t)|pdxg|pg(13|\-([1-8]|c))|phil|pire|pl(ay|uc)|pn\-2|po(ck|rt|se)|prox|psio|pt\-g|qa\-a|qc(07|12|21|32|60|\-[2-7]|i\-)|qtek|r380|r600|raks|rim9|ro(ve|zo)|s55\/|sa(ge|ma|mm|ms|ny|va)|sc(01|h\-|oo|p\-)|sdk\/|se(c(\-|0|1)|47|mc|nd|ri)|sgh\-|shar|sie(\-|m)|sk\-0|sl(45|id)|sm(al|ar|b3|it|t5)|so(ft|ny)|sp(01|h\-|v\-|v )|sy(01|mb)|t2(18|50)|t6(00|10|18)|ta(gt|lk)|tcl\-|tdg\-|tel(i|m)|tim\-|t\-mo|to(pl|sh)|ts(70|m\-|m3|m5)|tx\-9|up(\.b|g1|si)|utst|v400|v750|veri|vi(rg|te)|vk(40|5[0-3]|\-v)|vm40|voda|vulc|vx(52|53|60|61|70|80|81|83|85|98)|w3c(\-| )|webc|whit|wi(g |nc|nw)|wmlb|wonu|x700|yas\-|your|zeto|zte\-/i,
+            u = /(android|bb\d+|meego).+mobile|avantgo|bada\/|blackberry|blazer|compal|elaine|fennec|hiptop|iemobile|ip(hone|od)|iris|kindle|lge |maemo|midp|mmp|mobile.+firefox|netfront|opera m(ob|in)i|palm( os)?|phone|p(ixi|re)\/|plucker|pocket|psp|series(4|6)0|symbian|treo|up\.(browser|link)|vodafone|wap|windows ce|xda|xiino|android|ipad|playbook|silk/i,
+            c = /1207|6310|6590|3gso|4thp|50[1-6]i|770s|802s|a wa|abac|ac(er|oo|s\-)|ai(ko|rn)|al(av|ca|co)|amoi|an(ex|ny|yw)|aptu|ar(ch|go)|as(te|us)|attw|au(di|\-m|r |s )|avan|be(ck|ll|nq)|bi(lb|rd)|bl(ac|az)|br(e|v)w|bumb|bw\-(n|u)|c55\/|capi|ccwa|cdm\-|cell|chtm|cldc|cmd\-|co(mp|nd)|craw|da(it|ll|ng)|dbte|dc\-s|devi|dica|dmob|do(c|p)o|ds(12|\-d)|el(49|ai)|em(l2|ul)|er(ic|k0)|esl8|ez([4-7]0|os|wa|ze)|fetc|fly(\-|_)|g1 u|g560|gene|gf\-5|g\-mo|go(\.w|od)|gr(ad|un)|haie|hcit|hd\-(m|p|t)|hei\-|hi(pt|ta)|hp( i|ip)|hs\-c|ht(c(\-| |_|a|g|p|s|t)|tp)|hu(aw|tc)|i\-(20|go|ma)|i230|iac( |\-|\/)|ibro|idea|ig01|ikom|im1k|inno|ipaq|iris|ja(t|v)a|jbro|jemu|jigs|kddi|keji|kgt( |\/)|klon|kpt |kwc\-|kyo(c|k)|le(no|xi)|lg( g|\/(k|l|u)|50|54|\-[a-w])|libw|lynx|m1\-w|m3ga|m50\/|ma(te|ui|xo)|mc(01|21|ca)|m\-cr|me(rc|ri)|mi(o8|oa|ts)|mmef|mo(01|02|bi|de|do|t(\-| |o|v)|zz)|mt(50|p1|v )|mwbp|mywa|n10[0-2]|n20[2-3]|n30(0|2)|n50(0|2|5)|n7(0(0|1)|10)|ne((c|m)\-|on|tf|wf|wg|wt)|nok(6|i)|nzph|o2im|op(ti|wv)|oran|owg1|p800|pan(a|d|t)|pdxg|pg(13|\-([1-8]|c))|phil|pire|pl(ay|uc)|pn\-2|po(ck|rt|se)|prox|psio|pt\-g|qa\-a|qc(07|12|21|32|60|\-[2-7]|i\-)|qtek|r380|r600|raks|rim9|ro(ve|zo)|s55\/|sa(ge|ma|mm|ms|ny|va)|sc(01|h\-|oo|p\-)|sdk\/|se(c(\-|0|1)|47|mc|nd|ri)|sgh\-|shar|sie(\-|m)|sk\-0|sl(45|id)|sm(al|ar|b3|it|t5)|so(ft|ny)|sp(01|h\-|v\-|v )|sy(01|mb)|t2(18|50)|t6(00|10|18)|ta(gt|lk)|tcl\-|tdg\-|tel(i|m)|tim\-|t\-mo|to(pl|sh)|ts(70|m\-|m3|m5)|tx\-9|up(\.b|g1|si)|utst|v400|v750|veri|vi(rg|te)|vk(40|5[0-3]|\-v)|vm40|voda|vulc|vx(52|53|60|61|70|80|81|83|85|98)|w3c(\-| )|webc|whit|wi(g |nc|nw)|wmlb|wonu|x700|yas\-|your|zeto|zte\-/i,
+            s = function() {
+                function e() { n(this, e) }
+                return i(e, [{ key: "phone", value: function() { var e = o(); return !(!r.test(e) && !a.test(e.substr(0, 4))) } }, { key: "mobile", value: function() { var e = o(); return !(!u.test(e) && !c.test(e.substr(0, 4))) } }, { key: "tablet", value: function() { return this.mobile() && !this.phone() } }]), e
+            }();
+        t.default = new s
+    }, function(e, t) {
+        "use strict";
+        Object.defineProperty(t, "__esModule", { value: !0 });
+        var n = function(e, t, n) {
+                var o = e.node.getAttribute("data-aos-once");
+                t > e.position ? e.node.classList.add("aos-animate") : "undefined" != typeof o && ("false" === o || !n && "true" !== o) && e.node.classList.remove("aos-animate")
+            },
+            o = function(e, t) {
+                var o = window.pageYOffset,
+                    i = window.innerHeight;
+                e.forEach(function(e, r) { n(e, i + o, t) })
+            };
+        t.default = o
+    }, function(e, t, n) {
+        "use strict";
+
+        function o(e) { return e && e.__esModule ? e : { default: e } }
+        Object.defineProperty(t, "__esModule", { value: !0 });
+        var i = n(12),
+            r = o(i),
+            a = function(e, t) { return e.forEach(function(e, n) { e.node.classList.add("aos-init"), e.position = (0, r.default)(e.node, t.offset) }), e };
+        t.default = a
+    }, function(e, t, n) {
+        "use strict";
+
+        function o(e) { return e && e.__esModule ? e : { default: e } }
+        Object.defineProperty(t, "__esModule", { value: !0 });
+        var i = n(13),
+            r = o(i),
+            a = function(e, t) {
+                var n = 0,
+                    o = 0,
+                    i = window.innerHeight,
+                    a = { offset: e.getAttribute("data-aos-offset"), anchor: e.getAttribute("data-aos-anchor"), anchorPlacement: e.getAttribute("data-aos-anchor-placement") };
+                switch (a.offset && !isNaN(a.offset) && (o = parseInt(a.offset)), a.anchor && document.querySelectorAll(a.anchor) && (e = document.querySelectorAll(a.anchor)[0]), n = (0, r.default)(e).top, a.anchorPlacement) {
+                    case "top-bottom":
+                        break;
+                    case "center-bottom":
+                        n += e.offsetHeight / 2;
+                        break;
+                    case "bottom-bottom":
+                        n += e.offsetHeight;
+                        break;
+                    case "top-center":
+                        n += i / 2;
+                        break;
+                    case "bottom-center":
+                        n += i / 2 + e.offsetHeight;
+                        break;
+                    case "center-center":
+                        n += i / 2 + e.offsetHeight / 2;
+                        break;
+                    case "top-top":
+                        n += i;
+                        break;
+                    case "bottom-top":
+                        n += e.offsetHeight + i;
+                        break;
+                    case "center-top":
+                        n += e.offsetHeight / 2 + i
+                }
+                return a.anchorPlacement || a.offset || isNaN(t) || (o = t), n + o
+            };
+        t.default = a
+    }, function(e, t) {
+        "use strict";
+        Object.defineProperty(t, "__esModule", { value: !0 });
+        var n = function(e) { for (var t = 0, n = 0; e && !isNaN(e.offsetLeft) && !isNaN(e.offsetTop);) t += e.offsetLeft - ("BODY" != e.tagName ? e.scrollLeft : 0), n += e.offsetTop - ("BODY" != e.tagName ? e.scrollTop : 0), e = e.offsetParent; return { top: n, left: t } };
+        t.default = n
+    }, function(e, t) {
+        "use strict";
+        Object.defineProperty(t, "__esModule", { value: !0 });
+        var n = function(e) { return e = e || document.querySelectorAll("[data-aos]"), Array.prototype.map.call(e, function(e) { return { node: e } }) };
+        t.default = n
+    }])
+});
\ No newline at end of file
@@ -0,0 +1,996 @@
+(function($) {
+	
+	"use strict";
+	
+	
+	//Hide Loading Box (Preloader)
+	function handlePreloader() {
+		if($('.preloader').length){
+			$('.preloader').delay(200).fadeOut(500);
+		}
+	}
+	
+	
+	//Update Header Style and Scroll to Top
+	function headerStyle() {
+		if($('.main-header').length){
+			var windowpos = $(window).scrollTop();
+			var siteHeader = $('.main-header');
+			var scrollLink = $('.scroll-to-top');
+			
+			var HeaderHight = $('.main-header').height();
+			if (windowpos >= HeaderHight) {
+				siteHeader.addClass('fixed-header');
+				scrollLink.fadeIn(300);
+			} else {
+				siteHeader.removeClass('fixed-header');
+				scrollLink.fadeOut(300);
+			}
+			
+		}
+	}
+	
+	headerStyle();
+	
+	
+	//Submenu Dropdown Toggle
+	if($('.main-header li.dropdown ul').length){
+		$('.main-header li.dropdown').append('<div class="dropdown-btn"><span class="fa fa-angle-down"></span></div>');
+		
+		//Dropdown Button
+		$('.main-header li.dropdown .dropdown-btn').on('click', function() {
+			$(this).prev('ul').slideToggle(500);
+		});
+		
+		//Disable dropdown parent link
+		$('.navigation li.dropdown > a').on('click', function(e) {
+			e.preventDefault();
+		});
+		
+		//Disable dropdown parent link
+		$('.main-header .navigation li.dropdown > a,.hidden-bar .side-menu li.dropdown > a').on('click', function(e) {
+			e.preventDefault();
+		});
+		
+		$('.main-menu .navigation > li .mega-menu-bar > .column > ul').addClass('first-ul');
+		$('.main-header .main-menu .navigation > li > ul').addClass('last-ul');
+		
+		//$('.hamburger').on('click', function(e) {
+			//$('.about-sidebar').addClass('active');
+		//});
+		
+		//$('.about-sidebar .close-button').on('click', function(e) {
+			//$('.about-sidebar').removeClass('active');
+		//});
+		
+		//$('.about-sidebar .gradient-layer').on('click', function(e) {
+			//$('.about-sidebar').removeClass('active');
+		//});
+		
+		//$('.xs-sidebar-group .close-button').on('click', function(e) {
+			//$('.xs-sidebar-group.info-group').removeClass('isActive');
+		//});
+		
+		//$('.newsletter-close-btn').on('click', function(e) {
+			//$('.quickview-popup-area-section').removeClass('active');
+		//});
+		
+	}
+	
+	// Menu Aimation
+	//document.querySelectorAll('.main-menu .navigation > li > a').forEach(button => button.innerHTML = '<div class="menu-text"><span>' + button.textContent.split('').join('</span><span>') + '</span></div>');
+	
+	
+	//Mobile Nav Hide Show
+	if($('.mobile-menu').length){
+		//$('.mobile-menu .menu-box').mCustomScrollbar();
+		var mobileMenuContent = $('.main-header .nav-outer .main-menu').html();
+		$('.mobile-menu .menu-box .menu-outer').append(mobileMenuContent);
+		$('.sticky-header .main-menu').append(mobileMenuContent);
+		
+
+
+		//Hide / Show Submenu
+		$('.mobile-menu .navigation > li.dropdown > .dropdown-btn').on('click', function(e) {
+			console.log('btn clicked');
+			e.preventDefault();
+			var target = $(this).parent('li').children('ul');
+			var target1 = $(this).parent('li').children('div.mega-menu');
+			// console.log('target', $(target).is(':visible'));
+			console.log('target1', $(target1).is(':visible'));
+			
+			if ($(target).is(':visible')){
+				$(this).parent('li').removeClass('open');
+				$(target).slideUp(500);
+				$(this).parents('.navigation').children('li.dropdown').removeClass('open');
+				$(this).parents('.navigation').children('li.dropdown > ul.last-ul').slideUp(500);
+				return false;
+			} else{
+				$(this).parents('.navigation').children('li.dropdown').removeClass('open');
+				$(this).parents('.navigation').children('li.dropdown').children('ul.last-ul').slideUp(500);
+				$(this).parent('li').toggleClass('open');
+				$(this).parent('li').children('ul.last-ul').slideToggle(500);
+			}
+			if ($(target1).is(':visible')) {
+				console.log('Visible');
+				$(this).parent('li').removeClass('open');
+				$(target1).slideUp(500);
+				$(this).parents('.navigation').children('li.dropdown').removeClass('open');
+				$(this).parents('.navigation').children('li.dropdown > .mega-menu').slideUp(500);
+				// return false;
+			} else {
+				console.log('Not Visible');
+				$(this).parents('.navigation').children('li.dropdown').removeClass('open');
+				$(this).parents('.navigation').children('li.dropdown').children('.mega-menu').slideUp(500);
+				$('.first-ul').css('display', 'block');
+				$(this).parent('li').toggleClass('open');
+				$(this).parent('li').children('.mega-menu').slideToggle(500);
+			}
+		});
+
+		//3rd Level Nav
+		$('.mobile-menu .navigation > li.dropdown > ul  > li.dropdown > .dropdown-btn').on('click', function(e) {
+			e.preventDefault();
+			var targetInner = $(this).parent('li').children('ul');
+			
+			if ($(targetInner).is(':visible')){
+				$(this).parent('li').removeClass('open');
+				$(targetInner).slideUp(500);
+				$(this).parents('.navigation > ul').find('li.dropdown').removeClass('open');
+				$(this).parents('.navigation > ul').find('li.dropdown > ul').slideUp(500);
+				return false;
+			}else{
+				$(this).parents('.navigation > ul').find('li.dropdown').removeClass('open');
+				$(this).parents('.navigation > ul').find('li.dropdown > ul').slideUp(500);
+				$(this).parent('li').toggleClass('open');
+				$(this).parent('li').children('ul').slideToggle(500);
+			}
+		});
+
+		//Menu Toggle Btn
+		$('.mobile-nav-toggler').on('click', function() {
+			$('body').addClass('mobile-menu-visible');
+
+		});
+
+		//Menu Toggle Btn
+		$('.mobile-menu .menu-backdrop,.mobile-menu .close-btn').on('click', function() {
+			$('body').removeClass('mobile-menu-visible');
+			$('.mobile-menu .navigation > li').removeClass('open');
+			$('.mobile-menu .navigation li ul').slideUp(0);
+		});
+
+		$(document).keydown(function(e){
+	        if(e.keyCode == 27) {
+				$('body').removeClass('mobile-menu-visible');
+			$('.mobile-menu .navigation > li').removeClass('open');
+			$('.mobile-menu .navigation li ul').slideUp(0);
+        	}
+	    });
+		
+	}
+
+
+	
+	// Add Current Class Auto
+	function dynamicCurrentMenuClass(selector) {
+		let FileName = window.location.href.split("/").reverse()[0];
+
+		selector.find("li").each(function () {
+			let anchor = $(this).find("a");
+			if ($(anchor).attr("href") == FileName) {
+				$(this).addClass("current");
+			}
+		});
+		// if any li has .current elmnt add class
+		selector.children("li").each(function () {
+			if ($(this).find(".current").length) {
+				$(this).addClass("current");
+			}
+		});
+		// if no file name return
+		if ("" == FileName) {
+			selector.find("li").eq(0).addClass("current");
+		}
+	}
+
+	if ($('.main-header .main-menu .navigation').length) {
+		dynamicCurrentMenuClass($('.main-header .main-menu .navigation'));
+	}
+	
+	
+	 // Only initialize if audio player exists on the page
+            if ($('.audio-player').length) {
+                const audio = document.getElementById('audio');
+                const playPauseBtn = document.getElementById('play-pause-btn');
+                const stopBtn = document.getElementById('stop-btn');
+                const rewindBtn = document.getElementById('rewind-btn');
+                const forwardBtn = document.getElementById('forward-btn');
+                const progressBar = document.getElementById('progress-bar');
+                const progressContainer = document.getElementById('progress-container');
+                const currentTimeDisplay = document.getElementById('current-time');
+                const durationDisplay = document.getElementById('duration');
+                const volumeSlider = document.getElementById('volume-slider');
+                const speedSelect = document.getElementById('speed-select');
+
+                // Play/Pause toggle
+                playPauseBtn.addEventListener('click', () => {
+                    if (audio.paused) {
+                        audio.play();
+                        playPauseBtn.innerHTML = '⏸';
+                        playPauseBtn.title = 'Pause';
+                    } else {
+                        audio.pause();
+                        playPauseBtn.innerHTML = '▶';
+                        playPauseBtn.title = 'Play';
+                    }
+                });
+
+                // Stop button
+                stopBtn.addEventListener('click', () => {
+                    audio.pause();
+                    audio.currentTime = 0;
+                    playPauseBtn.innerHTML = '▶';
+                    playPauseBtn.title = 'Play';
+                });
+
+                // Rewind 10 seconds
+                rewindBtn.addEventListener('click', () => {
+                    audio.currentTime = Math.max(0, audio.currentTime - 10);
+                });
+
+                // Forward 10 seconds
+                forwardBtn.addEventListener('click', () => {
+                    audio.currentTime = Math.min(audio.duration, audio.currentTime + 10);
+                });
+
+                // Update progress bar
+                audio.addEventListener('timeupdate', () => {
+                    const progress = (audio.currentTime / audio.duration) * 100;
+                    progressBar.style.width = `${progress}%`;
+                    
+                    // Update time display
+                    currentTimeDisplay.textContent = formatTime(audio.currentTime);
+                });
+
+                // Set progress on click
+                progressContainer.addEventListener('click', (e) => {
+                    const width = progressContainer.clientWidth;
+                    const clickX = e.offsetX;
+                    const duration = audio.duration;
+                    audio.currentTime = (clickX / width) * duration;
+                });
+
+                // Update duration display when metadata is loaded
+                audio.addEventListener('loadedmetadata', () => {
+                    durationDisplay.textContent = formatTime(audio.duration);
+                });
+
+                // Volume control
+                volumeSlider.addEventListener('input', () => {
+                    audio.volume = volumeSlider.value;
+                });
+
+                // Playback speed control
+                speedSelect.addEventListener('change', () => {
+                    audio.playbackRate = speedSelect.value;
+                });
+
+                // Format time (seconds to MM:SS)
+                function formatTime(seconds) {
+                    const minutes = Math.floor(seconds / 60);
+                    const secs = Math.floor(seconds % 60);
+                    return `${minutes}:${secs < 10 ? '0' : ''}${secs}`;
+                }
+
+                // When audio ends, reset to play button
+                audio.addEventListener('ended', () => {
+                    playPauseBtn.innerHTML = '▶';
+                    playPauseBtn.title = 'Play';
+                });
+            }
+	
+	
+	
+	//Parallax Scene for Icons
+	if($('.parallax-scene-1').length){
+		var scene = $('.parallax-scene-1').get(0);
+		var parallaxInstance = new Parallax(scene);
+	}
+	
+	
+	
+	if($('.paroller').length){
+		$('.paroller').paroller({
+			  factor: 0.2,            // multiplier for scrolling speed and offset, +- values for direction control  
+			  factorLg: 0.4,          // multiplier for scrolling speed and offset if window width is less than 1200px, +- values for direction control  
+			  type: 'foreground',     // background, foreground  
+			  direction: 'horizontal' // vertical, horizontal  
+		});
+	}
+	
+	
+	
+	//  Animation Fade Left End
+
+	/////////////////////////////////////////////////////
+	// CURSOR
+	var cursor = $(".cursor"),
+	follower = $(".cursor-follower");
+
+	var posX = 0,
+		posY = 0;
+
+	var mouseX = 0,
+		mouseY = 0;
+
+	TweenMax.to({}, 0.016, {
+	repeat: -1,
+	onRepeat: function() {
+		posX += (mouseX - posX) / 9;
+		posY += (mouseY - posY) / 9;
+
+		TweenMax.set(follower, {
+			css: {
+			left: posX - 12,
+			top: posY - 12
+			}
+		});
+
+		TweenMax.set(cursor, {
+			css: {
+			left: mouseX,
+			top: mouseY
+			}
+		});
+	}
+	});
+
+	$(document).on("mousemove", function(e) {
+		mouseX = e.clientX;
+		mouseY = e.clientY;
+	});
+	//circle
+	$(".theme-btn, a").on("mouseenter", function() {
+		cursor.addClass("active");
+		follower.addClass("active");
+	});
+	$(".theme-btn, a").on("mouseleave", function() {
+		cursor.removeClass("active");
+		follower.removeClass("active");
+	});   
+	// CURSOR End
+
+
+	
+	// Main Slider
+	var slider = new Swiper('.main-slider', {
+		slidesPerView: 1,
+		spaceBetween: 0,
+		loop: true,
+		autoplay: {
+			enabled: true,
+			delay: 6000
+		},
+		// Navigation arrows
+		navigation: {
+			nextEl: '.main-slider-next',
+			prevEl: '.main-slider-prev',
+			clickable: true,
+		},
+		//Pagination
+		pagination: {
+			el: ".swiper-pagination",
+			clickable: true,
+		},
+		speed: 500,
+		breakpoints: {
+			'1600': {
+				slidesPerView: 1,
+			},
+			'1200': {
+				slidesPerView: 1,
+			},
+			'992': {
+				slidesPerView: 1,
+			},
+			'768': {
+				slidesPerView: 1,
+			},
+			'576': {
+				slidesPerView: 1,
+			},
+			'0': {
+				slidesPerView: 1,
+			},
+		},
+	});
+
+
+
+
+	// Main Slider Two
+	var slider = new Swiper('.main-slider_two', {
+		slidesPerView: 1,
+		spaceBetween: 0,
+		loop: true,
+		autoplay: {
+			enabled: true,
+			delay: 6000
+		},
+		// Navigation arrows
+		navigation: {
+			nextEl: '.slider_two-next_arrow',
+			prevEl: '.slider_two-prev_arrow',
+			clickable: true,
+		},
+		//Pagination
+		pagination: {
+			el: ".slider-two_pagination",
+			clickable: true,
+			renderBullet: function (index, className) {
+			  return '<span class="' + className + '">' + (index + 1) + "</span>";
+			},
+		},
+		speed: 500,
+		breakpoints: {
+			'1600': {
+				slidesPerView: 1,
+			},
+			'1200': {
+				slidesPerView: 1,
+			},
+			'992': {
+				slidesPerView: 1,
+			},
+			'768': {
+				slidesPerView: 1,
+			},
+			'576': {
+				slidesPerView: 1,
+			},
+			'0': {
+				slidesPerView: 1,
+			},
+		},
+	});
+
+
+	
+	
+	// Testimonial Slider
+	var slider = new Swiper('.testimonial-one_carousel', {
+		slidesPerView: 1,
+		spaceBetween: 0,
+		loop: true,
+		autoplay: {
+			enabled: true,
+			delay: 6000
+		},
+		// Navigation arrows
+		navigation: {
+			nextEl: '.testimonial-one_next',
+			prevEl: '.testimonial-one_prev',
+			clickable: true,
+		},
+		//Pagination
+		pagination: {
+			el: ".testimonial-one_pagination",
+			clickable: true,
+		},
+		speed: 500,
+		breakpoints: {
+			'1600': {
+				slidesPerView: 1,
+			},
+			'1200': {
+				slidesPerView: 1,
+			},
+			'992': {
+				slidesPerView: 1,
+			},
+			'768': {
+				slidesPerView: 1,
+			},
+			'576': {
+				slidesPerView: 1,
+			},
+			'0': {
+				slidesPerView: 1,
+			},
+		},
+	});
+
+
+
+
+
+
+	// Testimonial Slider
+	var slider = new Swiper('.testimonial-two_carousel', {
+		slidesPerView: 2,
+		spaceBetween: 30,
+		loop: true,
+		autoplay: {
+			enabled: true,
+			delay: 6000
+		},
+		// Navigation arrows
+		navigation: {
+			nextEl: '.testimonial-two_next',
+			prevEl: '.testimonial-two_prev',
+			clickable: true,
+		},
+		//Pagination
+		pagination: {
+			el: ".testimonial-two_pagination",
+			clickable: true,
+		},
+		speed: 500,
+		breakpoints: {
+			'1600': {
+				slidesPerView: 2,
+			},
+			'1200': {
+				slidesPerView: 2,
+			},
+			'992': {
+				slidesPerView: 2,
+			},
+			'768': {
+				slidesPerView: 1,
+			},
+			'576': {
+				slidesPerView: 1,
+			},
+			'0': {
+				slidesPerView: 1,
+			},
+		},
+	});
+	
+	
+	
+	
+	// Testimonial Slider
+	var slider = new Swiper('.testimonial-three_carousel', {
+		slidesPerView: 3,
+		spaceBetween: 30,
+		loop: true,
+		autoplay: {
+			enabled: true,
+			delay: 6000
+		},
+		// Navigation arrows
+		navigation: {
+			nextEl: '.testimonial-three_next',
+			prevEl: '.testimonial-three_prev',
+			clickable: true,
+		},
+		//Pagination
+		pagination: {
+			el: ".testimonial-three_pagination",
+			clickable: true,
+		},
+		speed: 500,
+		breakpoints: {
+			'1600': {
+				slidesPerView: 3,
+			},
+			'1200': {
+				slidesPerView: 2,
+			},
+			'992': {
+				slidesPerView: 2,
+			},
+			'768': {
+				slidesPerView: 1,
+			},
+			'576': {
+				slidesPerView: 1,
+			},
+			'0': {
+				slidesPerView: 1,
+			},
+		},
+	});
+
+
+
+
+	// Gallery Slider
+	var slider = new Swiper('.gallery-one_carousel', {
+		slidesPerView: 4,
+		spaceBetween: 30,
+		loop: true,
+		autoplay: {
+			enabled: true,
+			delay: 6000
+		},
+		// Navigation arrows
+		navigation: {
+			nextEl: '.gallery-one_next',
+			prevEl: '.gallery-one_prev',
+			clickable: true,
+		},
+		//Pagination
+		pagination: {
+			el: ".gallery-one_pagination",
+			clickable: true,
+		},
+		speed: 500,
+		breakpoints: {
+			'1600': {
+				slidesPerView: 4,
+			},
+			'1200': {
+				slidesPerView: 4,
+			},
+			'992': {
+				slidesPerView: 3,
+			},
+			'768': {
+				slidesPerView: 3,
+			},
+			'576': {
+				slidesPerView: 2,
+			},
+			'0': {
+				slidesPerView: 1,
+			},
+		},
+	});
+
+
+
+
+
+
+	// Gallery Slider
+	var slider = new Swiper('.gallery-two_carousel', {
+		slidesPerView: 4,
+		spaceBetween: 0,
+		loop: true,
+		autoplay: {
+			enabled: true,
+			delay: 6000
+		},
+		// Navigation arrows
+		navigation: {
+			nextEl: '.gallery-two_next',
+			prevEl: '.gallery-two_prev',
+			clickable: true,
+		},
+		//Pagination
+		pagination: {
+			el: ".gallery-two_pagination",
+			clickable: true,
+		},
+		speed: 500,
+		breakpoints: {
+			'1600': {
+				slidesPerView: 4,
+			},
+			'1200': {
+				slidesPerView: 4,
+			},
+			'992': {
+				slidesPerView: 2,
+			},
+			'768': {
+				slidesPerView: 2,
+			},
+			'576': {
+				slidesPerView: 2,
+			},
+			'0': {
+				slidesPerView: 1,
+			},
+		},
+	});
+
+
+
+
+
+	//Accordion Box
+	if($('.accordion-box').length){
+		$(".accordion-box").on('click', '.acc-btn', function() {
+			
+			var outerBox = $(this).parents('.accordion-box');
+			var target = $(this).parents('.accordion');
+			
+			if($(this).hasClass('active')!==true){
+				$(outerBox).find('.accordion .acc-btn').removeClass('active');
+			}
+			
+			if ($(this).next('.acc-content').is(':visible')){
+				return false;
+			}else{
+				$(this).addClass('active');
+				$(outerBox).children('.accordion').removeClass('active-block');
+				$(outerBox).find('.accordion').children('.acc-content').slideUp(300);
+				target.addClass('active-block');
+				$(this).next('.acc-content').slideDown(300);	
+			}
+		});	
+	}
+
+
+
+
+	//Accordion Box
+	if($('.accordion-box_two').length){
+		$(".accordion-box_two").on('click', '.acc-btn', function() {
+			
+			var outerBox = $(this).parents('.accordion-box_two');
+			var target = $(this).parents('.accordion');
+			
+			if($(this).hasClass('active')!==true){
+				$(outerBox).find('.accordion .acc-btn').removeClass('active');
+			}
+			
+			if ($(this).next('.acc-content').is(':visible')){
+				return false;
+			}else{
+				$(this).addClass('active');
+				$(outerBox).children('.accordion').removeClass('active-block');
+				$(outerBox).find('.accordion').children('.acc-content').slideUp(300);
+				target.addClass('active-block');
+				$(this).next('.acc-content').slideDown(300);	
+			}
+		});	
+	}
+
+
+
+	//Progress Bar
+	if($('.progress-line').length){
+		$('.progress-line').appear(function(){
+			var el = $(this);
+			var percent = el.data('width');
+			$(el).css('width',percent+'%');
+		},{accY: 0});
+	}
+
+	//Fact Counter + Text Count
+	if($('.count-box').length){
+		$('.count-box').appear(function(){
+	
+			var $t = $(this),
+				n = $t.find(".count-text").attr("data-stop"),
+				r = parseInt($t.find(".count-text").attr("data-speed"), 10);
+				
+			if (!$t.hasClass("counted")) {
+				$t.addClass("counted");
+				$({
+					countNum: $t.find(".count-text").text()
+				}).animate({
+					countNum: n
+				}, {
+					duration: r,
+					easing: "linear",
+					step: function() {
+						$t.find(".count-text").text(Math.floor(this.countNum));
+					},
+					complete: function() {
+						$t.find(".count-text").text(this.countNum);
+					}
+				});
+			}
+			
+		},{accY: 0});
+	}
+
+
+	//Event Countdown Timer
+	if($('.time-countdown').length){  
+		$('.time-countdown').each(function() {
+		var $this = $(this), finalDate = $(this).data('countdown');
+		$this.countdown(finalDate, function(event) {
+			var $this = $(this).html(event.strftime('' + ' ' + '<div class="counter-column"><span class="count">%H</span></div>  ' + '<div class="counter-column"><span class="count">%M</span></div>  ' + '<div class="counter-column"><span class="count">%S</span></div>'));
+		});
+	 });
+	}
+
+
+
+
+	//Tabs Box
+	if($('.tabs-box').length){
+		$('.tabs-box .tab-buttons .tab-btn').on('click', function(e) {
+			e.preventDefault();
+			var target = $($(this).attr('data-tab'));
+			
+			if ($(target).is(':visible')){
+				return false;
+			}else{
+				target.parents('.tabs-box').find('.tab-buttons').find('.tab-btn').removeClass('active-btn');
+				$(this).addClass('active-btn');
+				target.parents('.tabs-box').find('.tabs-content').find('.tab').fadeOut(0);
+				target.parents('.tabs-box').find('.tabs-content').find('.tab').removeClass('active-tab');
+				$(target).fadeIn(300);
+				$(target).addClass('active-tab');
+			}
+		});
+	}
+
+
+	///////////////////////////////////////////////////// 
+    // Title Animation
+    let splitTitleLines = gsap.utils.toArray(".title-anim");
+
+    splitTitleLines.forEach(splitTextLine => {
+      const tl = gsap.timeline({
+        scrollTrigger: {
+          trigger: splitTextLine,
+          start: 'top 90%',
+          end: 'bottom 60%',
+          scrub: false,
+          markers: false,
+          toggleActions: 'play none none none'
+        }
+      });
+
+      const itemSplitted = new SplitText(splitTextLine, { type: "words, lines" });
+      gsap.set(splitTextLine, { perspective: 400 });
+      itemSplitted.split({ type: "lines" })
+      tl.from(itemSplitted.lines, { duration: 1, delay: 0.3, opacity: 0, rotationX: -80, force3D: true, transformOrigin: "top center -50", stagger: 0.1 });
+    });
+    /////////////////////////////////////////////////////
+
+
+	//var slider = new Swiper('.tel-promotion-video-slider', {
+		//spaceBetween: 30,
+		//slidesPerView: 1,
+		//effect: 'fade',
+		//loop: true,
+		//navigation: {
+			//nextEl: ".promo-button-next",
+			//prevEl: ".promo-button-prev",
+		//},
+	//});
+
+
+	//Header Search
+	if($('.search-box-outer').length) {
+		$('.search-box-outer').on('click', function() {
+			$('body').addClass('search-active');
+		});
+		$('.close-search').on('click', function() {
+			$('body').removeClass('search-active');
+		});
+	}
+
+
+
+	//Progress Bar
+	if($('.progress-line').length){
+		$('.progress-line').appear(function(){
+			var el = $(this);
+			var percent = el.data('width');
+			$(el).css('width',percent+'%');
+		},{accY: 0});
+	}
+
+
+	// LightBox Image
+	if($('.lightbox-image').length) {
+		$('.lightbox-image').magnificPopup({
+		  type: 'image',
+		  gallery:{
+		    enabled:true
+		  }
+		});
+	}
+	
+
+
+	// LightBox Video
+	if($('.lightbox-video').length) {
+		$('.lightbox-video').magnificPopup({
+	      // disableOn: 700,
+	      type: 'iframe',
+	      mainClass: 'mfp-fade',
+	      removalDelay: 160,
+	      preloader: false,
+	      iframe:{
+	        patterns:{
+	          youtube:{
+	          index: 'youtube.com',
+	          id: 'v=',
+	          src: 'https://www.youtube.com/embed/%id%'
+	        },
+	      },
+	      srcAction:'iframe_src',
+	    },
+	      fixedContentPos: false
+	    });
+	}
+
+
+
+	// Odometer
+	if ($(".odometer").length) {
+		$('.odometer').appear();
+		$('.odometer').appear(function(){
+			var odo = $(".odometer");
+			odo.each(function() {
+				var countNumber = $(this).attr("data-count");
+				$(this).html(countNumber);
+			});
+			window.odometerOptions = {
+				format: 'd',
+			};
+		});
+	}
+	
+	
+	
+	//Contact Form Validation
+	if($('#contact-form').length){
+		$('#contact-form').validate({
+			rules: {
+				username: {
+					required: true
+				},
+				email: {
+					required: true,
+					email: true
+				},
+				message: {
+					required: true
+				}
+			}
+		});
+	}
+	
+	
+	
+	// Scroll to a Specific Div
+	if($('.scroll-to-target').length){
+		$(".scroll-to-target").on('click', function() {
+			var target = $(this).attr('data-target');
+		   // animate
+		   $('html, body').animate({
+			   scrollTop: $(target).offset().top
+			 }, 1500);
+	
+		});
+	}
+	
+	
+	
+	// Elements Animation
+	if($('.wow').length){
+		var wow = new WOW(
+		  {
+			boxClass:     'wow',      // animated element css class (default is wow)
+			animateClass: 'animated', // animation css class (default is animated)
+			offset:       0,          // distance to the element when triggering the animation (default is 0)
+			mobile:       true,       // trigger animations on mobile devices (default is true)
+			live:         true       // act on asynchronously loaded content (default is true)
+		  }
+		);
+		wow.init();
+	}
+	
+
+
+/* ==========================================================================
+   When document is Scrollig, do
+   ========================================================================== */
+	
+	$(window).on('scroll', function() {
+		headerStyle();
+	});
+	
+/* ==========================================================================
+   When document is loading, do
+   ========================================================================== */
+	
+	$(window).on('load', function() {
+		handlePreloader();
+	});	
+
+})(window.jQuery);
\ No newline at end of file
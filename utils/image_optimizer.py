@@ -1,29 +1,268 @@
 # utils/image_optimizer.py
-from PIL import Image
+from contextlib import contextmanager
+from PIL import Image, UnidentifiedImageError
+import hashlib
+import io
+import logging
 import os
+import threading
 
 
-def optimize_image(image_path, max_width=1200, max_height=1200, quality=75):
+logger = logging.getLogger(__name__)
+
+# Bump whenever process_image changes its output, so stored images are
+# processed again on their next save.
+PIPELINE_VERSION = 1
+
+
+# Uploads beyond these are refused from the header alone, before any pixel
+# data is decoded. 100 MP covers every phone camera in use.
+MAX_IMAGE_SIDE = int(os.environ.get("IMAGE_MAX_SIDE", 16000))
+MAX_IMAGE_PIXELS = int(os.environ.get("IMAGE_MAX_PIXELS", 100_000_000))
+
+# Images decoded at once per process (web worker or process_image_jobs
+# child). Each one can briefly hold tens of MB, so concurrent uploads queue
+# here instead of adding up.
+IMAGE_WORK_CONCURRENCY = int(os.environ.get("IMAGE_WORK_CONCURRENCY", 2))
+_image_slots = threading.BoundedSemaphore(IMAGE_WORK_CONCURRENCY)
+
+
+RENDITION_WIDTHS = (320, 640, 960, 1200)
+RENDITION_FORMATS = (
+    ("webp", "WEBP", "webp"),
+    ("jpeg", "JPEG", "jpg"),
+)
+
+# Formats optimize_upload writes, with their encoder options and extension.
+UPLOAD_FORMATS = {
+    "JPEG": ({"optimize": True, "progressive": True}, "jpg"),
+    "WEBP": ({"method": 4}, "webp"),
+    "PNG": ({"optimize": True}, "png"),
+}
+
+
+class ImageTooLarge(ValueError):
+    pass
+
+
+@contextmanager
+def open_bounded(image_path, size):
     """
-    Resize + compress images to reduce file size without losing much quality.
+    Open an image (path or file object) that is about to be scaled down to
+    fit within `size`.
+
+    Only the header is read up front: dimensions over MAX_IMAGE_SIDE or
+    MAX_IMAGE_PIXELS raise ImageTooLarge. JPEGs are then set to decode at
+    1/2, 1/4 or 1/8 scale when that still covers `size`, so a 48 MP photo
+    never sits in memory at full resolution. Other formats decode in full.
     """
-    if not os.path.exists(image_path):
-        return
-    original_size = os.path.getsize(image_path) / 1024  # in KB
+    with Image.open(image_path) as img:
+        _check_size(img, image_path)
+        if img.format == "JPEG":
+            img.draft("RGB", size)
+        yield img
+
+
+def _check_size(img, image_path):
+    width, height = img.size
+    if max(width, height) > MAX_IMAGE_SIDE or width * height > MAX_IMAGE_PIXELS:
+        raise ImageTooLarge(
+            f"{os.path.basename(str(getattr(image_path, 'name', image_path)))} is {width}x{height}; "
+            f"the limit is {MAX_IMAGE_SIDE}px a side and {MAX_IMAGE_PIXELS / 1e6:g} MP"
+        )
+
+
+def check_image_size(fp):
+    """
+    Raise ImageTooLarge if the image's header declares dimensions over the
+    limits. Reads the header only; files Pillow can't identify pass.
+    """
+    try:
+        with Image.open(fp) as img:
+            _check_size(img, fp)
+    except UnidentifiedImageError:
+        pass
+    finally:
+        if hasattr(fp, "seek"):
+            fp.seek(0)
+
+
+def _has_alpha(img):
+    return img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info)
+
+
+def optimize_upload(fp, max_size=(1200, 1200), format=None, quality=75):
+    """
+    Resize and re-encode an uploaded image (path or file object) to fit
+    within `max_size`. `format` is "JPEG", "WEBP" or "PNG"; None keeps the
+    upload's own format where it is one of those.
+
+    Returns (bytes, extension), or None when the upload should be stored as
+    it is: Pillow can't read it, it is animated, or it already fits and
+    re-encoding would not make it smaller.
+    """
+    with _image_slots:
+        return _optimize(fp, max_size, format, quality)
+
+
+def _optimize(fp, max_size, format, quality):
+    if hasattr(fp, "seek"):
+        fp.seek(0, os.SEEK_END)
+        original_size = fp.tell()
+        fp.seek(0)
+    else:
+        original_size = os.path.getsize(fp)
+
+    try:
+        with open_bounded(fp, max_size) as img:
+            if getattr(img, "is_animated", False):
+                return None
+            source_format = "JPEG" if img.format == "MPO" else img.format
+            target = format or source_format
+            if target not in UPLOAD_FORMATS:
+                target = "PNG" if _has_alpha(img) else "JPEG"
+            fits = img.width <= max_size[0] and img.height <= max_size[1]
+
+            img = img.convert("RGBA" if target != "JPEG" and _has_alpha(img) else "RGB")
+            img.thumbnail(max_size, Image.LANCZOS)
+            options, extension = UPLOAD_FORMATS[target]
+            out = io.BytesIO()
+            img.save(out, target, quality=quality, **options)
+    except UnidentifiedImageError:
+        return None
+    finally:
+        if hasattr(fp, "seek"):
+            fp.seek(0)
+
+    if fits and target == source_format and out.tell() >= original_size:
+        return None
+    return out.getvalue(), extension
+
+
+def reoptimize_file(image_path, max_size=(1200, 1200), quality=75, min_saving=0.05, dry_run=False):
+    """
+    Run optimize_upload again over a stored image, keeping its name and
+    format so URLs and database rows stay valid. The new file replaces the
+    old one atomically, so a live server never serves half a file.
+
+    An image that already fits `max_size` is only rewritten when it shrinks
+    by at least `min_saving`; every re-encode costs a little quality.
+    Returns (bytes_before, bytes_after); equal when nothing changed.
+    """
+    before = os.path.getsize(image_path)
+    extension = os.path.splitext(image_path)[1].lower()
+    image_format = Image.registered_extensions().get(extension)
+    if image_format not in UPLOAD_FORMATS:
+        return before, before
 
     with Image.open(image_path) as img:
-        img = img.convert("RGB")  # ensure JPEG compatibility
+        fits = img.width <= max_size[0] and img.height <= max_size[1]
+    result = optimize_upload(image_path, max_size=max_size, format=image_format, quality=quality)
+    if result is None or (fits and len(result[0]) > before * (1 - min_saving)):
+        return before, before
+    data = result[0]
+    if not dry_run:
+        temp_path = f"{image_path}.reoptimize-{os.getpid()}"
+        with open(temp_path, "wb") as fh:
+            fh.write(data)
+        os.replace(temp_path, image_path)
+    return before, len(data)
 
-        # Resize only if image is larger than limits
-        img.thumbnail((max_width, max_height), Image.LANCZOS)
 
-        # Save optimized (overwrite original)
-        img.save(image_path, optimize=True, quality=quality)
+def generate_renditions(image_path, widths=RENDITION_WIDTHS, quality=75, stem=None):
+    """
+    Write a WebP and a JPEG copy of the image at each width into a
+    "renditions" folder next to it, named after `stem` (default: the image's
+    own). Widths larger than the image are skipped.
 
-    new_size = os.path.getsize(image_path) / 1024  # in KB
-    print(
-        f"[OPTIMIZER] {os.path.basename(image_path)} optimized: {original_size:.1f} KB → {new_size:.1f} KB"
-    )
+    Names carry the source's digest and PIPELINE_VERSION
+    ("x-1a2b3c4d5e6f-v1-640w.webp"), so a rendition URL never changes
+    content and can be cached as immutable.
+    Returns a list of {"width", "format", "path"} dicts.
+    """
+    if not os.path.exists(image_path):
+        return []
+
+    directory, filename = os.path.split(image_path)
+    stem = stem or os.path.splitext(filename)[0]
+    tag = f"{file_digest(image_path)[:12]}-v{PIPELINE_VERSION}"
+    rendition_dir = os.path.join(directory, "renditions")
+    os.makedirs(rendition_dir, exist_ok=True)
+
+    renditions = []
+    with open_bounded(image_path, (max(widths), max(widths))) as img:
+        img = img.convert("RGB")
+        targets = [w for w in sorted(widths) if w <= img.width] or [img.width]
+
+        for width in targets:
+            height = max(1, round(img.height * width / img.width))
+            resized = img if width == img.width else img.resize((width, height), Image.LANCZOS)
+
+            for fmt, pil_format, ext in RENDITION_FORMATS:
+                path = os.path.join(rendition_dir, f"{stem}-{tag}-{width}w.{ext}")
+                if pil_format == "JPEG":
+                    resized.save(path, pil_format, quality=quality, optimize=True, progressive=True)
+                else:
+                    resized.save(path, pil_format, quality=quality, method=4)
+                renditions.append({"width": width, "format": fmt, "path": path})
+
+    logger.info("%s: %d renditions at %spx", stem, len(renditions), ", ".join(str(w) for w in targets))
+    return renditions
+
+
+def file_digest(path, chunk_size=1024 * 1024):
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def init_worker(nice=0):
+    """
+    Pool initializer. Spawned children never load Django's LOGGING, so send
+    their log records to stderr like the parent's; with `nice`, run image
+    work behind the web workers on a busy host.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    if nice:
+        os.nice(nice)
+
+
+def process_image(image_path, policy=None, renditions=True):
+    """
+    Full pipeline for one stored upload. Safe to run in a worker process
+    (no Django access).
+
+    With a `policy` ({"max_size", "format", "quality"}) the original is
+    resized and re-encoded into a new file next to it; the stored file is
+    left alone, since the caller decides where the result goes. Renditions
+    are then built from whichever file is final.
+
+    Returns {"optimized": path of the new file or None, "renditions": [...]}.
+    """
+    optimized = None
+    with _image_slots:
+        if policy is not None:
+            result = _optimize(
+                image_path, tuple(policy["max_size"]), policy.get("format"), policy.get("quality", 75)
+            )
+            if result is not None:
+                data, extension = result
+                optimized = f"{os.path.splitext(image_path)[0]}.optimized-{os.getpid()}.{extension}"
+                with open(optimized, "wb") as fh:
+                    fh.write(data)
+                logger.info(
+                    "%s optimized: %.1f KB → %.1f KB",
+                    os.path.basename(image_path), os.path.getsize(image_path) / 1024, len(data) / 1024,
+                )
+        return {
+            "optimized": optimized,
+            "renditions": generate_renditions(
+                optimized or image_path, stem=os.path.splitext(os.path.basename(image_path))[0]
+            ) if renditions else [],
+        }
 
 
 def optimize_flag(image_path, size=(40, 40), quality=85):
@@ -35,12 +274,13 @@ def optimize_flag(image_path, size=(40, 40), quality=85):
 
     original_size = os.path.getsize(image_path) / 1024
 
-    with Image.open(image_path) as img:
+    with _image_slots, open_bounded(image_path, size) as img:
         img = img.convert("RGB")
         img = img.resize(size, Image.LANCZOS)
         img.save(image_path, optimize=True, quality=quality)
 
     new_size = os.path.getsize(image_path) / 1024
-    print(
-        f"[OPTIMIZER] Flag {os.path.basename(image_path)} resized to {size} and optimized: {original_size:.1f} KB → {new_size:.1f} KB"
+    logger.info(
+        "Flag %s resized to %s and optimized: %.1f KB → %.1f KB",
+        os.path.basename(image_path), size, original_size, new_size,
     )